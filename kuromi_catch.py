@@ -2,19 +2,53 @@
 """
 Kuromi Catch - Um jogo kawaii de coletar itens!
 """
+import argparse
 import os
 import sys
 
 # Adiciona o diretório atual ao PYTHONPATH
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.constants import FPS, TICK_RATE
 from src.game import Game
+from src.replay import Replay
+from src.rng import seed_arg
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kuromi Catch")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE,
+                        help="ticks de simulação por segundo (padrão: %(default)s)")
+    parser.add_argument("--fps", type=int, default=FPS,
+                        help="limite de quadros renderizados, 0 = sem limite (padrão: %(default)s)")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="semente fixa: toda partida repete a mesma sequência de spawns")
+    parser.add_argument("--replay", default=None, help="reproduz um arquivo de replay (.kcr)")
+    parser.add_argument("--replay-speed", type=int, default=1, choices=[1, 2, 4],
+                        help="velocidade da reprodução do replay (padrão: %(default)sx)")
+    parser.add_argument("--profile", action='store_true',
+                        help="começa com o overlay do profiler ligado (F3 alterna)")
+    parser.add_argument("--profile-out", default=None,
+                        help="ao sair, exporta o trace do profiler (.csv ou .json)")
+    return parser.parse_args()
 
 def main():
     """
     Função principal que inicia o jogo
     """
-    game = Game()
+    args = parse_args()
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = Game(tick_rate=replay.tick_rate, render_fps=args.fps)
+        game.freeze_gc = True
+        game.play_replay(replay, args.replay_speed)
+    else:
+        game = Game(tick_rate=args.tick_rate, render_fps=args.fps, seed=args.seed)
+        game.freeze_gc = True
+    if args.profile or args.profile_out:
+        game.profiler.enable()
+    if args.profile_out:
+        game.profile_path = args.profile_out
+        game.profiler.start_trace()
     game.run()
 
 if __name__ == "__main__":
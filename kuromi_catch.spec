@@ -1,11 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+# Empacota assets/ em um único .kcpak: o executável extrai um arquivo só e o
+# jogo lê tudo por mmap (sem o .kcpak, o jogo usa os arquivos soltos)
+sys.path.insert(0, SPECPATH)
+from src.archive import build_archive
+ASSET_ARCHIVE = os.path.join(SPECPATH, 'build', 'assets.kcpak')
+build_archive(os.path.join(SPECPATH, 'assets'), ASSET_ARCHIVE)
 
 
 a = Analysis(
     ['kuromi_catch.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets'), ('save_data', 'save_data'), ('src', 'src')],
+    datas=[(ASSET_ARCHIVE, '.'), ('save_data', 'save_data'), ('src', 'src')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
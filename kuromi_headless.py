@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Kuromi Catch - simulação headless para rodar partidas em lote
+"""
+import os
+import sys
+
+# Drivers dummy do SDL: sem janela, sem GPU e sem áudio
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+# Adiciona o diretório atual ao PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.headless import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Kuromi Catch - empacota assets/ em um único .kcpak (usado pelo build)
+"""
+import os
+import sys
+
+# Adiciona o diretório atual ao PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.archive import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Arquivo único de assets (.kcpak): índice + blobs alinhados, lido via mmap
+"""
+import argparse
+import io
+import mmap
+import os
+import struct
+from .constants import ASSETS_DIR, ASSET_ARCHIVE, ARCHIVE_ALIGN
+
+ARCHIVE_MAGIC = b'KCPK'
+ARCHIVE_VERSION = 1
+# magic, versão, alinhamento dos blobs, número de entradas
+HEADER = struct.Struct('<4sHHI')
+# tamanho do nome, offset e tamanho do blob (o nome vem logo depois)
+ENTRY = struct.Struct('<HQQ')
+
+class LooseAssets:
+    """Assets como arquivos soltos em assets/ (desenvolvimento)"""
+    def __init__(self, directory=ASSETS_DIR):
+        self.directory = directory
+
+    def path(self, name):
+        return os.path.join(self.directory, *name.split('/'))
+
+    def exists(self, name):
+        return os.path.isfile(self.path(name))
+
+    def read(self, name):
+        with open(self.path(name), 'rb') as f:
+            return f.read()
+
+    def source(self, name):
+        """O que o pygame aceita para carregar o asset (aqui, o caminho)"""
+        return self.path(name)
+
+    def listdir(self, folder):
+        directory = self.path(folder)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f)))
+
+class AssetArchive:
+    """Um .kcpak mapeado em memória.
+
+    O índice é lido uma vez na abertura; read() devolve uma fatia
+    (memoryview) do mapeamento, sem abrir nem copiar arquivos. Os nomes
+    usam '/' e são relativos a assets/ (ex.: 'backgrounds/background.png').
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mapped)
+        magic, version, self.align, count = HEADER.unpack_from(self.mapped, 0)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Não é um arquivo de assets do Kuromi Catch")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f"Arquivo de assets da versão {version}, esperado {ARCHIVE_VERSION}")
+        self.entries = {}  # nome -> (offset, tamanho)
+        position = HEADER.size
+        for _ in range(count):
+            length, offset, size = ENTRY.unpack_from(self.mapped, position)
+            position += ENTRY.size
+            name = bytes(self.view[position:position + length]).decode('utf-8')
+            position += length
+            if offset + size > len(self.mapped):
+                raise ValueError(f"Arquivo de assets truncado: {name}")
+            self.entries[name] = (offset, size)
+
+    def exists(self, name):
+        return name in self.entries
+
+    def read(self, name):
+        offset, size = self.entries[name]
+        return self.view[offset:offset + size]
+
+    def source(self, name):
+        # pygame lê de objetos tipo arquivo; o nome ajuda a achar o formato
+        return io.BytesIO(self.read(name))
+
+    def listdir(self, folder):
+        prefix = folder.rstrip('/') + '/'
+        return sorted(name[len(prefix):] for name in self.entries
+                      if name.startswith(prefix) and '/' not in name[len(prefix):])
+
+def open_assets(archive_path=ASSET_ARCHIVE, directory=ASSETS_DIR):
+    """O .kcpak quando existe (build empacotado); senão, os arquivos soltos"""
+    if os.path.isfile(archive_path):
+        try:
+            return AssetArchive(archive_path)
+        except:
+            print(f"Não foi possível abrir o arquivo de assets: {archive_path}")
+    return LooseAssets(directory)
+
+def build_archive(directory=ASSETS_DIR, output=ASSET_ARCHIVE, align=ARCHIVE_ALIGN):
+    """Empacota todos os arquivos de `directory` em `output`; retorna o nº de entradas"""
+    names = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            names.append(os.path.relpath(path, directory).replace(os.sep, '/'))
+
+    encoded = [name.encode('utf-8') for name in names]
+    index_size = HEADER.size + sum(ENTRY.size + len(name) for name in encoded)
+    sizes = [os.path.getsize(os.path.join(directory, *name.split('/'))) for name in names]
+    offsets = []
+    position = index_size
+    for size in sizes:
+        position += -position % align
+        offsets.append(position)
+        position += size
+
+    out = bytearray(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, align, len(names)))
+    for name, offset, size in zip(encoded, offsets, sizes):
+        out += ENTRY.pack(len(name), offset, size)
+        out += name
+    for name, offset in zip(names, offsets):
+        out += bytes(offset - len(out))
+        with open(os.path.join(directory, *name.split('/')), 'rb') as f:
+            out += f.read()
+
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(out)
+    os.replace(tmp_path, output)
+    return len(names)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kuromi Catch - empacota os assets em um .kcpak")
+    parser.add_argument("--assets", default=ASSETS_DIR, help="pasta de assets (padrão: %(default)s)")
+    parser.add_argument("--output", default=ASSET_ARCHIVE, help="arquivo gerado (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+    count = build_archive(args.assets, args.output)
+    print(f"{count} assets empacotados em {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
@@ -0,0 +1,95 @@
+"""
+Cache em disco das imagens já redimensionadas (pixels crus)
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import pygame
+from .constants import ASSET_CACHE_DIR, ASSET_CACHE_VERSION
+from .persistence import write_atomic
+
+# Cabeçalho: magic, versão, canais (3 = RGB, 4 = RGBA), largura, altura
+HEADER = struct.Struct('<4sBBHH')
+MAGIC = b'KCPX'
+EXTENSION = '.px'
+
+class AssetCache:
+    """Pixels das imagens já decodificadas e redimensionadas, um arquivo por imagem.
+
+    O nome do arquivo é o hash do conteúdo do PNG de origem junto com o
+    tamanho final e a versão do formato: trocar a imagem, o tamanho pedido
+    ou o formato gera outra chave, sem precisar invalidar nada à mão. A
+    leitura mapeia o arquivo (mmap) e cria a superfície direto sobre o
+    buffer; a conversão para o formato da tela (que copia) fica com quem
+    chamou. Os métodos podem ser chamados das threads do carregador.
+    """
+    def __init__(self, directory=ASSET_CACHE_DIR):
+        self.directory = directory
+        self.used = set()  # Chaves usadas nesta sessão (o resto é podado)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writable = True  # Desliga a gravação depois da primeira falha
+
+    def key(self, data, size):
+        digest = hashlib.blake2b(data, digest_size=16)
+        digest.update(f"{size[0]}x{size[1]}:v{ASSET_CACHE_VERSION}".encode())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def retain(self, key):
+        """Marca a chave como em uso (não é podada)"""
+        with self.lock:
+            self.used.add(key)
+
+    def load(self, key):
+        """Superfície sobre o arquivo mapeado, ou None se não houver cache válido"""
+        self.retain(key)
+        try:
+            with open(self.path(key), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, channels, width, height = HEADER.unpack_from(mapped, 0)
+            if (magic != MAGIC or version != ASSET_CACHE_VERSION or
+                    len(mapped) != HEADER.size + width * height * channels):
+                raise ValueError("arquivo de cache inválido")
+            # A superfície mantém o mmap vivo até ser convertida e descartada
+            image = pygame.image.frombuffer(memoryview(mapped)[HEADER.size:], (width, height),
+                                            'RGBA' if channels == 4 else 'RGB')
+        except:
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return image
+
+    def store(self, key, image):
+        if not self.writable:
+            return
+        fmt = 'RGBA' if image.get_flags() & pygame.SRCALPHA else 'RGB'
+        width, height = image.get_size()
+        header = HEADER.pack(MAGIC, ASSET_CACHE_VERSION, len(fmt), width, height)
+        try:
+            write_atomic(self.path(key), header + pygame.image.tobytes(image, fmt))
+        except:
+            # Pasta sem permissão de escrita: avisa uma vez e segue sem gravar
+            self.writable = False
+            print(f"Não foi possível gravar o cache de assets em {self.directory}")
+
+    def prune(self):
+        """Apaga os arquivos que nenhuma imagem usou nesta sessão"""
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            if filename.endswith(EXTENSION) and filename[:-len(EXTENSION)] not in self.used:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                except OSError:
+                    pass
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
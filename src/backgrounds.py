@@ -0,0 +1,191 @@
+"""
+Backgrounds dos níveis: carregamento sob demanda e a transição (fade) entre eles
+"""
+from collections import OrderedDict
+import pygame
+from .constants import BG_FADE_DURATION, BG_FADE_STEPS, BG_MEMORY_BUDGET_MB
+
+class BackgroundLibrary:
+    """Backgrounds carregados só quando vão aparecer.
+
+    Nada é decodificado na criação: request(i) põe o background na fila
+    do AssetLoader (numa thread, ou na hora sem workers) e get(i) devolve
+    a superfície ou None enquanto ela não chegou. Os backgrounds em uso
+    ficam presos (keep); os outros saem da memória, do menos usado para o
+    mais usado, quando o total passa do orçamento.
+    """
+    def __init__(self, loader, names, decode, prepare, budget_mb=BG_MEMORY_BUDGET_MB):
+        self.loader = loader
+        self.names = names
+        self.decode = decode  # nome -> imagem decodificada (roda no pool)
+        self.prepare = prepare  # imagem decodificada -> superfície (thread principal)
+        self.budget = budget_mb * 1024 * 1024
+        self.surfaces = OrderedDict()  # índice -> superfície, do menos ao mais usado
+        self.pending = set()
+        self.failed = set()  # Não carregaram; a transição não espera por eles
+        self.pinned = set()
+        self.loads = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def ready(self, index):
+        return index in self.surfaces
+
+    def available(self, index):
+        return 0 <= index < len(self.names) and index not in self.failed
+
+    def get(self, index):
+        surface = self.surfaces.get(index)
+        if surface is not None:
+            self.surfaces.move_to_end(index)
+        return surface
+
+    def request(self, index, group='backgrounds'):
+        """Pede o background (sem bloquear); ignora se já está carregado ou a caminho"""
+        if not self.available(index) or index in self.surfaces or index in self.pending:
+            return
+        name = self.names[index]
+        self.pending.add(index)
+
+        def work():
+            try:
+                return self.decode(name)
+            except:
+                return None
+
+        def finish(decoded):
+            self.pending.discard(index)
+            if decoded is None:
+                self.failed.add(index)
+                print(f"Não foi possível carregar o background: {name}")
+                return
+            self.surfaces[index] = self.prepare(decoded)
+            self.loads += 1
+            self.evict()
+        self.loader.submit(group, work, finish)
+
+    def prefetch(self, indices):
+        """Pede os que faltam; True se todos os válidos já estão prontos"""
+        ready = True
+        for index in indices:
+            if self.available(index) and index not in self.surfaces:
+                self.request(index)
+                ready = ready and index in self.surfaces
+        return ready
+
+    def keep(self, indices):
+        """Prende os backgrounds em uso; os que saíram de uso podem ser liberados"""
+        pinned = set(indices)
+        if pinned != self.pinned:
+            self.pinned = pinned
+            self.evict()
+
+    def memory(self):
+        return sum(s.get_pitch() * s.get_height() for s in self.surfaces.values())
+
+    def evict(self):
+        """Libera os backgrounds fora de uso até caber no orçamento"""
+        total = self.memory()
+        for index in list(self.surfaces):
+            if total <= self.budget:
+                break
+            if index in self.pinned:
+                continue
+            surface = self.surfaces.pop(index)
+            total -= surface.get_pitch() * surface.get_height()
+            self.evictions += 1
+
+    def stats(self):
+        return {
+            'loaded': sorted(self.surfaces),
+            'memory_mb': self.memory() / (1024 * 1024),
+            'loads': self.loads,
+            'evictions': self.evictions
+        }
+
+class BackgroundFader:
+    """Fade por tempo entre o background atual e o próximo.
+
+    A transição avança em segundos (update(target, dt)), não em quadros, e
+    só começa quando os backgrounds envolvidos já foram carregados; um
+    background que falhou ao carregar é pulado (fica o último que carregou).
+    A mistura é feita com alpha por superfície direto na imagem do próximo
+    background, sem copiá-la, e o resultado fica guardado: o alpha é
+    quantizado em `steps` níveis, então só há uma mistura nova quando o
+    nível muda; nos outros quadros desenhar custa um blit, como um
+    background parado.
+    """
+    def __init__(self, library, duration=BG_FADE_DURATION, steps=BG_FADE_STEPS):
+        self.library = library
+        self.duration = duration
+        self.steps = steps
+        self.current = 0
+        self.following = 1  # Background para onde a transição vai
+        self.progress = 0.0  # 0 = só o atual, 1 = só o próximo
+        self.blend = None  # Mistura do nível atual (superfície reaproveitada)
+        self.blend_key = None
+        self.blends = 0
+        library.keep((self.current,))
+
+    @property
+    def step(self):
+        """Nível de alpha (0..steps) em que a transição está"""
+        return int(self.progress * self.steps)
+
+    def update(self, target, dt, upcoming=None):
+        """Avança dt segundos em direção ao background `target`.
+
+        `upcoming` é o background que deve vir logo (pré-carregado antes
+        de ser preciso).
+        """
+        library = self.library
+        if target != self.current and not library.available(target):
+            # Não carregou: vai só até o último disponível antes dele
+            step = 1 if target < self.current else -1
+            target = next((i for i in range(target + step, self.current, step)
+                           if library.available(i)), self.current)
+        if target != self.current:
+            self.following = target
+        needed = (self.current, self.following, target)
+        library.keep(needed + ((upcoming,) if upcoming is not None else ()))
+        if upcoming is not None:
+            library.request(upcoming)
+
+        speed = dt / self.duration if self.duration > 0 else 1.0
+        if target != self.current:
+            if not library.prefetch(needed):
+                return  # Espera os backgrounds da transição carregarem
+            self.progress = min(1.0, self.progress + speed)
+            if self.progress >= 1:
+                self.current = target
+                self.progress = 0.0
+        else:
+            self.progress = max(0.0, self.progress - speed)
+
+    def draw(self, surface):
+        library = self.library
+        base = library.get(self.current)
+        if base is None:
+            library.request(self.current)
+            return
+        step = self.step
+        following = library.get(self.following) if step > 0 else None
+        if following is None:
+            if step > 0:
+                library.request(self.following)
+            surface.blit(base, (0, 0))
+            return
+
+        key = (self.current, self.following, step)
+        if key != self.blend_key:
+            if self.blend is None or self.blend.get_size() != base.get_size():
+                self.blend = pygame.Surface(base.get_size()).convert()
+            self.blend.blit(base, (0, 0))
+            following.set_alpha(255 * step // self.steps)
+            self.blend.blit(following, (0, 0))
+            following.set_alpha(None)
+            self.blend_key = key
+            self.blends += 1
+        surface.blit(self.blend, (0, 0))
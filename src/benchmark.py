@@ -0,0 +1,314 @@
+"""
+Benchmarks dos caminhos quentes de update e draw (headless)
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+import pygame
+import numpy as np
+from .constants import (
+    WIDTH, HEIGHT, START_LIVES, POINTS_PER_LEVEL, BENCH_BASELINE_FILE,
+    BENCH_REPEAT, BENCH_WARMUP, BENCH_THRESHOLD, SPARKLE_COLORS, WHITE
+)
+
+BENCH_SEED = 1234
+
+class Benchmark:
+    """Um caso de benchmark: setup(game) devolve (run, reset).
+
+    Só `run` é cronometrado; `reset` roda entre as repetições para manter
+    o cenário estável (itens que saíram da tela, partículas que morreram...).
+    """
+    def __init__(self, name, setup):
+        self.name = name
+        self.setup = setup
+
+def new_game():
+    # Importa aqui para que os drivers dummy do SDL já estejam configurados
+    from .game import Game
+    game = Game(headless=True, seed=BENCH_SEED)
+    game.start_game()
+    return game
+
+def fill_items(game, count, top=0, bottom=HEIGHT // 2):
+    """Completa o grupo de itens até `count`, em alturas aleatórias"""
+    from .sprites import Item
+    rng = game.rng.spawns
+    while len(game.items) < count:
+        item = Item(game)
+        item.y = float(rng.randint(top, bottom))
+        item.rect.y = int(item.y)
+        item.start_y = item.y
+        game.items.add(item)
+
+def reset_items(game):
+    for item in game.items:
+        item.y = item.start_y
+        item.rect.y = int(item.y)
+
+def fill_particles(game, count):
+    particles = game.particle_system
+    rng = game.rng.effects
+    while particles.count < count:
+        pos = (rng.randint(0, WIDTH), rng.randint(0, HEIGHT // 2))
+        amount = min(50, count - particles.count)
+        particles.emit_burst(pos, amount, (1, 3), (2, 6), 10000,
+                             color=rng.choice(SPARKLE_COLORS), gravity=False)
+
+def items_update(count):
+    def setup(game):
+        fill_items(game, count)
+        dt = game.tick_dt
+        return (lambda: game.items.update(dt)), (lambda: reset_items(game))
+    return setup
+
+def particles_update(count):
+    def setup(game):
+        particles = game.particle_system
+        fill_particles(game, count)
+        snapshot = [array.copy() for array in particles.arrays]
+        size = particles.count
+
+        def reset():
+            # Restaura o estado inicial sem realocar os arrays
+            for array, saved in zip(particles.arrays, snapshot):
+                array[:] = saved
+            particles.count = size
+        dt = game.tick_dt
+        return (lambda: particles.update(dt)), reset
+    return setup
+
+def particles_draw(count):
+    def setup(game):
+        fill_particles(game, count)
+        return (lambda: game.particle_system.draw(game.screen)), None
+    return setup
+
+def check_collisions(count):
+    def setup(game):
+        # Itens espalhados pela tela; os que colidirem são repostos
+        fill_items(game, count, 0, HEIGHT - 40)
+
+        def reset():
+            fill_items(game, count, 0, HEIGHT - 40)
+            game.player.lives = START_LIVES
+        return game.check_collisions, reset
+    return setup
+
+def magnet(count):
+    def setup(game):
+        # Itens por toda a tela; só os perto do jogador entram na conta
+        from .sprites import PowerUp
+        fill_items(game, count, 0, HEIGHT - 40)
+        for item in game.items:
+            item.start_x = item.x
+        powerup = PowerUp(game)
+        powerup.type = 'magnet'
+        powerup.start_time = float('inf')  # Nunca expira durante a medição
+        powerup.apply(game.player)
+
+        def reset():
+            reset_items(game)
+            for item in game.items:
+                item.x = item.start_x
+        dt = game.tick_dt
+        return (lambda: game.apply_magnet(dt)), reset
+    return setup
+
+def popups_draw(count):
+    def setup(game):
+        # Combo longo: muitos números flutuantes, em fases diferentes do fade
+        effects = game.visual_effects_manager
+        for i in range(count):
+            effects.add_score_popup(40 + i * 37 % (WIDTH - 80), HEIGHT // 2, 10 + i % 5, WHITE)
+            effects.score_popups[-1].update(i % 50 * game.tick_dt / 2)
+
+        def run():
+            for popup in effects.score_popups:
+                popup.draw(game.screen, game.resource_manager)
+        return run, None
+    return setup
+
+def hud_draw(game):
+    from .sprites import PowerUp
+    game.score_manager.current_score = POINTS_PER_LEVEL // 2
+    game.score_manager.combo = 12
+    for _ in range(3):
+        PowerUp(game).apply(game.player)
+    return (lambda: game.hud.draw(game.screen)), None
+
+def background_transition(game):
+    # Transição em andamento: avança o fade a cada quadro e desenha
+    resources = game.resource_manager
+    level = 4  # Nível do segundo background
+    resources.current_bg = 0
+    resources.bg_transition = 0.1
+    dt = game.tick_dt
+
+    def run():
+        resources.update_background(level, dt)
+        resources.draw_background(game.screen)
+
+    def reset():
+        if resources.current_bg != 0:
+            resources.current_bg = 0
+            resources.bg_transition = 0.1
+    return run, reset
+
+def full_frame(level):
+    def setup(game):
+        from .headless import ChaserBot
+        bot = ChaserBot()
+        game.level = level
+        game.score_manager.current_score = (level - 1) * POINTS_PER_LEVEL
+        # Aquece: deixa a tela encher de itens, partículas e popups
+        for _ in range(game.tick_rate * 5):
+            game.input_dx = bot(game)
+            game.player.lives = START_LIVES
+            game.update()
+
+        def run():
+            game.input_dx = bot(game)
+            game.update()
+            game.draw(0.5)
+
+        def reset():
+            game.player.lives = START_LIVES
+            game.state = 'game'
+        return run, reset
+    return setup
+
+BENCHMARKS = (
+    [Benchmark(f"items_update[{n}]", items_update(n)) for n in (50, 200, 1000)] +
+    [Benchmark(f"particles_update[{n}]", particles_update(n)) for n in (500, 2000, 4000)] +
+    [Benchmark(f"particles_draw[{n}]", particles_draw(n)) for n in (500, 2000, 4000)] +
+    [Benchmark(f"check_collisions[{n}]", check_collisions(n)) for n in (50, 200, 1000)] +
+    [Benchmark(f"magnet[{n}]", magnet(n)) for n in (50, 200, 1000)] +
+    [Benchmark(f"popups_draw[{n}]", popups_draw(n)) for n in (10, 50)] +
+    [Benchmark("hud_draw", hud_draw),
+     Benchmark("draw_background_transition", background_transition)] +
+    [Benchmark(f"frame[level={level}]", full_frame(level)) for level in (1, 5, 10)]
+)
+
+def measure(benchmark, repeat=BENCH_REPEAT, warmup=BENCH_WARMUP):
+    """Roda o caso em um jogo novo e devolve as estatísticas em ms"""
+    game = new_game()
+    run, reset = benchmark.setup(game)
+    for _ in range(warmup):
+        run()
+        if reset:
+            reset()
+
+    gc.collect()
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        samples.append((perf_counter() - start) * 1000)
+        if reset:
+            reset()
+
+    samples.sort()
+    return {
+        'iterations': repeat,
+        'mean_ms': statistics.fmean(samples),
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min_ms': samples[0],
+        'stdev_ms': statistics.pstdev(samples)
+    }
+
+def compare(results, baseline, threshold=BENCH_THRESHOLD):
+    """Compara as medianas com o baseline; devolve a lista de regressões"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or base['median_ms'] <= 0:
+            continue
+        ratio = result['median_ms'] / base['median_ms']
+        result['baseline_median_ms'] = base['median_ms']
+        result['ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Kuromi Catch - benchmarks")
+    parser.add_argument("--filter", default=None, help="roda só os casos cujo nome contém este texto")
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT,
+                        help="repetições cronometradas por caso (padrão: %(default)s)")
+    parser.add_argument("--warmup", type=int, default=BENCH_WARMUP,
+                        help="repetições de aquecimento por caso (padrão: %(default)s)")
+    parser.add_argument("--output", default=None, help="salva os resultados em JSON neste arquivo")
+    parser.add_argument("--baseline", nargs='?', const=BENCH_BASELINE_FILE, default=None,
+                        help="compara com um baseline salvo (padrão: %(const)s)")
+    parser.add_argument("--save-baseline", nargs='?', const=BENCH_BASELINE_FILE, default=None,
+                        help="salva os resultados como novo baseline (padrão: %(const)s)")
+    parser.add_argument("--threshold", type=float, default=BENCH_THRESHOLD,
+                        help="piora relativa da mediana tolerada (padrão: %(default)s)")
+    parser.add_argument("--json", action='store_true', help="imprime os resultados em JSON")
+    return parser.parse_args(argv)
+
+def save_json(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def main(argv=None):
+    args = parse_args(argv)
+    selected = [b for b in BENCHMARKS if not args.filter or args.filter in b.name]
+
+    results = {}
+    for benchmark in selected:
+        results[benchmark.name] = measure(benchmark, args.repeat, args.warmup)
+        if not args.json:
+            r = results[benchmark.name]
+            print(f"{benchmark.name:<30} median {r['median_ms']:8.3f} ms  p95 {r['p95_ms']:8.3f} ms")
+
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+
+    regressions = []
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        except:
+            print(f"Não foi possível carregar o baseline: {args.baseline}")
+            baseline = {}
+        regressions = compare(results, baseline, args.threshold)
+        report['regressions'] = regressions
+        if not args.json:
+            for name, r in results.items():
+                if 'ratio' in r:
+                    mark = "  <-- REGRESSÃO" if name in regressions else ""
+                    print(f"{name:<30} {r['ratio']:6.2f}x baseline{mark}")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    if args.output:
+        save_json(args.output, report)
+    if args.save_baseline:
+        save_json(args.save_baseline, report)
+
+    pygame.quit()
+    # Código de saída != 0 quando há regressão (útil no CI)
+    sys.exit(1 if regressions else 0)
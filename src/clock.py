@@ -0,0 +1,30 @@
+"""
+Relógio do jogo: tempo simulado, pausável e com escala de tempo
+"""
+from .constants import TICK_RATE
+
+class GameClock:
+    """Fonte única de tempo da partida.
+
+    O tempo só avança em tick(), um passo fixo multiplicado pela escala de
+    tempo (1.0 normal, < 1 câmera lenta). Pausado, não avança. Todos os
+    timers da partida (combo, spawn, power-ups, modos) leem `time`, em ms.
+    """
+    def __init__(self, tick_rate=TICK_RATE):
+        self.tick_dt = 1 / tick_rate
+        self.time = 0.0
+        self.scale = 1.0
+        self.paused = False
+
+    def reset(self):
+        self.time = 0.0
+        self.scale = 1.0
+        self.paused = False
+
+    def tick(self):
+        """Avança um tick; retorna o dt (s) já escalado"""
+        if self.paused:
+            return 0.0
+        dt = self.tick_dt * self.scale
+        self.time += dt * 1000
+        return dt
@@ -0,0 +1,119 @@
+"""
+Colisões: índice por faixas verticais (broad phase) e máscaras (narrow phase)
+"""
+import pygame
+from collections import OrderedDict
+from .constants import COLLISION_BAND_HEIGHT, MASK_CACHE_MAX
+
+class BandedGroup(pygame.sprite.Group):
+    """Grupo de sprites indexado por faixas horizontais da tela.
+
+    Cada sprite fica na faixa do topo do seu rect; a faixa é refeita no
+    próprio update() do grupo, conforme os itens caem. Assim, achar quem
+    toca o jogador só olha as poucas faixas na altura dele, não importa
+    quantos itens estejam na tela.
+    """
+    def __init__(self, *sprites, band_height=COLLISION_BAND_HEIGHT, pool=None):
+        self.band_height = band_height
+        self.pool = pool  # Sprites que saem do grupo voltam para este pool
+        self.bands = {}  # faixa -> {sprite: None} (dict mantém a ordem)
+        self.band_of = {}
+        self.serial = {}  # Ordem de entrada no grupo, para resultados estáveis
+        self.next_serial = 0
+        self.max_height = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.serial[sprite] = self.next_serial
+        self.next_serial += 1
+        self.place(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        band = self.band_of.pop(sprite, None)
+        if band is not None:
+            members = self.bands[band]
+            del members[sprite]
+            if not members:
+                del self.bands[band]
+        self.serial.pop(sprite, None)
+        if self.pool is not None and not getattr(sprite, 'held', False):
+            self.pool.release(sprite)
+
+    def place(self, sprite):
+        rect = sprite.rect
+        if rect.height > self.max_height:
+            self.max_height = rect.height
+        band = rect.top // self.band_height
+        old = self.band_of.get(sprite)
+        if old == band:
+            return
+        if old is not None:
+            members = self.bands[old]
+            del members[sprite]
+            if not members:
+                del self.bands[old]
+        self.bands.setdefault(band, {})[sprite] = None
+        self.band_of[sprite] = band
+
+    def update(self, *args, **kwargs):
+        spritedict = self.spritedict
+        for sprite in self.sprites():
+            sprite.update(*args, **kwargs)
+            if sprite in spritedict:  # Pode ter sido removido no update
+                self.place(sprite)
+
+    def nearby(self, top, bottom):
+        """Sprites cujo topo está nas faixas que cobrem [top, bottom]"""
+        bands = self.bands
+        found = []
+        for band in range((top - self.max_height) // self.band_height, bottom // self.band_height + 1):
+            members = bands.get(band)
+            if members:
+                found.extend(members)
+        return found
+
+    def colliding(self, rect):
+        """Sprites cujo rect encosta em `rect`, na ordem em que entraram no grupo"""
+        first = (rect.top - self.max_height) // self.band_height
+        last = rect.bottom // self.band_height
+        bands = self.bands
+        hits = []
+        for band in range(first, last + 1):
+            members = bands.get(band)
+            if members:
+                hits.extend(sprite for sprite in members if rect.colliderect(sprite.rect))
+        if len(hits) > 1:
+            hits.sort(key=self.serial.__getitem__)
+        return hits
+
+class MaskCache:
+    """Máscaras de colisão por superfície (LRU).
+
+    As imagens dos itens vêm do cache de rotação, então as mesmas
+    superfícies se repetem e cada máscara é calculada uma vez só.
+    """
+    def __init__(self, max_entries=MASK_CACHE_MAX):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, surface):
+        mask = self.entries.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self.entries[surface] = mask
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(surface)
+        return mask
+
+    def collide(self, a, b):
+        """Teste pixel a pixel entre dois sprites cujos rects já se tocam"""
+        # A imagem é desenhada centrada no rect, que pode ser menor que ela
+        # (o jogador inclinado mantém o rect sem a rotação)
+        a_rect = a.image.get_rect(center=a.rect.center)
+        b_rect = b.image.get_rect(center=b.rect.center)
+        offset = (b_rect.x - a_rect.x, b_rect.y - a_rect.y)
+        return self.get(a.image).overlap(self.get(b.image), offset) is not None
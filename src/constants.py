@@ -2,14 +2,24 @@
 Constantes e configurações para o Kuromi Catch
 """
 import os
+import sys
 from datetime import datetime
 
 # --- Configurações da Janela ---
 WIDTH = 1024
 HEIGHT = 768
-FPS = 60
+FPS = 60  # Limite de quadros renderizados (0 = sem limite)
 TITLE = "✨ Kuromi Catch ✨"
 
+# --- Simulação ---
+TICK_RATE = 60  # Ticks de simulação por segundo (passo fixo)
+BASE_FPS = 60  # Taxa para a qual as velocidades "por frame" foram calibradas
+MAX_FRAME_TIME = 0.25  # Maior intervalo (s) simulado de uma vez após um travamento
+MAX_TICKS_PER_FRAME = 8  # Evita a espiral da morte quando a máquina não acompanha
+IDLE_FPS = 12  # Quadros por segundo fora da partida, sem entrada nem animação
+BACKGROUND_FPS = 2  # Com a janela minimizada ou sem foco
+IDLE_DELAY = 1.0  # Segundos sem entrada antes de baixar para IDLE_FPS
+
 # --- Configurações do Jogo ---
 START_LIVES = 5
 START_SPAWN_MS = 1000
@@ -37,6 +47,8 @@ MAGNET_FORCE = 8  # Aumentada a força de atração do ímã
 SHIELD_DURATION = 10000
 MULTIPLIER_VALUE = 2.0
 POWERUP_MIN_INTERVAL = 5000  # Tempo mínimo entre power-ups
+SLOWMO_SCALE = 0.5  # Escala de tempo do mundo com a câmera lenta ativa
+SLOWMO_DURATION = 5000  # Em tempo de jogo: ~10 segundos reais a 0.5x
 
 # --- Sistema de Combos ---
 COMBO_TIME = 2000
@@ -55,7 +67,7 @@ GOLD = (255, 215, 0)
 SPARKLE_COLORS = [(255,223,186), (255,192,203), (230,230,250)]
 
 # --- Partículas ---
-MAX_PARTICLES = 50
+MAX_PARTICLES = 4000
 PARTICLE_LIFETIME = 1000
 RAINBOW_SPEED = 0.02
 
@@ -85,8 +97,9 @@ ACHIEVEMENTS = {
 }
 
 # --- Partículas e Efeitos ---
-MAX_PARTICLES = 50
+MAX_PARTICLES = 4000
 PARTICLE_LIFETIME = 1000
+PARTICLE_GRAVITY = 0.1
 SPARKLE_COLORS = [(255,223,186), (255,192,203), (230,230,250)]
 RAINBOW_SPEED = 0.02
 
@@ -104,6 +117,7 @@ FONT_PATH = os.path.join(ASSETS_DIR, "fonts", "kawaii.ttf")
 SAVE_PATH = os.path.join(BASE_DIR, "save_data")
 HIGHSCORE_FILE = os.path.join(SAVE_PATH, "highscores.json")
 ACHIEVEMENTS_FILE = os.path.join(SAVE_PATH, "achievements.json")
+REPLAYS_DIR = os.path.join(SAVE_PATH, "replays")
 
 # --- Cores ---
 WHITE = (255, 255, 255)
@@ -159,6 +173,56 @@ GAME_MODES = {
     }
 MODES_FILE = os.path.join(SAVE_PATH, "game_modes.json")
 
+# --- Persistência ---
+SAVE_FLUSH_INTERVAL = 2.0  # Segundos entre as gravações em segundo plano
+
+# --- Colisões ---
+COLLISION_BAND_HEIGHT = 64  # Altura (px) das faixas do índice de colisão
+PIXEL_PERFECT_COLLISIONS = False  # Confirma as colisões com máscaras de pixels
+MASK_CACHE_MAX = 1500  # Máximo de máscaras de colisão guardadas
+
+# --- Telas Estáticas ---
+DIRTY_MAX_RECTS = 24  # Acima disso, as áreas sujas são unidas em uma só
+
+# --- Carregamento ---
+LOADER_WORKERS = 4  # Threads que decodificam imagens e sons na inicialização
+ASSET_CACHE_ENABLED = True  # Guarda em disco as imagens já redimensionadas
+if getattr(sys, 'frozen', False):
+    # Executável de um arquivo só: BASE_DIR é a pasta temporária da extração
+    # (apagada ao sair), então o cache fica na pasta de cache do usuário
+    if os.name == 'nt':
+        USER_CACHE_DIR = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        USER_CACHE_DIR = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        USER_CACHE_DIR = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    ASSET_CACHE_DIR = os.path.join(USER_CACHE_DIR, "KuromiCatch", "cache")
+else:
+    ASSET_CACHE_DIR = os.path.join(BASE_DIR, "cache")  # Desenvolvimento
+ASSET_CACHE_VERSION = 1  # Mudar invalida todos os arquivos do cache
+ASSET_ARCHIVE = os.path.join(BASE_DIR, "assets.kcpak")  # Usado no lugar de assets/ quando existe
+ARCHIVE_ALIGN = 64  # Alinhamento (bytes) dos blobs dentro do .kcpak
+
+# --- Backgrounds ---
+BG_FADE_DURATION = 8.3  # Segundos da transição entre backgrounds de nível
+BG_FADE_STEPS = 64  # Níveis de alpha distintos durante a transição
+BG_PREFETCH_POINTS = 50  # Pontos antes da troca de nível em que o próximo background é carregado
+BG_MEMORY_BUDGET_MB = 8  # Memória para backgrounds carregados (os em uso nunca saem)
+
+# --- Pools ---
+POOL_MAX_FREE = 256  # Máximo de objetos livres guardados por pool
+
+# --- Profiler ---
+PROFILER_HISTORY = 300  # Quadros guardados na janela móvel dos percentis
+PROFILER_REFRESH = 15  # Quadros entre as atualizações do texto do overlay
+PROFILER_GRAPH_SIZE = (300, 80)  # Tamanho (px) do gráfico de tempo de quadro
+
+# --- Benchmarks ---
+BENCH_BASELINE_FILE = os.path.join(BASE_DIR, "benchmarks", "baseline.json")
+BENCH_REPEAT = 200  # Repetições cronometradas por caso
+BENCH_WARMUP = 20  # Repetições descartadas antes de medir
+BENCH_THRESHOLD = 0.15  # Piora relativa da mediana que conta como regressão
+
 # --- Efeitos Visuais ---
 SCORE_POPUP_DURATION = 1000  # Duração dos números flutuantes
 PERFECT_FLASH_DURATION = 500  # Duração do flash "PERFECT!"
@@ -173,6 +237,28 @@ COMBO_COLORS = {
     10: GOLD
 }
 
+# --- Caches de Renderização ---
+ROTATION_STEP = 6  # Graus entre as variantes rotacionadas pré-calculadas
+ROTATION_CACHE_MAX = 1200  # Máximo de variantes guardadas em memória
+PARTICLE_MAX_RADIUS = 8  # Maior raio (px) pré-renderizado no atlas de partículas
+PARTICLE_ALPHA_LEVELS = 16  # Níveis de transparência por carimbo
+PARTICLE_MAX_SHEETS = 128  # Máximo de cores/ícones guardados no atlas
+PARTICLE_ICON_SCALE = 2  # Ícones são desenhados com o dobro do raio
+TEXT_CACHE_MAX = 512  # Máximo de textos renderizados guardados
+TEXT_SHADOW_OFFSET = 2  # Deslocamento (px) da sombra dos textos
+TEXT_ALPHA_STEPS = 32  # Níveis de transparência distintos dos textos com fade
+RAINBOW_TEXT_STEPS = 32  # Tons distintos usados em textos com efeito rainbow
+PLAYER_SCALE_MIN = 0.95  # Limites da animação de "respiração" do jogador
+PLAYER_SCALE_MAX = 1.05
+PLAYER_SCALE_STEPS = 11  # Escalas distintas na folha do jogador (passos de 0.01)
+PLAYER_MAX_TILT = 15  # Inclinação máxima (graus) ao andar
+PLAYER_TILT_STEP = 3  # Graus entre as inclinações da folha do jogador
+PLAYER_SHEET_MAX_MB = 12  # Memória máxima da folha de animação do jogador
+POPUP_FONT_SIZE = 24  # Fonte dos números flutuantes
+POPUP_SCALE_MAX = 1.2  # Escala inicial do popup (encolhe até 1.0)
+POPUP_SCALE_STEPS = 5  # Escalas pré-calculadas por popup (passos de 0.05)
+POPUP_CACHE_MAX = 64  # Máximo de pares (pontos, cor) guardados
+
 # --- Estados do Jogo ---
 STATE_MENU = 'menu'
 STATE_GAME = 'game'
@@ -183,3 +269,7 @@ STATE_HIGHSCORE = 'highscore'
 STATE_CHARACTERS = 'characters'
 STATE_MODES = 'modes'  # Novo estado para seleção de modo
 STATE_OBJECTIVES = 'objectives'  # Novo estado para objetivos diários
+
+# Telas sem animação de fundo: desenhadas com retângulos sujos
+STATIC_SCREENS = (STATE_MENU, STATE_INSTRUCTIONS, STATE_HIGHSCORE, STATE_GAMEOVER,
+                  STATE_CHARACTERS, STATE_OBJECTIVES)
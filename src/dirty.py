@@ -0,0 +1,78 @@
+"""
+Renderização por retângulos sujos para as telas estáticas
+"""
+import pygame
+from .constants import DIRTY_MAX_RECTS
+
+class DirtyRenderer:
+    """Compõe a parte fixa de uma tela uma vez e atualiza só o que muda.
+
+    A cada quadro: as áreas desenhadas no quadro anterior são restauradas
+    a partir da camada fixa, a parte animada é desenhada por cima e só a
+    união das áreas antigas e novas vai para pygame.display.update().
+    A camada fixa vem pronta (ver ScreenCache); quando a chave muda (outra
+    tela, outro background, dados novos) ou depois de invalidate(), a tela
+    inteira é enviada de novo.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.static = None
+        self.key = None
+        self.previous = []
+
+    def invalidate(self):
+        """Força recompor a camada fixa e enviar a tela inteira"""
+        self.key = None
+
+    def draw(self, key, static, draw_dynamic):
+        screen = self.screen
+        if key != self.key or static is not self.static:
+            self.static = static
+            self.key = key
+            screen.blit(self.static, (0, 0))
+            self.previous = self.collect(draw_dynamic(screen))
+            pygame.display.flip()
+            return
+
+        # Apaga a parte animada do quadro anterior
+        for rect in self.previous:
+            screen.blit(self.static, rect, rect)
+        rects = self.collect(draw_dynamic(screen))
+        pygame.display.update(self.previous + rects)
+        self.previous = rects
+
+    def collect(self, rects):
+        bounds = self.screen.get_rect()
+        rects = [bounds.clip(rect) for rect in rects if rect]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        # Muitas áreas pequenas: sai mais barato enviar a união
+        if len(rects) > DIRTY_MAX_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
+
+class ScreenCache:
+    """Telas estáticas já compostas (fundo, overlay e textos), uma por nome.
+
+    get() só chama build() quando a chave da tela muda (highscores novos,
+    outra pontuação final, outro personagem...); nas outras vezes devolve
+    a mesma superfície, pronta para um único blit. A superfície de cada
+    tela é reaproveitada ao recompor.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.entries = {}  # nome -> [chave, superfície]
+        self.builds = 0
+
+    def get(self, name, key, build):
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = [None, pygame.Surface(self.size).convert()]
+        if entry[0] != key:
+            build(entry[1])
+            entry[0] = key
+            self.builds += 1
+        return entry[1]
+
+    def invalidate(self):
+        for entry in self.entries.values():
+            entry[0] = None
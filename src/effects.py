@@ -5,188 +5,190 @@ import pygame
 import random
 import math
 import colorsys
+import numpy as np
 from .constants import *
-
-class Particle:
-    def __init__(self, x, y, color, size, lifetime, dx=0, dy=0, gravity=True):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.dx = dx
-        self.dy = dy
-        self.gravity = gravity
-        self.alpha = 255
-
-    def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        if self.gravity:
-            self.dy += 0.1
-        self.lifetime -= 1
-        self.alpha = int((self.lifetime / self.max_lifetime) * 255)
-        return self.lifetime > 0
-
-    def draw(self, surface):
-        if self.alpha <= 0:
-            return
-            
-        if hasattr(self, 'image'):
-            self.image.set_alpha(self.alpha)
-            surface.blit(self.image, (int(self.x - self.size), int(self.y - self.size)))
-        else:
-            s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.color, self.alpha), (self.size, self.size), self.size)
-            surface.blit(s, (int(self.x - self.size), int(self.y - self.size)))
+from .render_cache import ParticleAtlas
 
 class ParticleSystem:
-    def __init__(self, game=None):
-        self.particles = []
+    """Sistema de partículas em estrutura de arrays (NumPy).
+
+    Cada atributo fica em um array pré-alocado; as partículas vivas ocupam
+    as primeiras `count` posições. Atualização é vetorizada e as mortas são
+    removidas com swap-remove (as vivas do fim preenchem os buracos).
+    O desenho usa os carimbos do ParticleAtlas do ResourceManager.
+    """
+    def __init__(self, game=None, capacity=MAX_PARTICLES):
         self.game = game
+        self.atlas = game.resource_manager.particle_atlas if game else ParticleAtlas()
+        self.stamp_keys = []
+        self.stamp_ids = {}
+        self.capacity = capacity
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.stamp = np.zeros(capacity, dtype=np.int16)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.arrays = (self.pos, self.vel, self.life, self.max_life,
+                       self.size, self.stamp, self.gravity)
+        self.fallback_rng = np.random.default_rng()
+
+    @property
+    def rng(self):
+        """Gerador NumPy do fluxo de efeitos do jogo (nunca o da jogabilidade)"""
+        return self.game.rng.effects_np if self.game else self.fallback_rng
+        
+    @property
+    def random(self):
+        return self.game.rng.effects if self.game else random
         
     def emit_particles(self, type, pos):
         if type == 'sparkle':
-            for _ in range(5):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(1, 3)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                particle = self.add_particle(pos[0], pos[1], None, random.uniform(2, 4), 400, dx, dy, False)
-                if particle:
-                    particle.image = self.game.resource_manager.images['coin']
+            self.emit_burst(pos, 5, (1, 3), (2, 4), 400, gravity=False, icon='coin')
         
         elif type == 'explosion':
-            for _ in range(10):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 5)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                particle = self.add_particle(pos[0], pos[1], DARK_PINK, random.uniform(3, 6), 600, dx, dy)
-                if particle:
-                    particle.image = self.game.resource_manager.images['shield']
+            self.emit_burst(pos, 10, (2, 5), (3, 6), 600, icon='shield')
                 
         elif type == 'powerup':
-            color = rainbow_color(random.random())
-            for _ in range(15):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 4)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                self.add_particle(pos[0], pos[1], color, random.uniform(2, 5), 800, dx, dy)
+            color = rainbow_color(self.rng.random())
+            self.emit_burst(pos, 15, (2, 4), (2, 5), 800, color)
                 
         elif type == 'levelup':
-            for i in range(20):
-                angle = (i / 20) * math.pi * 2
-                speed = random.uniform(4, 6)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                self.add_particle(pos[0], pos[1], GOLD, random.uniform(3, 6), 1000, dx, dy)
+            angles = np.arange(20) / 20 * math.pi * 2
+            self.emit_burst(pos, 20, (4, 6), (3, 6), 1000, GOLD, angles=angles)
                 
         elif type == 'damage':
-            for _ in range(8):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(3, 6)
-                dx = math.cos(angle) * speed
-                dy = math.sin(angle) * speed
-                self.add_particle(pos[0], pos[1], DARK_PINK, random.uniform(2, 4), 500, dx, dy)
+            self.emit_burst(pos, 8, (3, 6), (2, 4), 500, DARK_PINK)
+
+    def stamp_id(self, color=None, icon=None):
+        """Índice da folha do atlas usada para desenhar a partícula"""
+        key = ('icon', icon) if icon else ('circle', ParticleAtlas.quantize_color(color))
+        stamp = self.stamp_ids.get(key)
+        if stamp is None:
+            stamp = self.stamp_ids[key] = len(self.stamp_keys)
+            self.stamp_keys.append(key)
+        return stamp
+        
+    def emit_burst(self, pos, amount, speed_range, size_range, lifetime, color=None,
+                   gravity=True, angles=None, icon=None):
+        """Emite várias partículas de uma vez saindo de `pos` em direções radiais"""
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return
+        if angles is None:
+            angles = self.rng.uniform(0, math.pi * 2, amount)
+        angles = angles[:amount]
+        speeds = self.rng.uniform(*speed_range, amount)
+        
+        start, end = self.count, self.count + amount
+        self.pos[start:end] = pos
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        self.life[start:end] = lifetime
+        self.max_life[start:end] = lifetime
+        self.size[start:end] = self.rng.uniform(*size_range, amount)
+        self.stamp[start:end] = self.stamp_id(color, icon)
+        self.gravity[start:end] = PARTICLE_GRAVITY if gravity else 0
+        self.count = end
                 
     def add_particle(self, x, y, color=None, size=None, lifetime=None, dx=0, dy=0, gravity=True):
-        if len(self.particles) >= MAX_PARTICLES:
+        if self.count >= self.capacity:
             return
             
         if color is None:
-            color = random.choice(SPARKLE_COLORS)
+            color = self.random.choice(SPARKLE_COLORS)
         if size is None:
-            size = random.uniform(2, 6)
+            size = self.random.uniform(2, 6)
         if lifetime is None:
             lifetime = PARTICLE_LIFETIME
             
         if dx == 0 and dy == 0:
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 3)
+            angle = self.random.uniform(0, math.pi * 2)
+            speed = self.random.uniform(1, 3)
             dx = math.cos(angle) * speed
             dy = math.sin(angle) * speed
             
-        self.particles.append(Particle(x, y, color, size, lifetime, dx, dy, gravity))
+        i = self.count
+        self.pos[i] = (x, y)
+        self.vel[i] = (dx, dy)
+        self.life[i] = lifetime
+        self.max_life[i] = lifetime
+        self.size[i] = size
+        self.stamp[i] = self.stamp_id(color)
+        self.gravity[i] = PARTICLE_GRAVITY if gravity else 0
+        self.count += 1
+        return i
         
     def trail(self, x, y, color):
-        self.add_particle(x, y, color, random.uniform(2, 4), 300, dy=random.uniform(-0.5, 0.5), gravity=False)
+        self.add_particle(x, y, color, self.random.uniform(2, 4), 300, dy=self.random.uniform(-0.5, 0.5), gravity=False)
         
-    def update(self):
-        self.particles = [p for p in self.particles if p.update()]
+    def update(self, dt=1 / BASE_FPS):
+        n = self.count
+        if n == 0:
+            return
+        step = dt * BASE_FPS
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        size = self.size[:n]
         
-    def draw(self, surface):
-        for p in self.particles:
-            p.draw(surface)
-
-class PowerUpEffect:
-    def __init__(self, type_name):
-        self.type = type_name
-        self.start_time = pygame.time.get_ticks()
-        self.duration = POWERUP_DURATION
-        if type_name == 'shield':
-            self.duration = SHIELD_DURATION
-        self.particles = ParticleSystem()
-        self.color = {
-            'magnet': YELLOW,
-            'shield': PURPLE,
-            'multiplier': GOLD
-        }.get(type_name, WHITE)
+        pos += vel * step
+        vel[:, 1] += self.gravity[:n] * step
+        self.life[:n] -= step
         
-    def is_active(self):
-        return pygame.time.get_ticks() - self.start_time < self.duration
+        # Morre quando acaba a vida ou sai da tela (pelos lados ou por baixo)
+        alive = ((self.life[:n] > 0) &
+                 (pos[:, 0] > -size) & (pos[:, 0] < WIDTH + size) &
+                 (pos[:, 1] < HEIGHT + size))
+        self.compact(alive)
         
-    def get_progress(self):
-        elapsed = pygame.time.get_ticks() - self.start_time
-        return max(0, 1 - (elapsed / self.duration))
+    def compact(self, alive):
+        """Remove as partículas mortas movendo as vivas do fim para os buracos"""
+        n = self.count
+        remaining = int(np.count_nonzero(alive))
+        if remaining == n:
+            return
+        holes = np.flatnonzero(~alive[:remaining])
+        movers = np.flatnonzero(alive[remaining:]) + remaining
+        for array in self.arrays:
+            array[holes] = array[movers]
+        self.count = remaining
         
-    def update(self, x, y):
-        self.particles.update()
+    def clear(self):
+        self.count = 0
         
-        if self.type == 'magnet':
-            if random.random() < 0.3:
-                angle = random.uniform(0, math.pi * 2)
-                px = x + math.cos(angle) * MAGNET_RANGE
-                py = y + math.sin(angle) * MAGNET_RANGE
-                self.particles.add_particle(px, py, self.color, 3, 500)
-                
-        elif self.type == 'shield':
-            for _ in range(2):
-                angle = random.uniform(0, math.pi * 2)
-                radius = 50
-                px = x + math.cos(angle) * radius
-                py = y + math.sin(angle) * radius
-                self.particles.add_particle(px, py, self.color, 4, 400)
-                
-        elif self.type == 'multiplier':
-            if random.random() < 0.2:
-                self.particles.add_particle(x + random.uniform(-30, 30),
-                                         y + random.uniform(-30, 30),
-                                         self.color, 5, 600)
-                
-    def draw(self, surface, x, y):
-        if self.type == 'shield':
-            progress = self.get_progress()
-            radius = 60
-            points = []
-            for i in range(32):
-                angle = i * (2 * math.pi / 32)
-                offset = math.sin(pygame.time.get_ticks() * 0.005 + angle * 2) * 5
-                px = x + math.cos(angle) * (radius + offset)
-                py = y + math.sin(angle) * (radius + offset)
-                points.append((px, py))
-                
-            if len(points) > 2:
-                s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                pygame.draw.polygon(s, (*self.color, int(80 * progress)), points)
-                surface.blit(s, (0, 0))
-                
-        self.particles.draw(surface)
+    def draw(self, surface):
+        """Desenha as partículas; retorna o retângulo que as contém (ou None)"""
+        n = self.count
+        if n == 0:
+            return None
+        atlas = self.atlas
+        levels = atlas.alpha_levels
+        radii = np.clip(np.rint(self.size[:n]), 1, atlas.max_radius).astype(np.int32) - 1
+        alphas = np.clip((self.life[:n] * levels / self.max_life[:n]).astype(np.int32), 0, levels - 1)
+        stamps_in_use = np.unique(self.stamp[:n]).tolist()
+        sheets = {stamp: atlas.get_sheet(self.stamp_keys[stamp]) for stamp in stamps_in_use}
+        
+        blits = []
+        for (x, y), stamp, radius, alpha in zip(self.pos[:n].tolist(), self.stamp[:n].tolist(),
+                                                radii.tolist(), alphas.tolist()):
+            stamps, halves = sheets[stamp]
+            half = halves[radius]
+            blits.append((stamps[radius][alpha], (int(x) - half, int(y) - half)))
+        surface.blits(blits, doreturn=False)
+        
+        # Limites de todas as partículas (com a maior metade de carimbo possível)
+        margin = atlas.max_radius * PARTICLE_ICON_SCALE
+        low = self.pos[:n].min(axis=0)
+        high = self.pos[:n].max(axis=0)
+        return pygame.Rect(int(low[0]) - margin, int(low[1]) - margin,
+                           int(high[0] - low[0]) + 2 * margin + 1, int(high[1] - low[1]) + 2 * margin + 1)
 
-def rainbow_color(offset=0):
-    """Gera uma cor do arco-íris baseada no tempo"""
+def rainbow_color(offset=0, steps=0):
+    """Gera uma cor do arco-íris baseada no tempo (com `steps`, quantiza o tom)"""
     t = (pygame.time.get_ticks() * RAINBOW_SPEED + offset) % 1.0
+    if steps:
+        t = int(t * steps) / steps
     rgb = colorsys.hsv_to_rgb(t, 0.8, 1.0)
     return tuple(int(x * 255) for x in rgb)
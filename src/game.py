@@ -2,26 +2,40 @@
 Classe principal do jogo Kuromi Catch
 """
 import pygame
+import gc
 import sys
-import random
 import math
+import time
+import numpy as np
 from .constants import (
     WIDTH, HEIGHT, FPS, TITLE, START_LIVES, LEVEL_SPEED_INCREASE,
     LEVEL_SCORE_MULTIPLIER, COMBO_MULTIPLIER, BLACK, WHITE, GOLD, 
     PINK, PURPLE, DARK_PURPLE, GAME_MODES, MIN_SPAWN_MS, START_SPAWN_MS, 
     SPAWN_DECREASE_AMOUNT, POINTS_PER_LEVEL, MAX_LEVEL, POWERUP_MIN_INTERVAL,
-    POWERUP_CHANCE
+    POWERUP_CHANCE, TICK_RATE, MAX_FRAME_TIME, MAX_TICKS_PER_FRAME,
+    IDLE_FPS, BACKGROUND_FPS, IDLE_DELAY,
+    PIXEL_PERFECT_COLLISIONS, MAGNET_RANGE, MAGNET_FORCE, BASE_FPS, SLOWMO_SCALE,
+    STATIC_SCREENS
 )
-from .sprites import Player, Item, PowerUp
+from .sprites import Player, Item, PowerUp, interpolate
 from .effects import ParticleSystem
 from .managers import ResourceManager, ScoreManager, AchievementManager
 from .ui.modes_menu import ModesMenu
 from .ui import Menu, PauseMenu, HUD
 from .modes import GameModeManager, DailyObjectivesManager
 from .visual_effects import VisualEffectsManager
+from .persistence import save_writer
+from .rng import RandomStreams
+from .replay import Replay, start_replay, stop_replay
+from .profiler import FrameProfiler
+from .collision import BandedGroup, MaskCache
+from .pools import Pool
+from .clock import GameClock
+from .dirty import DirtyRenderer, ScreenCache
 
 class Game:
-    def __init__(self):
+    def __init__(self, tick_rate=TICK_RATE, render_fps=FPS, headless=False, seed=None):
+        self.boot_time = time.perf_counter()
         pygame.init()
         pygame.display.set_caption(TITLE)
         
@@ -30,13 +44,58 @@ class Game:
         
         self.state = 'menu'
         self.running = True
-        self.paused = False
+        self.headless = headless
+        # gc.freeze() quando o jogo fica jogável; só o processo do jogo liga
+        # (benchmarks e replays criam vários Game, que precisam ser coletados)
+        self.freeze_gc = False
+        
+        # Relógio da partida: pausável e com escala de tempo (câmera lenta)
+        self.game_clock = GameClock(tick_rate)
+        
+        # Fluxos aleatórios separados (jogabilidade x efeitos visuais)
+        self.rng = RandomStreams(seed)
+        
+        # Sessões headless (balanceamento/regressão) não mexem no save
+        if headless:
+            save_writer.enabled = False
+        
+        # Simulação em passo fixo: a renderização roda separada e interpola
+        self.tick_rate = tick_rate
+        self.tick_dt = 1 / tick_rate
+        self.render_fps = render_fps
+        
+        # Ritmo de quadros adaptativo fora da partida
+        self.focused = True
+        self.minimized = False
+        self.last_input_time = time.perf_counter()
+        
+        self.ticks = 0
+        self.input_dx = 0
+        
+        # Replays: gravação da partida atual e reprodução
+        self.replay_recorder = None
+        self.replay_input = None
+        self.replay_state = None  # O que o replay em reprodução trocou (ver stop_replay)
+        self.playback_speed = 1
+        
+        # Profiler de quadros (F3 liga/desliga o overlay)
+        self.profiler = FrameProfiler(fps=render_fps)
+        self.profile_path = None
+        
+        # Marcos da inicialização (ms desde a criação do jogo)
+        self.startup_metrics = self.profiler.startup
         
         # Managers
-        self.resource_manager = ResourceManager()
+        # Fora do headless, os assets carregam em threads: primeiro os do menu
+        # (tela de carregamento), depois os da partida, com o menu já aberto
+        self.resource_manager = ResourceManager(async_load=not headless)
+        self.resource_manager.muted = headless
+        if self.resource_manager.loading:
+            self.state = 'loading'
         self.score_manager = ScoreManager()
         self.score_manager.game = self  # Define a referência ao jogo
         self.achievement_manager = AchievementManager()
+        self.achievement_manager.game = self
         self.particle_system = ParticleSystem(self)
         self.game_mode_manager = GameModeManager(self)
         self.daily_objectives_manager = DailyObjectivesManager(self)
@@ -47,37 +106,86 @@ class Game:
         self.pause_menu = PauseMenu(self)
         self.modes_menu = ModesMenu(self)
         self.hud = HUD(self)
+        self.dirty_renderer = DirtyRenderer(self.screen)
+        self.screen_cache = ScreenCache(self.screen.get_size())
+        self.character_highlight = None
         
         # Game objects
         self.player = None
-        self.items = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
+        # Grupos indexados por faixa vertical: a colisão só olha perto do jogador
+        # Itens e power-ups voltam ao pool ao saírem do grupo
+        self.item_pool = Pool(Item)
+        self.powerup_pool = Pool(PowerUp)
+        self.items = BandedGroup(pool=self.item_pool)
+        self.powerups = BandedGroup(pool=self.powerup_pool)
+        self.pixel_perfect = PIXEL_PERFECT_COLLISIONS
+        self.mask_cache = MaskCache()
         
         # Game state
         self.level = 1
         self.spawn_timer = 0
         self.last_spawn = 0
-        self.last_powerup_time = 0
-        self.game_time = 0
+        self.last_powerup_time = -POWERUP_MIN_INTERVAL
+        self.start_time = 0
         
         # Inicia a música de fundo
         self.resource_manager.play_music()
         
-    def start_game(self):
+    @property
+    def game_time(self):
+        """Tempo (ms) da partida atual, lido do relógio do jogo"""
+        return self.game_clock.time
+        
+    @property
+    def paused(self):
+        return self.game_clock.paused
+        
+    @paused.setter
+    def paused(self, value):
+        self.game_clock.paused = value
+        
+    def start_game(self, record=True):
+        if record and self.replay_state is not None:
+            stop_replay(self)  # Partida normal depois de um replay (menu de pausa)
+        if self.resource_manager.loading:
+            # Começou antes de terminar o carregamento: espera o que falta
+            self.resource_manager.wait_loaded()
+            self.mark_startup('playable')
         self.state = 'game'
+        if self.player is not None:
+            self.player.release_powerups()
         self.player = Player(self)
-        self.start_time = pygame.time.get_ticks()  # Registra o tempo inicial
         self.reset_game_state()
         
+        # Grava a entrada de cada tick (junto com a semente) para o replay
+        self.replay_recorder = None
+        if record and not self.headless:
+            self.replay_recorder = Replay(self.rng.seed, self.game_mode_manager.current_mode,
+                                          self.resource_manager.selected_character, self.tick_rate,
+                                          self.daily_objectives_manager.snapshot())
+            self.replay_input = None
+            self.playback_speed = 1
+            
+    def play_replay(self, replay, speed=1):
+        """Reproduz um replay na tela, a 1x, 2x, 4x..."""
+        start_replay(self, replay)
+        save_writer.enabled = False  # O replay não pode mexer no save (volta em stop_replay)
+        self.playback_speed = speed
+        
     def reset_game_state(self):
+        self.rng.new_session()
         self.level = 1
         self.score_manager.reset()
-        self.game_time = 0
+        self.ticks = 0
+        self.game_clock.reset()
         self.spawn_timer = 0
-        self.start_time = pygame.time.get_ticks()  # Atualiza o tempo inicial
-        self.last_spawn = pygame.time.get_ticks()
+        self.start_time = 0
+        self.last_spawn = 0
+        self.last_powerup_time = -POWERUP_MIN_INTERVAL
         self.items.empty()
         self.powerups.empty()
+        if self.player is not None:
+            self.player.release_powerups()
         
         # Reset dos modificadores de modo
         self.speed_multiplier = 1.0
@@ -85,37 +193,108 @@ class Game:
         self.score_multiplier = 1.0
         self.spawn_bad_items = True
         self.required_accuracy = 0.0
+        self.game_mode_manager.apply_mode()
         
     def update(self):
+        """Avança um tick fixo de simulação"""
+        dt = self.tick_dt
+        if self.state == 'loading' or self.resource_manager.loading:
+            self.update_loading()
         if self.state == 'menu':
-            self.menu.update()
+            self.menu.update(dt, not self.idle())
         elif self.state == 'pause':
-            self.pause_menu.update()
+            self.pause_menu.update(dt, not self.idle())
+        elif self.state == 'modes':
+            self.modes_menu.update(dt)
         elif self.state == 'game' and not self.paused:
             self.update_game()
             
-        # Atualiza partículas em todos os estados
-        self.particle_system.update()
+        # Atualiza a transição do background com base no nível
+        if self.state == 'game' or self.state == 'pause':
+            self.resource_manager.update_background(self.level, dt, self.score_manager.current_score)
+        self.update_effects()
+        
+    def update_effects(self):
+        """Partículas, em todos os estados (na partida, no tempo do jogo).
+
+        As sessões headless chamam junto com update_game(): sem isso as
+        partículas nunca morrem e o sistema fica preso na capacidade máxima.
+        """
+        dt = self.tick_dt
+        if self.state == 'game':
+            dt *= self.game_clock.scale
+        with self.profiler.section('update.effects'):
+            self.particle_system.update(dt)
+            
+    def update_loading(self):
+        """Guarda os assets já carregados e sai da tela de carregamento"""
+        resources = self.resource_manager
+        resources.poll_loading()
+        if self.state == 'loading' and resources.loader.ready('menu'):
+            self.state = 'menu'
+            self.mark_startup('menu')
+        if not resources.loading:
+            self.mark_startup('playable')
+            
+    def mark_startup(self, name):
+        metrics = self.startup_metrics
+        if name in metrics:
+            return
+        metrics[name] = (time.perf_counter() - self.boot_time) * 1000
+        if name == 'playable':
+            if self.freeze_gc:
+                # Tira os objetos carregados (imagens, caches, fontes) das
+                # varreduras do coletor de lixo: as pausas ficam só com o que é novo
+                gc.freeze()
+            cache = self.resource_manager.asset_cache
+            if cache is not None:
+                # Início frio (imagens decodificadas) ou quente (tudo do cache)
+                metrics['asset_cache'] = cache.stats()
+                metrics['cold'] = cache.misses > 0
+        if name in ('first_frame', 'playable') and 'first_frame' in metrics and 'playable' in metrics:
+            start = "frio" if metrics.get('cold', True) else "quente"
+            print(f"Inicialização ({start}): primeiro quadro em {metrics['first_frame']:.0f} ms, "
+                  f"menu em {metrics.get('menu', metrics['first_frame']):.0f} ms, "
+                  f"jogável em {metrics['playable']:.0f} ms")
             
     def update_game(self):
-        # Atualiza tempo de jogo
-        self.game_time = pygame.time.get_ticks()
+        # Avança o relógio do jogo; com câmera lenta, o mundo usa um dt menor
+        # mas o jogador continua respondendo na velocidade normal
+        self.ticks += 1
+        self.game_clock.scale = SLOWMO_SCALE if self.player.has_powerup('slowmo') else 1.0
+        dt = self.game_clock.tick()
         elapsed_time = self.game_time - self.start_time
         
+        # Entrada do tick: do replay, se estiver reproduzindo, e gravação
+        if self.replay_input is not None:
+            if self.replay_input.done:
+                self.state = 'gameover'
+                stop_replay(self)
+                return
+            self.input_dx = self.replay_input(self)
+        if self.replay_recorder is not None:
+            self.replay_recorder.append(self.input_dx)
+        
         # Atualiza objetivo de sobrevivência
         self.daily_objectives_manager.update_progress('survive_time', elapsed_time // 1000)
         
         # Verifica game over
         if self.player.lives <= 0:
             self.state = 'gameover'
-            self.score_manager.check_highscore()
+            if self.replay_input is not None:
+                stop_replay(self)  # A partida reproduzida não entra nos recordes
+                return
+            if self.replay_recorder is not None:
+                self.replay_recorder.score = self.score_manager.current_score
+            self.score_manager.check_highscore(self.replay_recorder)
+            save_writer.request_flush()
             return
         
         # Atualiza modo de jogo
         self.game_mode_manager.update()
         
         # Spawna itens
-        current_time = pygame.time.get_ticks()
+        current_time = self.game_time
         base_delay = max(MIN_SPAWN_MS, 
                         START_SPAWN_MS - (self.level * SPAWN_DECREASE_AMOUNT))
         
@@ -126,34 +305,80 @@ class Game:
         else:
             spawn_delay = base_delay
                          
-        if current_time - self.last_spawn > spawn_delay:
-            self.spawn_item()
-            self.last_spawn = current_time
+        with self.profiler.section('update.spawn'):
+            if current_time - self.last_spawn > spawn_delay:
+                self.spawn_item()
+                self.last_spawn = current_time
             
         # Atualiza objetos
-        self.player.update()
-        self.items.update()
-        self.powerups.update()
+        with self.profiler.section('update.items'):
+            self.player.move(self.input_dx, self.tick_dt)
+            self.player.update(self.tick_dt)
+            if self.player.has_powerup('magnet'):
+                self.apply_magnet(dt)
+            self.items.update(dt)
+            self.powerups.update(dt)
         
         # Atualiza efeitos visuais
-        self.visual_effects_manager.update()
+        with self.profiler.section('update.effects'):
+            self.visual_effects_manager.update(dt)
         
         # Checa colisões
-        self.check_collisions()
+        with self.profiler.section('update.collisions'):
+            self.check_collisions()
         
         # Checa level up
         if self.score_manager.current_score >= self.level * POINTS_PER_LEVEL:
             self.level_up()
             
+    def apply_magnet(self, dt):
+        """Puxa os doces em alcance para o jogador, num único passe vetorizado.
+        
+        Só os itens nas faixas a até MAGNET_RANGE do jogador são considerados,
+        então o custo não cresce com o total de itens na tela.
+        """
+        px, py = self.player.rect.center
+        items = [item for item in self.items.nearby(py - MAGNET_RANGE, py + MAGNET_RANGE) if item.is_good]
+        if not items:
+            return
+            
+        centers = np.array([item.rect.center for item in items], dtype=np.float32)
+        delta = np.array((px, py), dtype=np.float32) - centers
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        pulled = np.nonzero((dist < MAGNET_RANGE) & (dist > 1))[0]
+        if not len(pulled):
+            return
+            
+        # Força cresce conforme o item se aproxima do jogador
+        dist = dist[pulled]
+        strength = MAGNET_FORCE * (1 - dist / MAGNET_RANGE) * (dt * BASE_FPS)
+        moves = delta[pulled] * (strength / dist)[:, None]
+        for index, (mx, my) in zip(pulled.tolist(), moves.tolist()):
+            item = items[index]
+            item.x += mx
+            item.y += my
+            
+    def pool_stats(self):
+        """Ocupação dos pools de objetos"""
+        return {
+            'items': self.item_pool.stats(),
+            'powerups': self.powerup_pool.stats(),
+            'score_popups': self.visual_effects_manager.popup_pool.stats()
+        }
+        
     def check_collisions(self):
+        # Broad phase: só os sprites nas faixas do jogador; narrow phase
+        # opcional com máscaras (pixel a pixel)
+        player_rect = self.player.rect
+        
         # Colisões com itens
-        for item in self.items:
-            if pygame.sprite.collide_rect(self.player, item):
+        for item in self.items.colliding(player_rect):
+            if not self.pixel_perfect or self.mask_cache.collide(self.player, item):
                 self.handle_item_collision(item)
                 
         # Colisões com power-ups
-        for powerup in self.powerups:
-            if pygame.sprite.collide_rect(self.player, powerup):
+        for powerup in self.powerups.colliding(player_rect):
+            if not self.pixel_perfect or self.mask_cache.collide(self.player, powerup):
                 self.handle_powerup_collision(powerup)
                 
     def handle_item_collision(self, item):
@@ -216,83 +441,168 @@ class Game:
             self.particle_system.emit_particles('levelup', self.player.rect.center)
             
     def spawn_item(self):
-        if random.random() < self.spawn_multiplier:  # Considera o multiplicador de spawn
-            item = Item(self)
+        if self.rng.spawns.random() < self.spawn_multiplier:  # Considera o multiplicador de spawn
+            item = self.item_pool.acquire(self)
             if not self.spawn_bad_items:  # No modo Chuva de Doces, força itens bons
                 item.is_good = True
             self.items.add(item)
             self.game_mode_manager.items_spawned += 1
             
-            if (pygame.time.get_ticks() - self.last_powerup_time > POWERUP_MIN_INTERVAL and 
-                random.random() < POWERUP_CHANCE):
-                powerup = PowerUp(self)
+            if (self.game_time - self.last_powerup_time > POWERUP_MIN_INTERVAL and 
+                self.rng.powerups.random() < POWERUP_CHANCE):
+                powerup = self.powerup_pool.acquire(self)
                 self.powerups.add(powerup)
-                self.last_powerup_time = pygame.time.get_ticks()
+                self.last_powerup_time = self.game_time
             
-    def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Atualiza e desenha o background com transição
-        if self.state == 'game' or self.state == 'pause':
-            self.resource_manager.update_background(self.level)
-        self.resource_manager.draw_background(self.screen)
+    def draw(self, alpha=1.0):
+        """Renderiza um quadro; alpha é a fração do tick atual já decorrida"""
+        if self.state in STATIC_SCREENS:
+            if not self.profiler.enabled:
+                # Telas estáticas: só as áreas animadas são redesenhadas e enviadas
+                key = self.static_screen_key()
+                self.dirty_renderer.draw(key, self.static_screen(key), self.draw_dynamic_layer)
+                return
+            self.screen.blit(self.static_screen(), (0, 0))
+            self.draw_dynamic_layer(self.screen)
+        else:
+            self.dirty_renderer.invalidate()
+            with self.profiler.section('draw.background'):
+                self.screen.fill(BLACK)
+                
+                # Desenha o background com transição
+                self.resource_manager.draw_background(self.screen)
+                
+            if self.state == 'game' or self.state == 'pause':
+                # Pausado, não há movimento para interpolar
+                self.draw_game(alpha if self.state == 'game' else 1.0)
+                if self.state == 'pause':
+                    self.pause_menu.draw(self.screen)
+            elif self.state == 'modes':
+                self.modes_menu.draw(self.screen)
+            elif self.state == 'loading':
+                self.draw_loading(self.screen)
+            
+            # Desenha partículas em todos os estados
+            with self.profiler.section('draw.particles'):
+                self.particle_system.draw(self.screen)
             
+        if self.profiler.enabled:
+            self.profiler.draw(self.screen, self.resource_manager.fonts)
+        with self.profiler.section('draw.flip'):
+            pygame.display.flip()
+        
+    def static_screen_key(self):
+        """Tudo de que a parte fixa da tela atual depende"""
+        resources = self.resource_manager
+        key = (self.state, resources.current_bg, resources.background_fader.step)
+        if self.state == 'highscore':
+            return key + (tuple(self.score_manager.highscores),)
+        if self.state == 'gameover':
+            return key + (self.score_manager.current_score, tuple(self.score_manager.highscores))
+        if self.state == 'characters':
+            unlocked = resources.unlockable_characters['player2']['unlocked']
+            return key + (resources.selected_character, unlocked, self.score_manager.highest_score)
+        if self.state == 'objectives':
+            objectives = self.daily_objectives_manager
+            return key + (tuple((obj['type'], obj['target'], obj['completed']) for obj in objectives.objectives),
+                          tuple(objectives.progress.items()))
+        return key
+        
+    def static_screen(self, key=None):
+        """Parte fixa da tela atual, composta só quando a chave muda"""
+        if key is None:
+            key = self.static_screen_key()
+        return self.screen_cache.get(self.state, key, self.draw_static_layer)
+        
+    def draw_static_layer(self, surface):
+        """Parte fixa das telas estáticas (fundo, overlay e textos)"""
+        surface.fill(BLACK)
+        self.resource_manager.draw_background(surface)
         if self.state == 'menu':
-            self.menu.draw(self.screen)
-        elif self.state == 'game' or self.state == 'pause':
-            self.draw_game()
-            if self.state == 'pause':
-                self.pause_menu.draw(self.screen)
+            self.menu.draw_static(surface)
         elif self.state == 'instructions':
-            self.draw_instructions()
+            self.draw_instructions(surface)
         elif self.state == 'highscore':
-            self.draw_highscores()
+            self.draw_highscores(surface)
         elif self.state == 'gameover':
-            self.draw_game_over()
+            self.draw_game_over(surface)
         elif self.state == 'characters':
-            self.draw_characters()
-        elif self.state == 'modes':
-            self.modes_menu.draw(self.screen)
-            self.modes_menu.update()
+            self.draw_characters(surface)
         elif self.state == 'objectives':
-            self.daily_objectives_manager.draw(self.screen)
-        
-        # Desenha partículas em todos os estados
-        self.particle_system.draw(self.screen)
-        pygame.display.flip()
-        
-    def draw_game(self):
-        # Desenha objetos do jogo
-        self.items.draw(self.screen)
-        self.powerups.draw(self.screen)
-        self.player.draw(self.screen)
+            self.daily_objectives_manager.draw(surface)
+            
+    def draw_dynamic_layer(self, surface):
+        """Parte animada das telas estáticas; retorna as áreas desenhadas"""
+        rects = []
+        if self.state == 'menu':
+            rects.extend(self.menu.draw_dynamic(surface))
+        elif self.state == 'characters' and not self.idle():
+            self.emit_character_sparkles()
+        rects.append(self.particle_system.draw(surface))
+        return rects
+        
+    def draw_loading(self, surface):
+        # Tela leve: só texto e uma barra, enquanto as threads decodificam
+        title_surf = self.resource_manager.render_text(48, "Carregando", PINK)
+        title_x = (WIDTH - title_surf.get_width()) // 2
+        surface.blit(title_surf, (title_x, HEIGHT // 2 - 80))
         
+        # Pontinhos pulando
+        now = time.perf_counter() - self.boot_time
+        for i in range(3):
+            bounce = abs(math.sin(now * 6 - i * 0.8)) * 12
+            pygame.draw.circle(surface, PURPLE, (WIDTH // 2 - 30 + i * 30, int(HEIGHT // 2 - bounce)), 7)
+            
+        # Barra de progresso
+        bar = pygame.Rect(0, 0, 400, 20)
+        bar.center = (WIDTH // 2, HEIGHT // 2 + 50)
+        pygame.draw.rect(surface, DARK_PURPLE, bar, border_radius=10)
+        fill = bar.copy()
+        fill.width = int(bar.width * self.resource_manager.loader.progress())
+        if fill.width > 0:
+            pygame.draw.rect(surface, PINK, fill, border_radius=10)
+            
+    def draw_game(self, alpha=1.0):
+        # Desenha objetos do jogo nas posições interpoladas
+        with self.profiler.section('draw.sprites'):
+            self.draw_sprites(self.items, alpha)
+            self.draw_sprites(self.powerups, alpha)
+            self.player.draw(self.screen, alpha)
+        
+        with self.profiler.section('draw.hud'):
             # Desenha HUD básico
-        self.hud.draw(self.screen)
-        
-        # Desenha efeitos visuais aprimorados
-        self.visual_effects_manager.draw(self.screen)
-        
-        # Desenha indicador de modo de jogo
-        if self.game_mode_manager.current_mode != 'normal':
-            mode = GAME_MODES[self.game_mode_manager.current_mode]
-            mode_text = mode['name']
-            text_surf = self.resource_manager.fonts[32].render(mode_text, True, GOLD)
-            rect = text_surf.get_rect(centerx=WIDTH//2, top=10)
-            self.screen.blit(text_surf, rect)
-        
-    def draw_instructions(self):
+            self.hud.draw(self.screen)
+            
+            # Desenha efeitos visuais aprimorados
+            self.visual_effects_manager.draw(self.screen)
+            
+            # Desenha indicador de modo de jogo
+            if self.game_mode_manager.current_mode != 'normal':
+                mode = GAME_MODES[self.game_mode_manager.current_mode]
+                mode_text = mode['name']
+                text_surf = self.resource_manager.render_text(32, mode_text, GOLD)
+                rect = text_surf.get_rect(centerx=WIDTH//2, top=10)
+                self.screen.blit(text_surf, rect)
+        
+    def draw_sprites(self, group, alpha):
+        blits = []
+        for sprite in group:
+            center = interpolate(sprite.prev_center, sprite.rect.center, alpha)
+            blits.append((sprite.image, sprite.image.get_rect(center=center)))
+        self.screen.blits(blits, doreturn=False)
+        
+    def draw_instructions(self, surface):
         # Cria superfície semi-transparente
         overlay = pygame.Surface((WIDTH, HEIGHT))
         overlay.fill(PURPLE)
         overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         # Título
         title = "Como Jogar"
-        title_surf = self.resource_manager.fonts[48].render(title, True, WHITE)
+        title_surf = self.resource_manager.render_text(48, title, WHITE)
         title_x = (WIDTH - title_surf.get_width()) // 2
-        self.screen.blit(title_surf, (title_x, 50))
+        surface.blit(title_surf, (title_x, 50))
         
         # Instruções
         instructions = [
@@ -310,64 +620,64 @@ class Game:
         
         y = 150
         for line in instructions:
-            text = self.resource_manager.fonts[24].render(line, True, WHITE)
+            text = self.resource_manager.render_text(24, line, WHITE)
             x = (WIDTH - text.get_width()) // 2
-            self.screen.blit(text, (x, y))
+            surface.blit(text, (x, y))
             y += 40
             
-    def draw_highscores(self):
+    def draw_highscores(self, surface):
         # Cria superfície semi-transparente
         overlay = pygame.Surface((WIDTH, HEIGHT))
         overlay.fill(PURPLE)
         overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         # Título
         title = "🏆 High Scores 🏆"
-        title_surf = self.resource_manager.fonts[48].render(title, True, GOLD)
+        title_surf = self.resource_manager.render_text(48, title, GOLD)
         title_x = (WIDTH - title_surf.get_width()) // 2
-        self.screen.blit(title_surf, (title_x, 50))
+        surface.blit(title_surf, (title_x, 50))
         
         # Lista de high scores
         y = 150
         for i, score in enumerate(self.score_manager.highscores[:5], 1):
             text = f"#{i}: {score:,} pontos"
-            text_surf = self.resource_manager.fonts[32].render(text, True, WHITE)
+            text_surf = self.resource_manager.render_text(32, text, WHITE)
             x = (WIDTH - text_surf.get_width()) // 2
-            self.screen.blit(text_surf, (x, y))
+            surface.blit(text_surf, (x, y))
             y += 50
             
         # Instrução para voltar
         back = "Pressione ESC para voltar"
-        back_surf = self.resource_manager.fonts[24].render(back, True, WHITE)
+        back_surf = self.resource_manager.render_text(24, back, WHITE)
         x = (WIDTH - back_surf.get_width()) // 2
-        self.screen.blit(back_surf, (x, HEIGHT - 100))
+        surface.blit(back_surf, (x, HEIGHT - 100))
         
-    def draw_game_over(self):
+    def draw_game_over(self, surface):
         # Cria superfície semi-transparente com fade
         overlay = pygame.Surface((WIDTH, HEIGHT))
         overlay.fill(PURPLE)
         overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         # Game Over
         title = "✨ GAME OVER ✨"
-        title_surf = self.resource_manager.fonts[64].render(title, True, PINK)
+        title_surf = self.resource_manager.render_text(64, title, PINK)
         title_x = (WIDTH - title_surf.get_width()) // 2
-        self.screen.blit(title_surf, (title_x, HEIGHT//2 - 150))
+        surface.blit(title_surf, (title_x, HEIGHT//2 - 150))
         
         # Pontuação
         score_text = f"Pontuação: {self.score_manager.current_score:,}"
-        score_surf = self.resource_manager.fonts[32].render(score_text, True, WHITE)
+        score_surf = self.resource_manager.render_text(32, score_text, WHITE)
         score_x = (WIDTH - score_surf.get_width()) // 2
-        self.screen.blit(score_surf, (score_x, HEIGHT//2 - 50))
+        surface.blit(score_surf, (score_x, HEIGHT//2 - 50))
         
         # Novo recorde (se aplicável)
         if self.score_manager.current_score == max(self.score_manager.highscores):
             record = "🎉 NOVO RECORDE! 🎉"
-            record_surf = self.resource_manager.fonts[40].render(record, True, GOLD)
+            record_surf = self.resource_manager.render_text(40, record, GOLD)
             record_x = (WIDTH - record_surf.get_width()) // 2
-            self.screen.blit(record_surf, (record_x, HEIGHT//2 + 20))
+            surface.blit(record_surf, (record_x, HEIGHT//2 + 20))
         
         # Instruções
         instructions = [
@@ -377,9 +687,9 @@ class Game:
         
         y = HEIGHT//2 + 100
         for line in instructions:
-            text = self.resource_manager.fonts[24].render(line, True, WHITE)
+            text = self.resource_manager.render_text(24, line, WHITE)
             x = (WIDTH - text.get_width()) // 2
-            self.screen.blit(text, (x, y))
+            surface.blit(text, (x, y))
             y += 40
             
     def handle_events(self):
@@ -387,17 +697,38 @@ class Game:
             if event.type == pygame.QUIT:
                 self.quit_game()
                 
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+                self.last_input_time = time.perf_counter()
+                
+            # Janela sem foco ou minimizada: pausa a partida e economiza quadros
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type == pygame.WINDOWMINIMIZED:
+                self.minimized = True
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+                self.last_input_time = time.perf_counter()
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.WINDOWEXPOSED):
+                self.minimized = False
+                self.dirty_renderer.invalidate()
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED) and self.state == 'game':
+                self.toggle_pause()
+                
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == 'game':
                         self.state = 'pause'  # Mostra o menu de pausa
                         self.paused = True
+                        save_writer.request_flush()
                     elif self.state in ['instructions', 'highscore', 'characters', 'gameover', 'modes', 'objectives']:
                         self.state = 'menu'
                         
                 if event.key == pygame.K_r and self.state == 'gameover':
                     self.start_game()
                     
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    
             # Verifica fim da música
             self.resource_manager.check_music_end(event)
                 
@@ -424,21 +755,21 @@ class Game:
                         self.resource_manager.selected_character = 'player2'
                         self.resource_manager.play_sound('catch')
                         
-        # Processa movimento contínuo do jogador
+        # Processa movimento contínuo do jogador (aplicado nos ticks)
+        dx = 0
         if self.state == 'game' and not self.paused:
             keys = pygame.key.get_pressed()
-            dx = 0
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
                 dx = -1
             if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
                 dx = 1
-            if self.player:
-                self.player.move(dx)
+        self.input_dx = dx
                         
     def toggle_pause(self):
         if not self.paused:
             self.state = 'pause'
             self.paused = True
+            save_writer.request_flush()
             
     def unpause(self):
         self.paused = False
@@ -467,18 +798,28 @@ class Game:
     def quit_game(self):
         self.running = False
         
-    def draw_characters(self):
+    def emit_character_sparkles(self):
+        # Partículas de destaque em volta do personagem selecionado
+        rect = self.character_highlight
+        if rect and self.rng.effects.random() < 0.1:
+            angle = self.rng.effects.uniform(0, math.pi * 2)
+            px = rect.centerx + math.cos(angle) * 40
+            py = rect.centery + math.sin(angle) * 40
+            self.particle_system.add_particle(px, py, GOLD, 3, 400, gravity=False)
+            
+    def draw_characters(self, surface):
+        self.character_highlight = None
         # Cria superfície semi-transparente
         overlay = pygame.Surface((WIDTH, HEIGHT))
         overlay.fill(PURPLE)
         overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         # Título
         title = "✨ Personagens ✨"
-        title_surf = self.resource_manager.fonts[48].render(title, True, GOLD)
+        title_surf = self.resource_manager.render_text(48, title, GOLD)
         title_x = (WIDTH - title_surf.get_width()) // 2
-        self.screen.blit(title_surf, (title_x, 50))
+        surface.blit(title_surf, (title_x, 50))
         
         # Lista de personagens
         y = 150
@@ -486,9 +827,9 @@ class Game:
         # Personagem padrão
         x = WIDTH // 4
         char_text = "Kuromi"
-        text_surf = self.resource_manager.fonts[32].render(char_text, True, WHITE)
+        text_surf = self.resource_manager.render_text(32, char_text, WHITE)
         text_x = x - text_surf.get_width() // 2
-        self.screen.blit(text_surf, (text_x, y))
+        surface.blit(text_surf, (text_x, y))
         
         # Status e animação do personagem
         is_selected = self.resource_manager.selected_character == 'player'
@@ -496,9 +837,9 @@ class Game:
         status_text = "Selecionado" if is_selected else "Clique para selecionar"
         status_color = GOLD if is_selected else WHITE
         
-        status_surf = self.resource_manager.fonts[24].render(status_text, True, status_color)
+        status_surf = self.resource_manager.render_text(24, status_text, status_color)
         status_x = x - status_surf.get_width() // 2
-        self.screen.blit(status_surf, (status_x, y + 40))
+        surface.blit(status_surf, (status_x, y + 40))
         
         player_img = self.resource_manager.images['player']
         scaled_img = pygame.transform.smoothscale(
@@ -508,17 +849,12 @@ class Game:
         )
         
         player_rect = scaled_img.get_rect(center=(x, y + 120))
-        self.screen.blit(scaled_img, player_rect)
+        surface.blit(scaled_img, player_rect)
         
         # Desenha borda ao redor do personagem selecionado
         if is_selected:
-            pygame.draw.rect(self.screen, GOLD, player_rect.inflate(10, 10), 3, border_radius=10)
-            # Adiciona partículas de destaque
-            if random.random() < 0.1:
-                angle = random.uniform(0, math.pi * 2)
-                px = player_rect.centerx + math.cos(angle) * 40
-                py = player_rect.centery + math.sin(angle) * 40
-                self.particle_system.add_particle(px, py, GOLD, 3, 400, gravity=False)
+            pygame.draw.rect(surface, GOLD, player_rect.inflate(10, 10), 3, border_radius=10)
+            self.character_highlight = player_rect
         
         # Personagem desbloqueável
         x = WIDTH * 3 // 4
@@ -546,13 +882,13 @@ class Game:
             scale = 0.9
             is_selected = False
         
-        text_surf = self.resource_manager.fonts[32].render(char_text, True, text_color)
-        status_surf = self.resource_manager.fonts[24].render(status_text, True, status_color)
+        text_surf = self.resource_manager.render_text(32, char_text, text_color)
+        status_surf = self.resource_manager.render_text(24, status_text, status_color)
         
         text_x = x - text_surf.get_width() // 2
         status_x = x - status_surf.get_width() // 2
-        self.screen.blit(text_surf, (text_x, y))
-        self.screen.blit(status_surf, (status_x, y + 40))
+        surface.blit(text_surf, (text_x, y))
+        surface.blit(status_surf, (status_x, y + 40))
         
         scaled_img = pygame.transform.smoothscale(
             player_img, 
@@ -561,30 +897,99 @@ class Game:
         )
         
         player_rect = scaled_img.get_rect(center=(x, y + 120))
-        self.screen.blit(scaled_img, player_rect)
+        surface.blit(scaled_img, player_rect)
         
         # Desenha borda ao redor do personagem selecionado
         if is_selected:
-            pygame.draw.rect(self.screen, GOLD, player_rect.inflate(10, 10), 3, border_radius=10)
-            # Adiciona partículas de destaque
-            if random.random() < 0.1:
-                angle = random.uniform(0, math.pi * 2)
-                px = player_rect.centerx + math.cos(angle) * 40
-                py = player_rect.centery + math.sin(angle) * 40
-                self.particle_system.add_particle(px, py, GOLD, 3, 400, gravity=False)
+            pygame.draw.rect(surface, GOLD, player_rect.inflate(10, 10), 3, border_radius=10)
+            self.character_highlight = player_rect
         
         # Instrução para voltar
         back = "Pressione ESC para voltar"
-        back_surf = self.resource_manager.fonts[24].render(back, True, WHITE)
+        back_surf = self.resource_manager.render_text(24, back, WHITE)
         x = (WIDTH - back_surf.get_width()) // 2
-        self.screen.blit(back_surf, (x, HEIGHT - 50))
+        surface.blit(back_surf, (x, HEIGHT - 50))
+        
+    def idle(self):
+        """Sem entrada há IDLE_DELAY segundos.
+
+        Parado, as animações contínuas das telas (rainbow do título e do
+        item selecionado, brilhos em volta do personagem) congelam: a tela
+        fica realmente estática e pode cair para IDLE_FPS sem engasgar.
+        """
+        return time.perf_counter() - self.last_input_time >= IDLE_DELAY
+        
+    def is_animating(self):
+        """Há algo se mexendo que precisa da taxa de quadros cheia?"""
+        if self.resource_manager.loading:
+            return True
+        if not self.idle():
+            # Entrada recente: rainbow do menu e do item selecionado, brilhos
+            # do personagem (todos congelam quando o jogador fica parado)
+            return True
+        if self.particle_system.count:
+            return True
+        if self.state == 'menu':
+            return any(item.is_animating() for item in self.menu.items)
+        if self.state == 'pause':
+            return any(item.is_animating() for item in self.pause_menu.items)
+        return False
+        
+    def target_fps(self):
+        """Taxa de quadros do próximo quadro; None = taxa cheia (render_fps)"""
+        if self.minimized or not self.focused:
+            return BACKGROUND_FPS
+        if self.state in ('game', 'modes'):
+            return None
+        if self.is_animating():
+            return None
+        return IDLE_FPS
+        
+    def wait_frame(self, fps):
+        """Dorme até o próximo quadro ocioso, acordando na hora se chegar um evento"""
+        event = pygame.event.wait(1000 // fps)
+        if event.type != pygame.NOEVENT:
+            # Devolve os eventos à fila, na ordem, para o handle_events
+            for pending in [event] + pygame.event.get():
+                pygame.event.post(pending)
+        return self.clock.tick() / 1000
         
     def run(self):
+        # Loop com acumulador: a simulação avança em ticks fixos e a
+        # renderização desenha o que der, interpolando entre os ticks
+        accumulator = 0.0
         while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
-            self.draw()
+            idle_fps = self.target_fps()
+            if idle_fps is None:
+                frame_time = self.clock.tick(self.render_fps) / 1000
+            else:
+                frame_time = self.wait_frame(idle_fps)
+            frame_time = min(frame_time, MAX_FRAME_TIME)
+            accumulator += frame_time * self.playback_speed
+            self.profiler.begin_frame()
+            with self.profiler.section('events'):
+                self.handle_events()
+            
+            ticks = 0
+            max_ticks = MAX_TICKS_PER_FRAME * self.playback_speed
+            while accumulator >= self.tick_dt and ticks < max_ticks:
+                self.update()
+                accumulator -= self.tick_dt
+                ticks += 1
+            if ticks == max_ticks:
+                # Não conseguiu acompanhar: descarta o atraso em vez de acumular
+                accumulator = min(accumulator, self.tick_dt)
+                
+            if not self.minimized:
+                self.draw(accumulator / self.tick_dt)
+                if 'first_frame' not in self.startup_metrics:
+                    self.mark_startup('first_frame')
+            self.profiler.end_frame()
             
+        if self.profile_path:
+            self.profiler.export(self.profile_path)
+        save_writer.flush()
+        self.profiler.close()
+        self.resource_manager.loader.shutdown()
         pygame.quit()
         sys.exit()
@@ -0,0 +1,206 @@
+"""
+Simulação headless (sem janela nem áudio) para rodar sessões em lote
+"""
+import argparse
+import gc
+import json
+import os
+import time
+from .constants import GAME_MODES, TICK_RATE, HIGHSCORE_FILE, REPLAYS_DIR
+from .replay import Replay, verify_replay
+from .rng import seed_arg
+
+class ChaserBot:
+    """Bot simples: persegue o doce (ou power-up) mais próximo de ser pego"""
+    def __init__(self, dead_zone=8):
+        self.dead_zone = dead_zone
+
+    def __call__(self, game):
+        player = game.player.rect
+        targets = [item for item in game.items if item.is_good and item.rect.bottom <= player.bottom]
+        targets.extend(p for p in game.powerups if p.rect.bottom <= player.bottom)
+        if targets:
+            # O alvo mais baixo é o próximo a chegar no jogador
+            target_x = max(targets, key=lambda sprite: sprite.rect.bottom).rect.centerx
+        else:
+            target_x = game.screen.get_width() // 2
+
+        if target_x < player.centerx - self.dead_zone:
+            return -1
+        if target_x > player.centerx + self.dead_zone:
+            return 1
+        return 0
+
+class IdleInput:
+    """Nunca se move (linha de base para comparação)"""
+    def __call__(self, game):
+        return 0
+
+class ScriptedInput:
+    """Lê um dx (-1, 0 ou 1) por tick de um arquivo texto; depois do fim, fica parado"""
+    def __init__(self, path):
+        with open(path) as f:
+            self.moves = [max(-1, min(1, int(value))) for value in f.read().split()]
+        self.index = 0
+
+    def __call__(self, game):
+        if self.index >= len(self.moves):
+            return 0
+        dx = self.moves[self.index]
+        self.index += 1
+        return dx
+
+def make_input(spec):
+    if spec == 'bot':
+        return ChaserBot()
+    if spec == 'idle':
+        return IdleInput()
+    return ScriptedInput(spec)
+
+def start_session(game, mode='normal', character='player', seed=None):
+    # Mesma semente => mesmos spawns e mesmos objetivos diários
+    game.rng.fixed_seed = seed
+    if seed is not None:
+        game.rng.seed_objectives(seed)
+        game.daily_objectives_manager.generate_new_objectives()
+    game.resource_manager.selected_character = character
+    if mode in GAME_MODES:
+        game.game_mode_manager.start_mode(mode)
+    else:
+        game.game_mode_manager.current_mode = 'normal'
+    game.start_game()
+
+def run_session(game, input_source, max_ticks, mode='normal', character='player', seed=None):
+    """Roda uma partida até o game over (ou max_ticks) sem desenhar nada"""
+    start_session(game, mode, character, seed)
+    collections = sum(s['collections'] for s in gc.get_stats())
+    start = time.perf_counter()
+    while game.state == 'game' and game.ticks < max_ticks:
+        game.input_dx = input_source(game)
+        game.update_game()
+        game.update_effects()
+    wall_time = time.perf_counter() - start
+    collections = sum(s['collections'] for s in gc.get_stats()) - collections
+
+    return {
+        'seed': game.rng.seed,
+        'mode': mode,
+        'character': character,
+        'score': game.score_manager.current_score,
+        'level': game.level,
+        'lives': game.player.lives,
+        'ticks': game.ticks,
+        'game_over': game.state == 'gameover',
+        'wall_time': wall_time,
+        'ticks_per_second': game.ticks / wall_time if wall_time > 0 else 0.0,
+        'gc_collections': collections,
+        'pools': game.pool_stats()
+    }
+
+def check_replay(game, replay):
+    """Re-simula um replay o mais rápido possível e confere o score"""
+    start = time.perf_counter()
+    matches, score = verify_replay(game, replay)
+    wall_time = time.perf_counter() - start
+    return {
+        'seed': replay.seed,
+        'mode': replay.mode,
+        'character': replay.character,
+        'expected_score': replay.score,
+        'score': score,
+        'matches': matches,
+        'ticks': game.ticks,
+        'wall_time': wall_time,
+        'ticks_per_second': game.ticks / wall_time if wall_time > 0 else 0.0
+    }
+
+def highscore_replays():
+    """Caminhos dos replays anexados aos recordes em highscores.json"""
+    try:
+        with open(HIGHSCORE_FILE, 'r') as f:
+            data = json.load(f)
+    except:
+        return []
+    if isinstance(data, list):
+        return []  # Formato antigo, sem replays
+    return [os.path.join(REPLAYS_DIR, e['replay']) for e in data['entries'] if e.get('replay')]
+
+def run_replays(paths, as_json=False):
+    from .game import Game
+    results = []
+    game = None
+    for path in paths:
+        replay = Replay.load(path)
+        if game is None or game.tick_rate != replay.tick_rate:
+            game = Game(tick_rate=replay.tick_rate, headless=True)
+        result = check_replay(game, replay)
+        result['file'] = path
+        results.append(result)
+        if not as_json:
+            status = "OK" if result['matches'] else "DIVERGIU"
+            print(f"{path}: {status} score={result['score']} (esperado {result['expected_score']}) "
+                  f"ticks={result['ticks']} sim_fps={result['ticks_per_second']:.0f}")
+    if as_json:
+        print(json.dumps(results, indent=2))
+    elif not paths:
+        print("Nenhum replay para verificar")
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Kuromi Catch - simulação headless")
+    parser.add_argument("--sessions", type=int, default=1, help="número de partidas (padrão: %(default)s)")
+    parser.add_argument("--max-ticks", type=int, default=TICK_RATE * 600,
+                        help="limite de ticks por partida (padrão: %(default)s)")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE,
+                        help="ticks de simulação por segundo (padrão: %(default)s)")
+    parser.add_argument("--mode", default='normal', choices=['normal'] + list(GAME_MODES.keys()))
+    parser.add_argument("--character", default='player', choices=['player', 'player2'])
+    parser.add_argument("--input", default='bot',
+                        help="'bot', 'idle' ou caminho de um arquivo com um dx por tick")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="semente da primeira partida; as seguintes usam seed+1, seed+2...")
+    parser.add_argument("--json", action='store_true', help="imprime os resultados em JSON")
+    parser.add_argument("--replay", action='append', default=[],
+                        help="re-simula um arquivo de replay e confere o score (pode repetir)")
+    parser.add_argument("--verify-highscores", action='store_true',
+                        help="verifica todos os replays anexados aos recordes")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.replay or args.verify_highscores:
+        paths = list(args.replay)
+        if args.verify_highscores:
+            paths.extend(highscore_replays())
+        return run_replays(paths, args.json)
+
+    # Importa aqui para que os drivers dummy do SDL já estejam configurados
+    from .game import Game
+    game = Game(tick_rate=args.tick_rate, headless=True)
+
+    results = []
+    for i in range(args.sessions):
+        seed = args.seed + i if args.seed is not None else None
+        result = run_session(game, make_input(args.input), args.max_ticks, args.mode, args.character, seed)
+        results.append(result)
+        if not args.json:
+            print(f"seed={result['seed']} score={result['score']} level={result['level']} ticks={result['ticks']} "
+                  f"sim_fps={result['ticks_per_second']:.0f}")
+
+    total_ticks = sum(r['ticks'] for r in results)
+    total_time = sum(r['wall_time'] for r in results)
+    summary = {
+        'sessions': len(results),
+        'total_ticks': total_ticks,
+        'wall_time': total_time,
+        'simulated_fps': total_ticks / total_time if total_time > 0 else 0.0,
+        'realtime_factor': total_ticks / args.tick_rate / total_time if total_time > 0 else 0.0,
+        'mean_score': sum(r['score'] for r in results) / len(results) if results else 0.0
+    }
+    if args.json:
+        print(json.dumps({'summary': summary, 'sessions': results}, indent=2))
+    else:
+        print(f"{summary['sessions']} sessões, {total_ticks} ticks em {total_time:.2f}s: "
+              f"{summary['simulated_fps']:.0f} ticks/s ({summary['realtime_factor']:.1f}x tempo real), "
+              f"score médio {summary['mean_score']:.0f}")
+    return results
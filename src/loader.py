@@ -0,0 +1,125 @@
+"""
+Carregamento de assets em segundo plano (pool de threads)
+"""
+import io
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import pygame
+from .constants import LOADER_WORKERS
+
+def decode_image(assets, name, size=None, cache=None):
+    """Lê e redimensiona uma imagem; roda nas threads do pool.
+
+    Não converte para o formato da tela (isso fica para a thread
+    principal). Retorna (imagem, já_redimensionada): smoothscale só aceita
+    imagens de 24/32 bits, as outras são redimensionadas depois de convertidas.
+    Com `cache`, a imagem redimensionada vem do (ou vai para o) AssetCache.
+    """
+    data = assets.read(name)
+    key = None
+    if cache is not None and size:
+        key = cache.key(data, size)
+        image = cache.load(key)
+        if image is not None:
+            return image, True
+    image = pygame.image.load(io.BytesIO(data), name)
+    if size and image.get_bitsize() in (24, 32):
+        image = pygame.transform.smoothscale(image, size)
+        if key is not None:
+            cache.store(key, image)
+        return image, True
+    return image, not size
+
+def decode_folder(assets, folder, size=None, cache=None):
+    """Todas as imagens de uma pasta: [(arquivo, decodificada ou None)]"""
+    decoded = []
+    for filename in assets.listdir(folder):
+        if filename.lower().endswith((".png", ".jpg", ".jpeg")):
+            try:
+                decoded.append((filename, decode_image(assets, f"{folder}/{filename}", size, cache)))
+            except:
+                decoded.append((filename, None))
+    return decoded
+
+class AssetLoader:
+    """Decodifica assets num pool de threads, em grupos por prioridade.
+
+    Cada job tem duas partes: `work()` roda numa thread do pool (ler o
+    arquivo, decodificar, redimensionar) e `finish(resultado)` roda na
+    thread principal, em poll(), na ordem em que os jobs foram pedidos; é
+    ali que as superfícies são convertidas e guardadas. Um grupo ('menu',
+    'game') fica pronto quando todos os seus jobs terminam.
+
+    Com workers=0 tudo roda na hora, dentro de submit() (modo headless,
+    benchmarks e replays).
+    """
+    def __init__(self, workers=LOADER_WORKERS):
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='assets') if workers > 0 else None
+        self.pending = deque()  # (grupo, future, finish, mensagem de erro)
+        self.remaining = {}  # grupo -> jobs ainda não finalizados
+        self.callbacks = {}  # grupo -> funções chamadas quando ele fica pronto
+        self.total = 0
+        self.done = 0
+        self.started = time.perf_counter()
+        self.ready_times = {}  # grupo -> segundos desde o início até ficar pronto
+
+    @property
+    def busy(self):
+        return bool(self.pending)
+
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def ready(self, group):
+        return not self.remaining.get(group)
+
+    def submit(self, group, work, finish, error=None):
+        self.total += 1
+        self.remaining[group] = self.remaining.get(group, 0) + 1
+        if self.executor is None:
+            future = Future()
+            try:
+                future.set_result(work())
+            except Exception as e:
+                future.set_exception(e)
+            self.complete((group, future, finish, error))
+        else:
+            self.pending.append((group, self.executor.submit(work), finish, error))
+
+    def when_ready(self, group, callback):
+        """Chama callback (na thread principal) quando o grupo ficar pronto"""
+        if self.ready(group):
+            callback()
+        else:
+            self.callbacks.setdefault(group, []).append(callback)
+
+    def complete(self, job):
+        group, future, finish, error = job
+        try:
+            finish(future.result())
+        except:
+            if error:
+                print(error)
+        self.done += 1
+        self.remaining[group] -= 1
+        if not self.remaining[group]:
+            self.ready_times[group] = time.perf_counter() - self.started
+            for callback in self.callbacks.pop(group, []):
+                callback()
+
+    def poll(self):
+        """Finaliza os jobs que já terminaram no pool, sem bloquear"""
+        while self.pending and self.pending[0][1].done():
+            self.complete(self.pending.popleft())
+
+    def wait(self, group=None):
+        """Bloqueia até o grupo (ou tudo, sem grupo) estar pronto"""
+        while self.pending and not (group and self.ready(group)):
+            job = self.pending.popleft()
+            wait([job[1]])
+            self.complete(job)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
@@ -6,6 +6,12 @@ import json
 import os
 import random
 from .constants import *
+from .render_cache import RotationCache, ParticleAtlas, TextCache, PlayerSheet, PopupRenderer
+from .persistence import save_writer
+from .backgrounds import BackgroundLibrary, BackgroundFader
+from .loader import AssetLoader, decode_image, decode_folder
+from .asset_cache import AssetCache
+from .archive import open_assets
 
 class ScoreManager:
     def __init__(self):
@@ -17,7 +23,7 @@ class ScoreManager:
         """Reseta as variáveis do score"""
         self.current_score = 0
         self.combo = 0
-        self.last_catch_time = 0
+        self.last_catch_time = -COMBO_TIME
         self.items_collected = 0
         self.perfect_streak = 0
         # Mantém o recorde mesmo após resetar
@@ -25,7 +31,7 @@ class ScoreManager:
         
     def add_combo(self):
         """Aumenta o combo quando pega um item bom"""
-        now = pygame.time.get_ticks()
+        now = self.game.game_time
         if now - self.last_catch_time < COMBO_TIME:
             self.combo = min(self.combo + 1, MAX_COMBO)
         else:
@@ -40,14 +46,17 @@ class ScoreManager:
     def load_highscores(self):
         try:
             with open(HIGHSCORE_FILE, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except:
-            return []
+            data = []
+        # Formato antigo: lista simples de pontuações, sem replays
+        if isinstance(data, list):
+            data = {'entries': [{'score': score, 'replay': None} for score in data]}
+        self.highscore_entries = data['entries']
+        return [entry['score'] for entry in self.highscore_entries]
             
     def save_highscores(self):
-        os.makedirs(os.path.dirname(HIGHSCORE_FILE), exist_ok=True)
-        with open(HIGHSCORE_FILE, 'w') as f:
-            json.dump(self.highscores, f)
+        save_writer.schedule(HIGHSCORE_FILE, {'entries': self.highscore_entries})
             
     def add_score(self, points, has_multiplier=False):
         if has_multiplier:
@@ -68,7 +77,7 @@ class ScoreManager:
                 self.game.achievement_manager.pending_achievements.append(f"new_char_{char}")
         
     def update_combo(self):
-        now = pygame.time.get_ticks()
+        now = self.game.game_time
         if now - self.last_catch_time < COMBO_TIME:
             self.combo = min(self.combo + 1, MAX_COMBO)
         else:
@@ -78,17 +87,31 @@ class ScoreManager:
     def break_combo(self):
         self.combo = 0
         
-    def check_highscore(self):
+    def check_highscore(self, replay=None):
         if not self.highscores or self.current_score > min(self.highscores):
-            self.highscores.append(self.current_score)
-            self.highscores.sort(reverse=True)
-            self.highscores = self.highscores[:5]  # Mantém top 5
+            entry = {'score': self.current_score, 'replay': None}
+            if replay is not None:
+                # Anexa o replay para o recorde poder ser verificado depois
+                filename = f"{self.current_score}_{replay.seed}.kcr"
+                save_writer.schedule_bytes(os.path.join(REPLAYS_DIR, filename), replay.to_bytes())
+                entry['replay'] = filename
+            self.highscore_entries.append(entry)
+            self.highscore_entries.sort(key=lambda e: e['score'], reverse=True)
+            dropped = self.highscore_entries[5:]
+            self.highscore_entries = self.highscore_entries[:5]  # Mantém top 5
+            # Os replays dos recordes que saíram do top 5 são apagados
+            kept = {e.get('replay') for e in self.highscore_entries}
+            for e in dropped:
+                if e.get('replay') and e['replay'] not in kept:
+                    save_writer.schedule_delete(os.path.join(REPLAYS_DIR, e['replay']))
+            self.highscores = [e['score'] for e in self.highscore_entries]
             self.save_highscores()
             return True
         return False
 
 class AchievementManager:
     def __init__(self):
+        self.game = None  # Será definido quando o jogo for criado
         self.achievements = self.load_achievements()
         self.pending_achievements = []
         self.display_queue = []
@@ -102,9 +125,14 @@ class AchievementManager:
             return {name: False for name in ACHIEVEMENTS.keys()}
             
     def save_achievements(self):
-        os.makedirs(os.path.dirname(ACHIEVEMENTS_FILE), exist_ok=True)
-        with open(ACHIEVEMENTS_FILE, 'w') as f:
-            json.dump(self.achievements, f)
+        save_writer.schedule(ACHIEVEMENTS_FILE, self.achievements)
+            
+    def add_achievement(self, name):
+        """Concede uma conquista sem requisito numérico (modos, objetivos)"""
+        if not self.achievements.get(name, False):
+            self.achievements[name] = True
+            self.pending_achievements.append(name)
+            self.save_achievements()
             
     def check_achievement(self, name, value):
         if not self.achievements.get(name, False) and value >= ACHIEVEMENTS[name]['req']:
@@ -146,10 +174,9 @@ class AchievementManager:
                 text = f"{achievement['name']}"
                 desc = achievement['desc']
                 
-                # Renderiza o texto com sombra
-                font = pygame.font.Font(FONT_PATH, 24)
-                text_surf = font.render(text, True, GOLD)
-                desc_surf = font.render(desc, True, WHITE)
+                # Renderiza o texto (cache de textos do ResourceManager)
+                text_surf = self.game.resource_manager.render_text(24, text, GOLD)
+                desc_surf = self.game.resource_manager.render_text(24, desc, WHITE)
                 
                 # Cria superfície com transparência
                 text_alpha = pygame.Surface((text_surf.get_width() + 20, text_surf.get_height() * 2 + 10), pygame.SRCALPHA)
@@ -168,15 +195,32 @@ class AchievementManager:
                 y += text_alpha.get_height() + 10
 
 class ResourceManager:
-    def __init__(self):
+    def __init__(self, async_load=False):
         self.images = {}
         self.sounds = {}
         self.fonts = {}
-        self.current_bg = 0
-        self.bg_transition = 0
-        self.bg_fade_speed = 0.002
         self.current_bgm = None
+        self.muted = False  # Sem sons nem música (modo headless)
         self.selected_character = 'player'  # Personagem padrão
+        self.rotation_cache = RotationCache()
+        self.particle_atlas = ParticleAtlas(self.images)
+        self.text_cache = TextCache(self.fonts)
+        self.popup_renderer = PopupRenderer(self.text_cache)
+        self.current_player_sheet = None  # Só a folha do personagem em uso fica na memória
+        # Com async_load, as imagens e sons são decodificados em threads
+        # enquanto a tela de carregamento (e depois o menu) já roda
+        self.loader = AssetLoader(LOADER_WORKERS if async_load else 0)
+        # No build empacotado, os assets vêm do .kcpak (mmap); em
+        # desenvolvimento, dos arquivos soltos em assets/
+        self.assets = open_assets()
+        # Backgrounds: carregados sob demanda conforme o nível (ver update_background)
+        self.backgrounds = BackgroundLibrary(
+            self.loader, self.background_names(),
+            lambda name: decode_image(self.assets, name, (WIDTH, HEIGHT), self.asset_cache),
+            lambda decoded: self.prepare_image(decoded, (WIDTH, HEIGHT), alpha=False))
+        self.background_fader = BackgroundFader(self.backgrounds)
+        # Imagens já redimensionadas ficam em disco: o próximo início só lê os pixels
+        self.asset_cache = AssetCache() if ASSET_CACHE_ENABLED else None
         
         # Cria uma superfície vazia para caso uma imagem não seja encontrada
         empty_surface = pygame.Surface((20, 20))
@@ -187,112 +231,154 @@ class ResourceManager:
         self.load_resources()
         
     def load_resources(self):
-        # Carrega imagens
-        self.load_image('player', os.path.join(ASSETS_DIR, "player.png"), (120, 120))  # Mantém proporção quadrada
-        self.load_image('player2', os.path.join(ASSETS_DIR, "player2.png"), (120, 120))
-        self.load_image('coin', os.path.join(ASSETS_DIR, "coin.png"), (40, 40))
-        self.load_image('shield', os.path.join(ASSETS_DIR, "shield.png"), (40, 40))
-        self.load_image('ima', os.path.join(ASSETS_DIR, "ima.png"), (40, 40))
+        # Fontes: rápidas e já usadas pela tela de carregamento
+        self.load_fonts()
         
         # Personagens desbloqueáveis
         self.unlockable_characters = {
             'player2': {'score': 150000, 'unlocked': False}
         }
         
-        # Carrega backgrounds
-        self.images['backgrounds'] = []
-        backgrounds_dir = os.path.join(ASSETS_DIR, "backgrounds")
-        try:
-            bg = pygame.image.load(os.path.join(ASSETS_DIR, "backgrounds", "background.png")).convert()
-            bg = pygame.transform.smoothscale(bg, (WIDTH, HEIGHT))
-            self.images['backgrounds'].append(bg)
-            
-            for i in range(2, 5):
-                try:
-                    bg = pygame.image.load(os.path.join(backgrounds_dir, f"background{i}.png")).convert()
-                    bg = pygame.transform.smoothscale(bg, (WIDTH, HEIGHT))
-                    self.images['backgrounds'].append(bg)
-                except:
-                    print(f"Não foi possível carregar background{i}.png")
-        except:
-            print("Não foi possível carregar o background principal")
-        
-        # Carrega imagens de itens
-        self.images['good'] = self.load_images_from_folder(os.path.join(ASSETS_DIR, "good"), (60, 60))
-        self.images['bad'] = self.load_images_from_folder(os.path.join(ASSETS_DIR, "bad"), (60, 60))
+        # Grupo 'menu': o que as telas do menu mostram, carregado primeiro
+        self.backgrounds.request(0, 'menu')
+        self.load_image('player', "player.png", (120, 120), 'menu')  # Mantém proporção quadrada
+        self.load_image('player2', "player2.png", (120, 120), 'menu')
         
-        # Carrega sons
-        self.load_sound('catch', os.path.join(ASSETS_DIR, "sounds", "catch.mp3"), 0.5)
-        self.load_sound('fail', os.path.join(ASSETS_DIR, "sounds", "fail.mp3"), 0.5)
-        self.load_sound('powerup', os.path.join(ASSETS_DIR, "sounds", "powerup.mp3"), 0.4)
-        self.load_sound('levelup', os.path.join(ASSETS_DIR, "sounds", "levelup.mp3"), 0.4)
+        # Grupo 'game': só a partida usa; entra na fila quando o menu está pronto
+        self.loader.when_ready('menu', self.load_game_resources)
         
         # Carrega músicas
         self.bgm_tracks = [
-            os.path.join(ASSETS_DIR, "sounds", "bgm.mp3"),
-            os.path.join(ASSETS_DIR, "sounds", "bgm2.mp3")
+            "sounds/bgm.mp3",
+            "sounds/bgm2.mp3"
         ]
         try:
             self.current_bgm = random.choice(self.bgm_tracks)
-            pygame.mixer.music.load(self.current_bgm)
+            pygame.mixer.music.load(self.assets.source(self.current_bgm), self.current_bgm)
             pygame.mixer.music.set_volume(0.1)  # Volume a 10%
             pygame.mixer.music.set_endevent(pygame.USEREVENT + 1)
         except:
             print("Não foi possível carregar a música de fundo")
             
-        # Carrega fontes
-        self.load_fonts()
+    def load_game_resources(self):
+        self.load_image('coin', "coin.png", (40, 40))
+        self.load_image('shield', "shield.png", (40, 40))
+        self.load_image('ima', "ima.png", (40, 40))
+        self.load_image('slowmotion', "slowmotion.png", (40, 40))
         
-    def load_image(self, name, path, size=None):
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            if size:
-                img = pygame.transform.smoothscale(img, size)
-            self.images[name] = img
-        except:
-            print(f"Não foi possível carregar a imagem: {path}")
+        # Carrega imagens de itens
+        self.load_images_from_folder('good', "good", (60, 60))
+        self.load_images_from_folder('bad', "bad", (60, 60))
+        
+        # Carrega sons
+        self.load_sound('catch', "sounds/catch.mp3", 0.5)
+        self.load_sound('fail', "sounds/fail.mp3", 0.5)
+        self.load_sound('powerup', "sounds/powerup.mp3", 0.4)
+        self.load_sound('levelup', "sounds/levelup.mp3", 0.4)
+        
+        # Com as imagens da partida prontas, pré-calcula os caches
+        self.loader.when_ready('game', self.warm_caches)
+        if self.asset_cache is not None:
+            self.loader.when_ready('game', self.prune_asset_cache)
             
-    def load_images_from_folder(self, folder, size=None):
-        images = []
-        if not os.path.isdir(folder):
-            return images
-        for filename in os.listdir(folder):
-            if filename.lower().endswith((".png", ".jpg", ".jpeg")):
-                try:
-                    img = pygame.image.load(os.path.join(folder, filename)).convert_alpha()
-                    if size:
-                        img = pygame.transform.smoothscale(img, size)
-                    images.append(img)
-                except:
+    def player_sheet(self, name):
+        """Folha de animação do personagem; refeita só quando ele (ou a imagem) muda"""
+        image = self.images[name]
+        sheet = self.current_player_sheet
+        if sheet is None or sheet.image is not image:
+            sheet = self.current_player_sheet = PlayerSheet(image)
+            sheet.warm()
+        return sheet
+        
+    def prune_asset_cache(self):
+        # Os backgrounds ainda não carregados (sob demanda) também ficam no cache
+        def work():
+            for name in self.backgrounds.names:
+                self.asset_cache.retain(self.asset_cache.key(self.assets.read(name), (WIDTH, HEIGHT)))
+        self.loader.submit('cache', work, lambda _: self.asset_cache.prune())
+        
+    def warm_caches(self):
+        # Pré-calcula as rotações dos itens e power-ups que caem
+        self.rotation_cache.warm(self.images['good'] + self.images['bad'] +
+                                 [self.images[name] for name in ('coin', 'shield', 'ima', 'slowmotion') if name in self.images])
+        
+        # Pré-renderiza os carimbos das partículas mais comuns
+        self.particle_atlas.warm(SPARKLE_COLORS + [GOLD, DARK_PINK, YELLOW, PURPLE], icons=('coin', 'shield'))
+        
+    @property
+    def loading(self):
+        return self.loader.busy
+        
+    def poll_loading(self):
+        """Guarda os assets que terminaram de carregar; não bloqueia"""
+        self.loader.poll()
+        
+    def wait_loaded(self, group=None):
+        """Bloqueia até o grupo (ou todos os assets) estar carregado"""
+        self.loader.wait(group)
+        
+    def prepare_image(self, decoded, size=None, alpha=True):
+        # Na thread principal: converte para o formato da tela
+        image, scaled = decoded
+        image = image.convert_alpha() if alpha else image.convert()
+        if not scaled:
+            image = pygame.transform.smoothscale(image, size)
+        return image
+        
+    def load_image(self, name, path, size=None, group='game'):
+        def finish(decoded):
+            self.images[name] = self.prepare_image(decoded, size)
+        self.loader.submit(group, lambda: decode_image(self.assets, path, size, self.asset_cache), finish,
+                           f"Não foi possível carregar a imagem: {path}")
+        
+    def background_names(self):
+        # background.png, background2.png, background3.png... até faltar um
+        names = ["backgrounds/background.png"]
+        while self.assets.exists(f"backgrounds/background{len(names) + 1}.png"):
+            names.append(f"backgrounds/background{len(names) + 1}.png")
+        return names
+            
+    def load_images_from_folder(self, name, folder, size=None, group='game'):
+        images = self.images[name] = []
+        def finish(decoded):
+            for filename, image in decoded:
+                if image is None:
                     print(f"Não foi possível carregar a imagem: {filename}")
-        return images
+                else:
+                    images.append(self.prepare_image(image, size))
+        self.loader.submit(group, lambda: decode_folder(self.assets, folder, size, self.asset_cache), finish)
         
-    def load_sound(self, name, path, volume=1.0):
-        try:
-            sound = pygame.mixer.Sound(path)
+    def load_sound(self, name, path, volume=1.0, group='game'):
+        def finish(sound):
             sound.set_volume(volume)
             self.sounds[name] = sound
-        except:
-            print(f"Não foi possível carregar o som: {path}")
+        self.loader.submit(group, lambda: pygame.mixer.Sound(self.assets.source(path)), finish,
+                           f"Não foi possível carregar o som: {path}")
             
     def load_fonts(self):
         sizes = [16, 20, 24, 32, 40, 48, 64]
         try:
             for size in sizes:
-                self.fonts[size] = pygame.font.Font(FONT_PATH, size)
+                self.fonts[size] = pygame.font.Font(self.assets.source("fonts/kawaii.ttf"), size)
         except:
             print("Usando fonte padrão")
             for size in sizes:
                 self.fonts[size] = pygame.font.SysFont(None, size)
                 
+    def render_text(self, size, text, color, shadow=None, alpha=None):
+        """Renderiza um texto usando o cache (sem font.render quando já existe)"""
+        return self.text_cache.render(size, text, color, shadow, alpha)
+        
     def play_sound(self, name):
-        if name in self.sounds:
+        if not self.muted and name in self.sounds:
             try:
                 self.sounds[name].play()
             except:
                 pass
                 
     def play_music(self):
+        if self.muted:
+            return
         try:
             pygame.mixer.music.play(-1)
         except:
@@ -304,37 +390,45 @@ class ResourceManager:
         except:
             pass
             
-    def update_background(self, level):
+    @property
+    def current_bg(self):
+        return self.background_fader.current
+        
+    @current_bg.setter
+    def current_bg(self, index):
+        self.background_fader.current = index
+        
+    @property
+    def bg_transition(self):
+        return self.background_fader.progress
+        
+    @bg_transition.setter
+    def bg_transition(self, progress):
+        self.background_fader.progress = progress
+        
+    def background_index(self, level):
+        return min((level - 1) // 3, len(self.backgrounds) - 1)
+        
+    def update_background(self, level, dt, score=None):
         # Atualiza a transição do background com base no nível
-        target_bg = min((level - 1) // 3, len(self.images['backgrounds']) - 1)
+        target_bg = self.background_index(level)
         
-        if target_bg != self.current_bg:
-            self.bg_transition = min(1, self.bg_transition + self.bg_fade_speed)
-            if self.bg_transition >= 1:
-                self.current_bg = target_bg
-                self.bg_transition = 0
-        else:
-            self.bg_transition = max(0, self.bg_transition - self.bg_fade_speed)
+        # Perto de subir de nível: já pede (numa thread) o background seguinte
+        upcoming = None
+        if score is not None and level < MAX_LEVEL and level * POINTS_PER_LEVEL - score <= BG_PREFETCH_POINTS:
+            upcoming = self.background_index(level + 1)
+        self.background_fader.update(target_bg, dt, upcoming)
             
     def draw_background(self, surface):
-        if not self.images['backgrounds']:
-            return
-            
-        # Desenha o background atual
-        surface.blit(self.images['backgrounds'][self.current_bg], (0, 0))
-        
-        # Se estiver em transição, desenha o próximo background com fade
-        if self.bg_transition > 0 and self.current_bg + 1 < len(self.images['backgrounds']):
-            next_bg = self.images['backgrounds'][self.current_bg + 1].copy()
-            next_bg.set_alpha(int(255 * self.bg_transition))
-            surface.blit(next_bg, (0, 0))
+        # Desenha o background atual, misturado com o próximo durante a transição
+        self.background_fader.draw(surface)
             
     def check_music_end(self, event):
         if event.type == pygame.USEREVENT + 1:  # Música terminou
             # Troca para a outra música
             next_track = self.bgm_tracks[1] if self.current_bgm == self.bgm_tracks[0] else self.bgm_tracks[0]
             try:
-                pygame.mixer.music.load(next_track)
+                pygame.mixer.music.load(self.assets.source(next_track), next_track)
                 pygame.mixer.music.play()
                 self.current_bgm = next_track
             except:
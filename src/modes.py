@@ -2,19 +2,20 @@
 Gerenciador de modos de jogo e objetivos diários
 """
 import json
-import random
 import pygame
 from datetime import datetime, timedelta
 from .constants import (
     MODES_FILE, GAME_MODES, DAILY_OBJECTIVES, OBJECTIVES_FILE,
     DAILY_OBJECTIVES_REWARD, STATE_GAMEOVER
 )
+from .persistence import save_writer
 
 class GameModeManager:
     def __init__(self, game):
         self.game = game
         self.current_mode = 'normal'
         self.mode_start_time = 0
+        self.mode_completed = False
         self.items_spawned = 0
         self.items_caught = 0
         self.unlocked_modes = self.load_modes()
@@ -32,19 +33,30 @@ class GameModeManager:
             return modes
             
     def save_modes(self, modes):
-        with open(MODES_FILE, 'w') as f:
-            json.dump(modes, f)
+        save_writer.schedule(MODES_FILE, modes)
             
     def start_mode(self, mode_name):
         self.current_mode = mode_name
-        self.mode_start_time = pygame.time.get_ticks()
-        self.items_spawned = 0
-        self.items_caught = 0
         
         # Reseta o estado do jogo com as configurações do modo
         self.game.reset_game_state()
         
-        mode_data = GAME_MODES[mode_name]
+    def apply_mode(self):
+        """Zera os contadores e aplica os modificadores do modo atual.
+
+        Chamado por reset_game_state(), depois de voltar os modificadores
+        ao padrão: toda partida nova (start_game, R no game over) fica no
+        modo escolhido.
+        """
+        self.mode_completed = False
+        self.items_spawned = 0
+        self.items_caught = 0
+        self.mode_start_time = self.game.game_time
+        
+        mode_name = self.current_mode
+        mode_data = GAME_MODES.get(mode_name)
+        if mode_data is None:
+            return  # Modo normal
         
         # Aplica modificadores do modo
         if mode_name == 'candy_rain':
@@ -66,11 +78,11 @@ class GameModeManager:
         if not mode:
             return
             
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.game_time
         
         # Checa condições de vitória/derrota específicas do modo
         if self.current_mode == 'candy_rain':
-            if current_time - self.mode_start_time >= mode['duration']:
+            if not self.mode_completed and current_time - self.mode_start_time >= mode['duration']:
                 self.complete_mode()
                 
         elif self.current_mode == 'precision':
@@ -78,8 +90,11 @@ class GameModeManager:
                 accuracy = self.items_caught / self.items_spawned
                 if accuracy < mode['required_accuracy']:
                     self.game.state = STATE_GAMEOVER
+                    save_writer.request_flush()
                     
     def complete_mode(self):
+        self.mode_completed = True
+        
         # Desbloqueia o próximo modo
         modes = list(GAME_MODES.keys())
         current_index = modes.index(self.current_mode)
@@ -123,17 +138,26 @@ class DailyObjectivesManager:
             'progress': self.progress,
             'last_update': self.last_update.isoformat()
         }
-        with open(OBJECTIVES_FILE, 'w') as f:
-            json.dump(data, f)
+        save_writer.schedule(OBJECTIVES_FILE, data)
             
+    def snapshot(self):
+        """Cópia do estado dos objetivos (guardada nos replays)"""
+        return json.loads(json.dumps({'objectives': self.objectives, 'progress': self.progress}))
+        
+    def restore(self, snapshot):
+        if snapshot:
+            self.objectives = json.loads(json.dumps(snapshot['objectives']))
+            self.progress = dict(snapshot['progress'])
+        self.active_objective = None
+        
     def generate_new_objectives(self):
         self.objectives = []
         available_objectives = list(DAILY_OBJECTIVES.keys())
-        chosen = random.sample(available_objectives, 3)
+        chosen = self.game.rng.objectives.sample(available_objectives, 3)
         
         for obj_type in chosen:
             obj_data = DAILY_OBJECTIVES[obj_type]
-            target = random.randint(obj_data['max'] // 2, obj_data['max'])
+            target = self.game.rng.objectives.randint(obj_data['max'] // 2, obj_data['max'])
             self.objectives.append({
                 'type': obj_type,
                 'target': target,
@@ -168,7 +192,9 @@ class DailyObjectivesManager:
                 self.active_objective = None
             
             # Limita o progresso ao valor máximo do objetivo
-            self.progress[objective_type] = min(value, target)
+            new_progress = min(value, target)
+            changed = self.progress[objective_type] != new_progress
+            self.progress[objective_type] = new_progress
             
             # Verifica se o objetivo foi completado
             for obj in self.objectives:
@@ -176,6 +202,7 @@ class DailyObjectivesManager:
                     not obj['completed'] and 
                     value >= obj['target']):
                     obj['completed'] = True
+                    changed = True
                     self.game.score_manager.add_score(DAILY_OBJECTIVES_REWARD)
                     # Adiciona efeito visual de conclusão
                     self.game.particle_system.emit_particles('sparkle', 
@@ -183,7 +210,9 @@ class DailyObjectivesManager:
                          self.game.screen.get_height()//2))
                     self.game.resource_manager.play_sound('powerup')
                     
-            self.save_objectives()
+            # Só marca o save como sujo quando algo mudou de fato
+            if changed:
+                self.save_objectives()
             
             # Verifica conquista de objetivos diários
             completed = sum(1 for obj in self.objectives if obj['completed'])
@@ -202,9 +231,9 @@ class DailyObjectivesManager:
         screen.blit(overlay, (0, 0))
         
         # Título
-        fonts = self.game.resource_manager.fonts
+        resources = self.game.resource_manager
         title = "✨ Objetivos Diários ✨"
-        title_surf = fonts[48].render(title, True, (255, 215, 0))  # GOLD
+        title_surf = resources.render_text(48, title, (255, 215, 0))  # GOLD
         title_x = (screen.get_width() - title_surf.get_width()) // 2
         screen.blit(title_surf, (title_x, 50))
         
@@ -214,7 +243,7 @@ class DailyObjectivesManager:
             # Nome do objetivo
             obj_data = DAILY_OBJECTIVES[obj['type']]
             name_text = obj_data['name']
-            name_surf = fonts[32].render(name_text, True, (255, 255, 255))  # WHITE
+            name_surf = resources.render_text(32, name_text, (255, 255, 255))  # WHITE
             screen.blit(name_surf, (screen.get_width()//4, y))
             
             # Descrição e progresso
@@ -230,8 +259,8 @@ class DailyObjectivesManager:
                 color = (255, 255, 255)  # WHITE
                 status = f"{int(progress/obj['target']*100)}%"
             
-            desc_surf = fonts[24].render(desc, True, color)
-            status_surf = fonts[24].render(status, True, color)
+            desc_surf = resources.render_text(24, desc, color)
+            status_surf = resources.render_text(24, status, color)
             
             screen.blit(desc_surf, (screen.get_width()//4, y + 40))
             screen.blit(status_surf, (screen.get_width()*3//4, y + 40))
@@ -260,6 +289,6 @@ class DailyObjectivesManager:
             
         # Instrução para voltar
         back = "Pressione ESC para voltar"
-        back_surf = fonts[24].render(back, True, (255, 255, 255))
+        back_surf = resources.render_text(24, back, (255, 255, 255))
         x = (screen.get_width() - back_surf.get_width()) // 2
         screen.blit(back_surf, (x, screen.get_height() - 50))
\ No newline at end of file
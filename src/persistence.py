@@ -0,0 +1,95 @@
+"""
+Persistência write-behind dos arquivos de save
+"""
+import atexit
+import json
+import os
+import threading
+from .constants import SAVE_FLUSH_INTERVAL
+
+class SaveWriter:
+    """Agrupa as escritas dos arquivos JSON e grava em uma thread de fundo.
+
+    `schedule` só guarda um snapshot serializado e marca o arquivo como sujo;
+    várias chamadas seguidas para o mesmo arquivo viram uma única escrita.
+    A gravação é atômica (arquivo temporário + rename).
+    """
+    def __init__(self, interval=SAVE_FLUSH_INTERVAL):
+        self.interval = interval
+        self.enabled = True
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.writes = 0
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+            self.thread.start()
+
+    def schedule(self, path, data):
+        if not self.enabled:
+            return
+        snapshot = json.dumps(data)
+        with self.lock:
+            self.pending[path] = snapshot
+        self.start()
+
+    def schedule_bytes(self, path, payload):
+        """Como `schedule`, mas para arquivos binários (ex.: replays)"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.pending[path] = bytes(payload)
+        self.start()
+
+    def schedule_delete(self, path):
+        """Apaga o arquivo na próxima gravação (e descarta escritas pendentes dele)"""
+        if not self.enabled:
+            return
+        with self.lock:
+            self.pending[path] = None
+        self.start()
+        
+    def request_flush(self):
+        """Pede para a thread de fundo gravar o quanto antes, sem bloquear"""
+        self.wake.set()
+
+    def flush(self):
+        """Grava imediatamente tudo o que estiver pendente"""
+        # write_lock primeiro: se a thread de fundo estiver no meio de uma
+        # gravação, espera ela terminar antes de retornar
+        with self.write_lock:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+            for path, snapshot in pending.items():
+                try:
+                    if snapshot is None:
+                        if os.path.exists(path):
+                            os.remove(path)
+                        continue
+                    write_atomic(path, snapshot)
+                    self.writes += 1
+                except OSError as e:
+                    print(f"Não foi possível salvar {path}: {e}")
+
+    def _run(self):
+        while True:
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            self.flush()
+
+def write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# Instância compartilhada por todos os gerenciadores
+save_writer = SaveWriter()
+atexit.register(save_writer.flush)
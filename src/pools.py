@@ -0,0 +1,44 @@
+"""
+Pools de objetos de vida curta (itens, power-ups, popups)
+"""
+from .constants import POOL_MAX_FREE
+
+class Pool:
+    """Reaproveita instâncias em vez de criar novas a cada spawn.
+
+    acquire() devolve um objeto livre reiniciado com obj.reset(*args) (ou
+    um novo, criado com factory(*args)); release() devolve o objeto ao
+    pool. Quem libera garante que ninguém mais usa o objeto.
+    """
+    def __init__(self, factory, max_free=POOL_MAX_FREE):
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.in_use = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        self.in_use += 1
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, obj):
+        self.in_use = max(0, self.in_use - 1)
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def stats(self):
+        total = self.created + self.reused
+        return {
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'created': self.created,
+            'reused': self.reused,
+            'reuse_rate': self.reused / total if total else 0.0
+        }
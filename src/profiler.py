@@ -0,0 +1,206 @@
+"""
+Profiler de quadros: tempo por subsistema e overlay com percentis
+"""
+import csv
+import gc
+import json
+import time
+import pygame
+from collections import deque
+from .constants import (
+    FPS, WHITE, GOLD, PINK, PROFILER_HISTORY, PROFILER_REFRESH,
+    PROFILER_GRAPH_SIZE
+)
+
+# Seções medidas, na ordem em que aparecem no overlay e no trace
+SECTIONS = (
+    'events',
+    'update.spawn', 'update.items', 'update.collisions', 'update.effects',
+    'draw.background', 'draw.sprites', 'draw.hud', 'draw.particles', 'draw.flip',
+    'gc'
+)
+
+class Section:
+    """Cronômetro reutilizável de uma seção (use com `with`)"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler.enabled:
+            self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+class FrameProfiler:
+    """Mede o tempo de cada fase do quadro em janelas móveis.
+
+    As seções acumulam durante o quadro (um quadro pode rodar vários
+    ticks) e end_frame() fecha a amostra. Desligado, cada seção custa só
+    o teste de `enabled`. O callback do GC só fica registrado enquanto
+    o profiler está ligado.
+    """
+    def __init__(self, history=PROFILER_HISTORY, fps=FPS):
+        self.enabled = False
+        self.enabling = False  # Ligado por toggle(); passa a valer no próximo begin_frame
+        self.history = history
+        self.fps = fps  # Taxa de quadros pedida (linha do orçamento no gráfico)
+        self.frames = deque(maxlen=history)
+        self.samples = {name: deque(maxlen=history) for name in SECTIONS}
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.sections = {name: Section(self, name) for name in SECTIONS}
+        self.frame_start = 0.0
+        self.frame_count = 0
+        self.trace = None  # Lista de linhas quando a exportação está ligada
+        self.startup = {}  # Marcos da inicialização (ms), incluídos no export JSON
+        self.panel = None
+        self.gc_start = 0.0
+
+    def section(self, name):
+        return self.sections[name]
+
+    def add(self, name, seconds):
+        self.current[name] += seconds * 1000
+
+    def on_gc(self, phase, info):
+        # Pausas do coletor de lixo também contam como subsistema
+        if not self.enabled:
+            return
+        if phase == 'start':
+            self.gc_start = time.perf_counter()
+        else:
+            self.add('gc', time.perf_counter() - self.gc_start)
+
+    def enable(self):
+        if self.on_gc not in gc.callbacks:
+            gc.callbacks.append(self.on_gc)
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = self.enabling = False
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+
+    def close(self):
+        self.disable()
+
+    def toggle(self):
+        # Ligar no meio do quadro (F3 é tratado dentro da seção 'events')
+        # deixaria seções e o quadro sem início; espera o próximo begin_frame
+        if self.enabled or self.enabling:
+            self.disable()
+        else:
+            self.enabling = True
+        self.panel = None
+
+    def start_trace(self):
+        self.trace = []
+
+    def begin_frame(self):
+        if self.enabling:
+            self.enabling = False
+            self.enable()
+            self.current = dict.fromkeys(SECTIONS, 0.0)
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.frames.append(frame_ms)
+        for name, value in self.current.items():
+            self.samples[name].append(value)
+        if self.trace is not None:
+            row = {'frame': self.frame_count, 'frame_ms': round(frame_ms, 4)}
+            row.update((name, round(value, 4)) for name, value in self.current.items())
+            self.trace.append(row)
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.frame_count += 1
+
+    def stats(self):
+        """Percentis do tempo de quadro e o p95 de cada seção (ms)"""
+        frames = sorted(self.frames)
+        sections = {name: percentile(sorted(values), 0.95) for name, values in self.samples.items()}
+        slowest = max(sections, key=sections.get) if frames else None
+        return {
+            'frames': len(frames),
+            'p50': percentile(frames, 0.50),
+            'p95': percentile(frames, 0.95),
+            'p99': percentile(frames, 0.99),
+            'sections_p95': sections,
+            'slowest': slowest
+        }
+
+    def draw(self, surface, fonts):
+        """Desenha o overlay; o texto só é refeito a cada PROFILER_REFRESH quadros"""
+        if self.panel is None or self.frame_count % PROFILER_REFRESH == 0:
+            self.panel = self.build_panel(fonts[16])
+        width, height = PROFILER_GRAPH_SIZE
+        x, y = 10, 60  # Abaixo do score, sem cobrir o HUD
+        surface.blit(self.panel, (x, y + height + 4))
+
+        # Gráfico do tempo de cada quadro, com a linha do orçamento (1/fps)
+        graph = pygame.Surface((width, height), pygame.SRCALPHA)
+        graph.fill((0, 0, 0, 160))
+        budget = 1000 / self.fps if self.fps else 1000 / 60
+        scale = height / (budget * 2)
+        if len(self.frames) > 1:
+            step = width / (self.history - 1)
+            points = [(i * step, height - min(height, ms * scale)) for i, ms in enumerate(self.frames)]
+            pygame.draw.lines(graph, GOLD, False, points)
+        budget_y = height - budget * scale
+        pygame.draw.line(graph, PINK, (0, budget_y), (width, budget_y))
+        surface.blit(graph, (x, y))
+
+    def build_panel(self, font):
+        stats = self.stats()
+        # Linhas como (rótulo, valor); o valor fica alinhado à direita
+        lines = [(f"p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}", "ms")]
+        if stats['slowest']:
+            slowest = stats['slowest']
+            lines.append((f"mais lento: {slowest}", f"{stats['sections_p95'][slowest]:.2f}"))
+        lines.extend((name, f"{stats['sections_p95'][name]:.2f}") for name in SECTIONS)
+
+        line_height = font.get_linesize()
+        width = PROFILER_GRAPH_SIZE[0]
+        panel = pygame.Surface((width, line_height * len(lines) + 6), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, (label, value) in enumerate(lines):
+            color = GOLD if i < 2 else WHITE
+            y = 3 + i * line_height
+            panel.blit(font.render(label, True, color), (4, y))
+            value_surf = font.render(value, True, color)
+            panel.blit(value_surf, (width - value_surf.get_width() - 4, y))
+        return panel
+
+    def export(self, path):
+        """Salva o trace da sessão em CSV ou JSON (pela extensão)"""
+        if not self.trace:
+            return False
+        try:
+            if path.endswith('.csv'):
+                with open(path, 'w', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=list(self.trace[0].keys()))
+                    writer.writeheader()
+                    writer.writerows(self.trace)
+            else:
+                with open(path, 'w') as f:
+                    json.dump({'summary': self.stats(), 'startup': self.startup, 'frames': self.trace}, f)
+            return True
+        except:
+            print(f"Não foi possível exportar o trace do profiler: {path}")
+            return False
@@ -0,0 +1,283 @@
+"""
+Caches de renderização (superfícies pré-transformadas)
+"""
+import pygame
+from collections import OrderedDict
+from .constants import (
+    ROTATION_STEP, ROTATION_CACHE_MAX, PARTICLE_MAX_RADIUS,
+    PARTICLE_ALPHA_LEVELS, PARTICLE_MAX_SHEETS, PARTICLE_ICON_SCALE,
+    TEXT_CACHE_MAX, TEXT_SHADOW_OFFSET, TEXT_ALPHA_STEPS, PLAYER_SCALE_MIN, PLAYER_SCALE_MAX,
+    PLAYER_SCALE_STEPS, PLAYER_MAX_TILT, PLAYER_TILT_STEP, PLAYER_SHEET_MAX_MB,
+    POPUP_FONT_SIZE, POPUP_SCALE_MAX, POPUP_SCALE_STEPS, POPUP_CACHE_MAX
+)
+
+class RotationCache:
+    """Guarda variantes rotacionadas de cada imagem em ângulos quantizados.
+
+    Cada entrada é um par (superfície, offset) onde o offset é o canto
+    superior esquerdo relativo ao centro, então recentralizar é só somar.
+    """
+    def __init__(self, step=ROTATION_STEP, max_entries=ROTATION_CACHE_MAX):
+        self.step = step
+        self.steps = 360 // step
+        self.max_entries = max_entries
+        self.entries = {}
+        self.count = 0
+
+    def warm(self, images):
+        """Pré-calcula todas as variantes das imagens (respeitando o limite)"""
+        for image in images:
+            for index in range(self.steps):
+                self.get(image, index * self.step)
+
+    def get(self, image, angle):
+        index = int(round(angle / self.step)) % self.steps
+        variants = self.entries.get(image)
+        if variants is None:
+            variants = [None] * self.steps
+            if self.count < self.max_entries:
+                self.entries[image] = variants
+
+        entry = variants[index]
+        if entry is None:
+            rotated = pygame.transform.rotate(image, index * self.step)
+            entry = (rotated, (-(rotated.get_width() // 2), -(rotated.get_height() // 2)))
+            # Acima do limite, a variante é calculada mas não fica guardada
+            if image in self.entries and self.count < self.max_entries:
+                variants[index] = entry
+                self.count += 1
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+        self.count = 0
+
+class PlayerSheet:
+    """Variantes do jogador por (passo de escala, passo de inclinação).
+
+    A respiração e a inclinação viram um índice na folha: cada variante é
+    calculada uma vez (smoothscale e depois rotate, então as duas animações
+    aparecem juntas) e guardada enquanto couber em `max_mb`. Acima do
+    limite, a variante é calculada mas não fica guardada.
+    """
+    def __init__(self, image, scale_min=PLAYER_SCALE_MIN, scale_max=PLAYER_SCALE_MAX,
+                 scale_steps=PLAYER_SCALE_STEPS, max_tilt=PLAYER_MAX_TILT,
+                 tilt_step=PLAYER_TILT_STEP, max_mb=PLAYER_SHEET_MAX_MB):
+        self.image = image
+        self.scale_min = scale_min
+        self.scale_max = scale_max
+        self.scale_steps = scale_steps
+        self.max_tilt = max_tilt
+        self.tilt_step = tilt_step
+        self.tilt_steps = int(2 * max_tilt / tilt_step) + 1
+        self.max_bytes = max_mb * 1024 * 1024
+        self.bytes = 0
+        self.variants = {}
+
+    def index(self, scale, angle):
+        s = round((scale - self.scale_min) / (self.scale_max - self.scale_min) * (self.scale_steps - 1))
+        t = round((angle + self.max_tilt) / self.tilt_step)
+        return min(max(s, 0), self.scale_steps - 1), min(max(t, 0), self.tilt_steps - 1)
+
+    def get(self, scale, angle):
+        return self.variant(self.index(scale, angle))
+
+    def variant(self, key):
+        variant = self.variants.get(key)
+        if variant is None:
+            variant = self.build(*key)
+            size = variant.get_pitch() * variant.get_height()
+            if self.bytes + size <= self.max_bytes:
+                self.variants[key] = variant
+                self.bytes += size
+        return variant
+
+    def build(self, s, t):
+        scale = self.scale_min + (self.scale_max - self.scale_min) * s / (self.scale_steps - 1)
+        angle = t * self.tilt_step - self.max_tilt
+        width, height = self.image.get_size()
+        image = pygame.transform.smoothscale(self.image, (int(width * scale), int(height * scale)))
+        return pygame.transform.rotate(image, angle) if angle else image
+
+    def warm(self):
+        """Pré-calcula a folha inteira (respeitando o limite)"""
+        for s in range(self.scale_steps):
+            for t in range(self.tilt_steps):
+                self.variant((s, t))
+
+class PopupRenderer:
+    """Números flutuantes ("+10") renderizados uma vez por (pontos, cor).
+
+    Cada par guarda algumas escalas já redimensionadas, de 1.0 até
+    `scale_max`; o popup usa a mais próxima. O fade é alpha por superfície
+    (set_alpha logo antes do blit), então desenhar um popup é um blit, sem
+    font.render, smoothscale nem superfícies novas.
+    """
+    def __init__(self, text_cache, size=POPUP_FONT_SIZE, scale_max=POPUP_SCALE_MAX,
+                 scale_steps=POPUP_SCALE_STEPS, max_entries=POPUP_CACHE_MAX):
+        self.text_cache = text_cache
+        self.size = size
+        self.scale_max = scale_max
+        self.scale_steps = scale_steps
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # (pontos, cor) -> superfícies por escala
+
+    def variants(self, points, color):
+        key = (points, tuple(color))
+        variants = self.entries.get(key)
+        if variants is None:
+            text = self.text_cache.render(self.size, f"+{points}", color)
+            width, height = text.get_size()
+            variants = []
+            for step in range(self.scale_steps):
+                scale = 1.0 + (self.scale_max - 1.0) * step / max(1, self.scale_steps - 1)
+                variants.append(pygame.transform.smoothscale(text, (int(width * scale), int(height * scale))))
+            self.entries[key] = variants
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return variants
+
+    def draw(self, surface, points, color, scale, alpha, center):
+        variants = self.variants(points, color)
+        step = round((scale - 1.0) / (self.scale_max - 1.0) * (len(variants) - 1)) if self.scale_max > 1 else 0
+        image = variants[min(max(step, 0), len(variants) - 1)]
+        image.set_alpha(alpha)
+        rect = image.get_rect(center=center)
+        surface.blit(image, rect)
+        return rect
+
+class ParticleAtlas:
+    """Carimbos pré-renderizados de partículas.
+
+    Cada folha (sheet) guarda, para um círculo de uma cor ou para um ícone,
+    uma superfície por raio quantizado e por nível de alpha, com o alpha já
+    aplicado. Desenhar uma partícula vira só um blit, sem alocar superfícies
+    nem mexer no alpha das imagens compartilhadas.
+    """
+    def __init__(self, images=None, max_radius=PARTICLE_MAX_RADIUS,
+                 alpha_levels=PARTICLE_ALPHA_LEVELS, max_sheets=PARTICLE_MAX_SHEETS):
+        self.images = images if images is not None else {}
+        self.max_radius = max_radius
+        self.alpha_levels = alpha_levels
+        self.max_sheets = max_sheets
+        self.sheets = OrderedDict()
+
+    @staticmethod
+    def quantize_color(color):
+        # Agrupa cores próximas (ex.: cores rainbow) na mesma folha
+        return tuple(min(255, (int(c) + 16) // 32 * 32) for c in color[:3])
+
+    def get_sheet(self, key):
+        """Retorna (superfícies[raio][alpha], metade do tamanho por raio)"""
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            kind, value = key
+            if kind == 'icon' and self.images.get(value) is None:
+                # Ícone ainda não carregado: usa o círculo branco sem guardar
+                # na chave do ícone, para montar a folha real quando chegar
+                return self.get_sheet(('circle', (255, 255, 255)))
+            sheet = self.build_icon(value) if kind == 'icon' else self.build_circle(value)
+            self.sheets[key] = sheet
+            if len(self.sheets) > self.max_sheets:
+                self.sheets.popitem(last=False)
+        else:
+            self.sheets.move_to_end(key)
+        return sheet
+
+    def alpha_values(self):
+        return [int(255 * (level + 1) / self.alpha_levels) for level in range(self.alpha_levels)]
+
+    def build_circle(self, color):
+        stamps, halves = [], []
+        for radius in range(1, self.max_radius + 1):
+            row = []
+            for alpha in self.alpha_values():
+                s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(s, (*color, alpha), (radius, radius), radius)
+                row.append(s.convert_alpha())
+            stamps.append(row)
+            halves.append(radius)
+        return stamps, halves
+
+    def build_icon(self, name):
+        image = self.images[name]
+        stamps, halves = [], []
+        for radius in range(1, self.max_radius + 1):
+            half = radius * PARTICLE_ICON_SCALE
+            base = pygame.transform.smoothscale(image, (half * 2, half * 2)).convert_alpha()
+            row = []
+            for alpha in self.alpha_values():
+                s = base.copy()
+                s.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                row.append(s)
+            stamps.append(row)
+            halves.append(half)
+        return stamps, halves
+
+    def warm(self, colors, icons=()):
+        for color in colors:
+            self.get_sheet(('circle', self.quantize_color(color)))
+        for name in icons:
+            self.get_sheet(('icon', name))
+
+class TextCache:
+    """Cache LRU de textos renderizados.
+
+    A chave é (tamanho da fonte, texto, cor, cor da sombra, alpha). Com
+    sombra, a superfície já vem composta com a sombra deslocada em
+    TEXT_SHADOW_OFFSET. As superfícies são compartilhadas e não devem ser
+    alteradas: para um texto com fade, peça com `alpha` (quantizado em
+    TEXT_ALPHA_STEPS níveis, cada nível é uma cópia guardada no cache).
+    """
+    def __init__(self, fonts, max_entries=TEXT_CACHE_MAX):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, size, text, color, shadow=None, alpha=None):
+        if alpha is not None and alpha >= 255:
+            alpha = None
+        if alpha is not None:
+            alpha = 255 * (max(0, int(alpha)) * TEXT_ALPHA_STEPS // 255) // TEXT_ALPHA_STEPS
+        key = (size, text, tuple(color), tuple(shadow) if shadow else None, alpha)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        if alpha is not None:
+            # Cópia do texto opaco, com alpha por superfície
+            surf = self.render(size, text, color, shadow).copy()
+            surf.set_alpha(alpha)
+            return self.store(key, surf)
+        font = self.fonts[size]
+        surf = font.render(text, True, color)
+        if shadow:
+            offset = TEXT_SHADOW_OFFSET
+            shadow_surf = font.render(text, True, shadow)
+            composed = pygame.Surface((surf.get_width() + offset, surf.get_height() + offset), pygame.SRCALPHA)
+            composed.blit(shadow_surf, (offset, offset))
+            composed.blit(surf, (0, 0))
+            surf = composed
+        return self.store(key, surf)
+
+    def store(self, key, surf):
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
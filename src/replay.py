@@ -0,0 +1,177 @@
+"""
+Gravação e reprodução de replays (entrada por tick + semente)
+"""
+import json
+import struct
+from .constants import TICK_RATE
+from .persistence import save_writer
+
+REPLAY_MAGIC = b'KCRP'
+REPLAY_VERSION = 2  # Muda quando a simulação muda (replays antigos deixam de bater)
+# magic, versão, tick rate, semente, score final, número de ticks
+HEADER = struct.Struct('<4sBHQqI')
+
+class Replay:
+    """Uma partida gravada: tudo o que é preciso para re-simulá-la.
+
+    No arquivo, a entrada (dx de cada tick, -1/0/1) é guardada como uma
+    sequência run-length (valor + tamanho da sequência em varint), então
+    segurar uma tecla por muitos segundos custa só alguns bytes.
+    """
+    def __init__(self, seed, mode='normal', character='player', tick_rate=TICK_RATE,
+                 objectives=None, runs=None, score=0):
+        self.seed = seed
+        self.mode = mode
+        self.character = character
+        self.tick_rate = tick_rate
+        self.objectives = objectives or {}
+        self.runs = runs if runs is not None else []  # [[dx, quantidade], ...]
+        self.score = score
+
+    @property
+    def ticks(self):
+        return sum(count for _, count in self.runs)
+
+    def append(self, dx):
+        if self.runs and self.runs[-1][0] == dx:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([dx, 1])
+
+    def moves(self):
+        for dx, count in self.runs:
+            for _ in range(count):
+                yield dx
+
+    def to_bytes(self):
+        out = bytearray(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.tick_rate,
+                                    self.seed, self.score, self.ticks))
+        for text in (self.mode, self.character, json.dumps(self.objectives, separators=(',', ':'))):
+            data = text.encode('utf-8')
+            write_varint(out, len(data))
+            out += data
+        for dx, count in self.runs:
+            out.append(dx + 1)
+            write_varint(out, count)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            return cls.parse(data)
+        except (IndexError, struct.error):
+            raise ValueError("Replay truncado")
+
+    @classmethod
+    def parse(cls, data):
+        magic, version, tick_rate, seed, score, ticks = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Arquivo de replay inválido")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Replay da versão {version}, esta versão do jogo lê a {REPLAY_VERSION}")
+        offset = HEADER.size
+        texts = []
+        for _ in range(3):
+            length, offset = read_varint(data, offset)
+            texts.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        runs = []
+        while offset < len(data):
+            dx = data[offset] - 1
+            count, offset = read_varint(data, offset + 1)
+            runs.append([dx, count])
+        replay = cls(seed, texts[0], texts[1], tick_rate, json.loads(texts[2]), runs, score)
+        if replay.ticks != ticks:
+            raise ValueError("Replay truncado")
+        return replay
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+class ReplayInput:
+    """Fonte de entrada que devolve os dx gravados, um por tick"""
+    def __init__(self, replay):
+        self.replay = replay
+        self.moves = replay.moves()
+        self.total = replay.ticks
+        self.index = 0
+
+    @property
+    def done(self):
+        return self.index >= self.total
+
+    def __call__(self, game):
+        self.index += 1
+        return next(self.moves, 0)
+
+def write_varint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def read_varint(data, offset):
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+def start_replay(game, replay):
+    """Prepara o jogo para reproduzir o replay a partir do primeiro tick"""
+    if replay.tick_rate != game.tick_rate:
+        raise ValueError(f"Replay gravado a {replay.tick_rate} ticks/s, jogo a {game.tick_rate}")
+    # O que o replay troca volta ao normal em stop_replay
+    if game.replay_state is None:
+        game.replay_state = {
+            'fixed_seed': game.rng.fixed_seed,
+            'objectives': game.daily_objectives_manager.snapshot(),
+            'character': game.resource_manager.selected_character,
+            'mode': game.game_mode_manager.current_mode,
+            'saves': save_writer.enabled
+        }
+    game.rng.fixed_seed = replay.seed
+    game.daily_objectives_manager.restore(replay.objectives)
+    game.resource_manager.selected_character = replay.character
+    if replay.mode != 'normal':
+        game.game_mode_manager.start_mode(replay.mode)
+    else:
+        game.game_mode_manager.current_mode = 'normal'
+    game.start_game(record=False)
+    game.replay_input = ReplayInput(replay)
+
+def stop_replay(game):
+    """Devolve a semente, os objetivos, o personagem, o modo e os saves de antes do replay"""
+    game.replay_input = None
+    state = game.replay_state
+    if state is None:
+        return
+    game.replay_state = None
+    game.rng.fixed_seed = state['fixed_seed']
+    game.daily_objectives_manager.restore(state['objectives'])
+    game.resource_manager.selected_character = state['character']
+    game.game_mode_manager.current_mode = state['mode']
+    save_writer.enabled = state['saves']
+
+def verify_replay(game, replay):
+    """Re-simula o replay sem desenhar; retorna (confere, score obtido)"""
+    start_replay(game, replay)
+    while game.state == 'game' and not game.replay_input.done:
+        game.update_game()
+        game.update_effects()
+    stop_replay(game)
+    score = game.score_manager.current_score
+    return score == replay.score, score
@@ -0,0 +1,56 @@
+"""
+Fluxos de números aleatórios nomeados e reproduzíveis
+"""
+import argparse
+import random
+import numpy as np
+
+SEED_LIMIT = 2 ** 64  # A semente vai como inteiro sem sinal de 64 bits no replay
+
+def new_seed():
+    return random.SystemRandom().randrange(2 ** 63)
+
+def seed_arg(text):
+    """Tipo do --seed na linha de comando: inteiro de 0 a 2**64 - 1"""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"semente inválida: {text}")
+    if not 0 <= seed < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"a semente deve estar entre 0 e {SEED_LIMIT - 1}")
+    return seed
+
+class RandomStreams:
+    """Um gerador independente para cada finalidade.
+
+    - spawns: itens que caem (tipo, posição, velocidade)
+    - powerups: sorteio e tipo dos power-ups
+    - effects: partículas e animações puramente visuais
+    - objectives: sorteio dos objetivos diários
+
+    Como os fluxos são separados, um efeito visual a mais nunca muda a
+    sequência de spawns: a mesma semente com as mesmas entradas gera
+    exatamente a mesma partida.
+    """
+    GAMEPLAY_STREAMS = ('spawns', 'powerups', 'effects')
+
+    def __init__(self, seed=None):
+        self.fixed_seed = seed
+        self.seed = seed if seed is not None else new_seed()
+        self.objectives = random.Random(f"{self.seed}:objectives")
+        self.seed_gameplay(self.seed)
+
+    def seed_gameplay(self, seed):
+        self.seed = seed
+        for name in self.GAMEPLAY_STREAMS:
+            setattr(self, name, random.Random(f"{seed}:{name}"))
+        # Versão NumPy do fluxo de efeitos (rajadas de partículas vetorizadas)
+        self.effects_np = np.random.default_rng(self.effects.getrandbits(64))
+
+    def seed_objectives(self, seed):
+        self.objectives = random.Random(f"{seed}:objectives")
+
+    def new_session(self):
+        """Ressemeia os fluxos da partida: a semente fixa, se houver, ou uma nova"""
+        self.seed_gameplay(self.fixed_seed if self.fixed_seed is not None else new_seed())
+        return self.seed
@@ -2,7 +2,6 @@
 Classes dos sprites do jogo
 """
 import pygame
-import random
 import math
 from .constants import *
 from .effects import ParticleSystem
@@ -17,12 +16,16 @@ class Player(pygame.sprite.Sprite):
         if char_data and self.game.score_manager.highest_score >= char_data['score']:
             char_data['unlocked'] = True
             
-        # Usa o personagem selecionado
-        self.image = game.resource_manager.images[game.resource_manager.selected_character]
+        # Usa o personagem selecionado; as variantes animadas vêm da folha
+        self.original_image = game.resource_manager.images[game.resource_manager.selected_character]
+        self.sheet = game.resource_manager.player_sheet(game.resource_manager.selected_character)
+        self.image = self.original_image
             
         self.rect = self.image.get_rect()
         self.rect.centerx = WIDTH // 2
         self.rect.bottom = HEIGHT - 10
+        self.x = float(self.rect.centerx)
+        self.prev_center = self.rect.center
         
         self.lives = START_LIVES
         self.active_powerups = []
@@ -32,53 +35,53 @@ class Player(pygame.sprite.Sprite):
         self.angle = 0
         self.scale = 1.0
         self.scale_direction = 1
-        self.original_image = self.image
         
-    def update(self):
+    def update(self, dt):
+        step = dt * BASE_FPS
+        
         # Atualiza power-ups
         for powerup in self.active_powerups[:]:
-            powerup.update()
+            powerup.update(dt)
             if powerup.is_expired():
                 if powerup.type == 'shield':
                     self.invulnerable = False
                 self.active_powerups.remove(powerup)
+                self.game.powerup_pool.release(powerup)
                 
         # Animação de "respiração"
-        self.scale += 0.001 * self.scale_direction
-        if self.scale > 1.05:
+        self.scale += 0.001 * self.scale_direction * step
+        if self.scale > PLAYER_SCALE_MAX:
             self.scale_direction = -1
-        elif self.scale < 0.95:
+        elif self.scale < PLAYER_SCALE_MIN:
             self.scale_direction = 1
             
-        # Atualiza imagem com escala
-        scaled_size = (
+        # Imagem com escala e inclinação juntas, já pronta na folha
+        self.image = self.sheet.get(self.scale, self.angle)
+        
+        # A colisão usa o tamanho com escala (sem a inclinação)
+        old_center = self.rect.center
+        self.rect.size = (
             int(self.original_image.get_width() * self.scale),
             int(self.original_image.get_height() * self.scale)
         )
-        self.image = pygame.transform.smoothscale(self.original_image, scaled_size)
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
         self.rect.center = old_center
         
-    def move(self, dx):
+    def move(self, dx, dt):
+        step = dt * BASE_FPS
+        self.prev_center = self.rect.center
+        
         # Movimento com inclinação suave
-        self.rect.x += dx * PLAYER_SPEED
+        self.x += dx * PLAYER_SPEED * step
         
         # Mantém dentro da tela
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > WIDTH:
-            self.rect.right = WIDTH
+        half_width = self.rect.width / 2
+        self.x = min(max(self.x, half_width), WIDTH - half_width)
+        self.rect.centerx = round(self.x)
             
-        # Animação de inclinação
-        target_angle = -15 if dx > 0 else 15 if dx < 0 else 0
-        self.angle = self.angle * 0.8 + target_angle * 0.2
-        
-        # Rotaciona a imagem
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
+        # Animação de inclinação (suavização independente da taxa de ticks)
+        target_angle = -PLAYER_MAX_TILT if dx > 0 else PLAYER_MAX_TILT if dx < 0 else 0
+        smoothing = 0.8 ** step
+        self.angle = self.angle * smoothing + target_angle * (1 - smoothing)
         
     def take_damage(self):
         if not self.invulnerable:
@@ -88,69 +91,89 @@ class Player(pygame.sprite.Sprite):
             
     def add_powerup(self, powerup):
         # Remove power-up do mesmo tipo se existir
+        for p in self.active_powerups:
+            if p.type == powerup.type:
+                self.game.powerup_pool.release(p)
         self.active_powerups = [p for p in self.active_powerups if p.type != powerup.type]
         self.active_powerups.append(powerup)
         
+    def release_powerups(self):
+        """Devolve ao pool os power-ups ainda ativos (fim da partida)"""
+        for powerup in self.active_powerups:
+            self.game.powerup_pool.release(powerup)
+        self.active_powerups = []
+        self.invulnerable = False
+        
     def has_powerup(self, powerup_type):
         return any(p.type == powerup_type for p in self.active_powerups)
         
-    def draw(self, surface):
-        # Desenha o jogador
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, alpha=1.0):
+        # Desenha o jogador interpolado entre os dois últimos ticks
+        center = interpolate(self.prev_center, self.rect.center, alpha)
+        rect = self.image.get_rect(center=center)
+        surface.blit(self.image, rect)
         
         # Efeito de escudo se tiver o power-up
         if self.has_powerup('shield'):
-            pygame.draw.circle(surface, PURPLE, self.rect.center, 
+            pygame.draw.circle(surface, PURPLE, center, 
                              max(self.rect.width, self.rect.height) // 2 + 5, 2)
 
 class Item(pygame.sprite.Sprite):
     def __init__(self, game):
         super().__init__()
+        self.reset(game)
+        
+    def reset(self, game):
+        """(Re)inicia o item no topo da tela; o pool reaproveita a instância"""
         self.game = game
-        self.is_good = random.random() < 0.7
+        rng = game.rng.spawns
+        self.is_good = rng.random() < 0.7
         
         # Escolhe uma imagem aleatória
         images = self.game.resource_manager.images['good' if self.is_good else 'bad']
-        self.original_image = random.choice(images)
+        self.original_image = rng.choice(images)
         self.image = self.original_image
         
         # Posição inicial
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, WIDTH - self.rect.width)
+        self.rect.x = rng.randint(0, WIDTH - self.rect.width)
         self.rect.bottom = 0
         
         # Movimento
         self.speed = (ITEM_SPEED + self.game.level * LEVEL_SPEED_INCREASE * 
-                     (1 + random.random() * 0.4))
+                     (1 + rng.random() * 0.4))
         self.angle = 0
-        self.rotation_speed = random.randint(-3, 3)
+        self.rotation_speed = rng.randint(-3, 3)
         
         # Para movimento suave
-        self.float_offset = random.random() * math.pi * 2
-        self.float_amplitude = random.randint(1, 3)
+        self.float_offset = rng.random() * math.pi * 2
+        self.float_amplitude = rng.randint(1, 3)
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
+        self.prev_center = self.rect.center
+        
+    def update(self, dt):
+        step = dt * BASE_FPS
+        self.prev_center = self.rect.center
         
-    def update(self):
         # Movimento de queda
-        self.y += self.speed
+        self.y += self.speed * step
         
         # Movimento de flutuação
-        self.x += math.sin(self.float_offset) * self.float_amplitude
-        self.float_offset += 0.05
+        self.x += math.sin(self.float_offset) * self.float_amplitude * step
+        self.float_offset += 0.05 * step
         
         # Atualiza posição do retângulo
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
         
-        # Rotação
-        self.angle = (self.angle + self.rotation_speed) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # Rotação (variantes pré-calculadas no cache)
+        self.angle = (self.angle + self.rotation_speed * step) % 360
+        self.image, offset = self.game.resource_manager.rotation_cache.get(self.original_image, self.angle)
         
         # Mantém o centro na mesma posição
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
+        cx, cy = self.rect.center
+        self.rect = self.image.get_rect(topleft=(cx + offset[0], cy + offset[1]))
         
         # Remove se saiu da tela
         if self.rect.top > HEIGHT:
@@ -161,18 +184,28 @@ class Item(pygame.sprite.Sprite):
 class PowerUp(pygame.sprite.Sprite):
     def __init__(self, game):
         super().__init__()
+        self.reset(game)
+        
+    def reset(self, game):
+        """(Re)inicia o power-up no topo da tela; o pool reaproveita a instância"""
         self.game = game
-        self.type = random.choice(['magnet', 'shield', 'multiplier'])
-        self.start_time = pygame.time.get_ticks()
+        self.held = False  # Pego pelo jogador: volta ao pool quando acabar o efeito
+        rng = game.rng.powerups
+        self.type = rng.choice(['magnet', 'shield', 'multiplier', 'slowmo'])
+        self.start_time = game.game_time
         self.duration = POWERUP_DURATION
         if self.type == 'shield':
             self.duration = SHIELD_DURATION
+        elif self.type == 'slowmo':
+            self.duration = SLOWMO_DURATION
             
         # Define a cor baseada no tipo
         if self.type == 'magnet':
             self.color = GOLD
         elif self.type == 'shield':
             self.color = PURPLE
+        elif self.type == 'slowmo':
+            self.color = YELLOW
         else:  # multiplier
             self.color = PINK
             
@@ -183,27 +216,31 @@ class PowerUp(pygame.sprite.Sprite):
             self.image = game.resource_manager.images.get('shield', None)
         elif self.type == 'magnet':
             self.image = game.resource_manager.images.get('ima', None)
+        elif self.type == 'slowmo':
+            self.image = game.resource_manager.images.get('slowmotion', None)
             
         # Se não conseguir carregar a imagem, cria uma forma básica
         if not self.image:
             self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
             pygame.draw.circle(self.image, self.color, (20, 20), 20)
+        self.original_image = self.image
         
         # Configuração da posição
         self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, WIDTH - self.rect.width)
+        self.rect.x = rng.randint(0, WIDTH - self.rect.width)
         self.rect.bottom = 0
         
         # Movimento
         self.speed = ITEM_SPEED * 0.8  # Power-ups caem mais devagar
         self.angle = 0
-        self.rotation_speed = random.randint(-2, 2)
+        self.rotation_speed = rng.randint(-2, 2)
         
         # Para movimento suave
-        self.float_offset = random.random() * math.pi * 2
-        self.float_amplitude = random.randint(1, 3)
+        self.float_offset = rng.random() * math.pi * 2
+        self.float_amplitude = rng.randint(1, 3)
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
+        self.prev_center = self.rect.center
         
         # Configura cor e efeito
         if type == 'magnet':
@@ -213,39 +250,49 @@ class PowerUp(pygame.sprite.Sprite):
         else:  # multiplier
             self.color = PINK
             
-    def update(self):
+    def update(self, dt):
+        step = dt * BASE_FPS
+        self.prev_center = self.rect.center
+        
         # Movimento de queda
-        self.y += self.speed
+        self.y += self.speed * step
         
         # Movimento de flutuação
-        self.x += math.sin(self.float_offset) * self.float_amplitude
-        self.float_offset += 0.05
+        self.x += math.sin(self.float_offset) * self.float_amplitude * step
+        self.float_offset += 0.05 * step
         
         # Atualiza posição do retângulo
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
         
-        # Rotação
-        self.angle = (self.angle + self.rotation_speed) % 360
-        rotated = pygame.transform.rotate(self.image, self.angle)
+        # Rotação (variantes pré-calculadas no cache)
+        self.angle = (self.angle + self.rotation_speed * step) % 360
+        self.image, offset = self.game.resource_manager.rotation_cache.get(self.original_image, self.angle)
         
         # Mantém o centro na mesma posição
-        old_center = self.rect.center
-        self.rect = rotated.get_rect()
-        self.rect.center = old_center
+        cx, cy = self.rect.center
+        self.rect = self.image.get_rect(topleft=(cx + offset[0], cy + offset[1]))
         
         # Remove se saiu da tela
         if self.rect.top > HEIGHT:
             self.kill()
         
     def is_expired(self):
-        return pygame.time.get_ticks() - self.start_time > self.duration
+        return self.game.game_time - self.start_time > self.duration
         
     def get_progress(self):
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = self.game.game_time - self.start_time
         return max(0, 1 - (elapsed / self.duration))
         
     def apply(self, player):
+        # A duração conta a partir de quando o jogador pega o power-up
+        self.start_time = self.game.game_time
+        self.held = True
         player.add_powerup(self)
         if self.type == 'shield':
             player.invulnerable = True
+
+def interpolate(previous, current, alpha):
+    """Posição entre o tick anterior e o atual (alpha em 0..1)"""
+    return (round(previous[0] + (current[0] - previous[0]) * alpha),
+            round(previous[1] + (current[1] - previous[1]) * alpha))
@@ -4,7 +4,7 @@ HUD do jogo
 import pygame
 from ..constants import (
     WIDTH, HEIGHT, PROGRESS_BAR_HEIGHT, POINTS_PER_LEVEL,
-    HEART_SIZE, DARK_PURPLE, PURPLE, WHITE, GOLD
+    HEART_SIZE, DARK_PURPLE, PURPLE, WHITE, GOLD, RAINBOW_TEXT_STEPS
 )
 from ..effects import rainbow_color
 
@@ -26,8 +26,7 @@ class HUD:
                 surface.blit(self.heart_image, (x, y))
         else:
             lives_text = f"💖 x{self.game.player.lives}"
-            lives_surf = self.game.resource_manager.fonts[32].render(lives_text, True, DARK_PURPLE)
-            x = WIDTH - lives_surf.get_width() - 10
+            x = WIDTH - self.game.resource_manager.fonts[32].size(lives_text)[0] - 10
             self.draw_text_with_shadow(surface, lives_text, (x, 10), 32)
             
         # Nível atual
@@ -42,7 +41,7 @@ class HUD:
         if self.game.score_manager.combo > 1:
             combo_text = f"✨ Combo x{self.game.score_manager.combo}!"
             combo_x = (WIDTH - self.game.resource_manager.fonts[32].size(combo_text)[0]) // 2
-            color = rainbow_color(pygame.time.get_ticks() * 0.001)
+            color = rainbow_color(pygame.time.get_ticks() * 0.001, RAINBOW_TEXT_STEPS)
             self.draw_text_with_shadow(surface, combo_text, (combo_x, 80), 32, color)
             
         # Power-ups ativos
@@ -53,12 +52,9 @@ class HUD:
             self.draw_objective_progress(surface)
         
     def draw_text_with_shadow(self, surface, text, pos, size, color=DARK_PURPLE):
-        font = self.game.resource_manager.fonts[size]
-        shadow = font.render(text, True, PURPLE)
-        main = font.render(text, True, color)
-        
-        surface.blit(shadow, (pos[0] + 2, pos[1] + 2))
-        surface.blit(main, pos)
+        # Texto e sombra vêm compostos do cache
+        text_surf = self.game.resource_manager.render_text(size, text, color, shadow=PURPLE)
+        surface.blit(text_surf, pos)
         
     def draw_level_progress(self, surface):
         progress = (self.game.score_manager.current_score % POINTS_PER_LEVEL) / POINTS_PER_LEVEL
@@ -96,12 +92,14 @@ class HUD:
                 icon = self.game.resource_manager.images.get('shield')
             elif powerup.type == 'multiplier':
                 icon = self.game.resource_manager.images.get('coin')
+            elif powerup.type == 'slowmo':
+                icon = self.game.resource_manager.images.get('slowmotion')
                 
             if icon:
                 icon_rect = icon.get_rect(center=(x + 20, y))
                 # Faz o ícone piscar quando estiver próximo do fim (menos de 30% do tempo)
                 if progress < 0.3:
-                    if pygame.time.get_ticks() % 500 < 250:
+                    if self.game.game_time % 500 < 250:
                         surface.blit(icon, icon_rect)
                 else:
                     surface.blit(icon, icon_rect)
@@ -133,7 +131,7 @@ class HUD:
             objective['type'], 0) / objective['target'])
             
         text = self.game.daily_objectives_manager.get_formatted_objective(objective)
-        text_surf = self.game.resource_manager.fonts[24].render(text, True, WHITE)
+        text_surf = self.game.resource_manager.render_text(24, text, WHITE)
         x = (WIDTH - text_surf.get_width()) // 2
         y = HEIGHT - 80
         surface.blit(text_surf, (x, y))
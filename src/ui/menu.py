@@ -3,36 +3,46 @@ Menu principal do jogo
 """
 import pygame
 from ..constants import (
-    WIDTH, HEIGHT, MENU_BG_ALPHA,
-    DARK_PURPLE, PURPLE, WHITE
+    WIDTH, HEIGHT, MENU_BG_ALPHA, BASE_FPS,
+    DARK_PURPLE, PURPLE, WHITE, RAINBOW_TEXT_STEPS
 )
 from ..effects import rainbow_color
 
 class MenuItem:
-    def __init__(self, text, font, callback=None):
+    def __init__(self, text, resources, size, callback=None):
         self.text = text
-        self.font = font
+        self.resources = resources
+        self.size = size
         self.callback = callback
         self.selected = False
         self.hover_offset = 0
         self.color_offset = 0
+        self.rect = None  # Área ocupada no último desenho
+        
+    def update(self, dt, cycle=True):
+        step = dt * BASE_FPS
         
-    def update(self):
         # Animação de hover
         target = 10 if self.selected else 0
-        self.hover_offset += (target - self.hover_offset) * 0.2
-        self.color_offset = (self.color_offset + 0.02) % 1.0
+        self.hover_offset += (target - self.hover_offset) * (1 - 0.8 ** step)
+        # O rainbow do item selecionado para quando o jogador fica parado
+        if cycle:
+            self.color_offset = (self.color_offset + 0.02 * step) % 1.0
+        
+    def is_animating(self):
+        target = 10 if self.selected else 0
+        return abs(target - self.hover_offset) > 0.5
         
     def draw(self, surface, x, y):
-        color = rainbow_color(self.color_offset) if self.selected else DARK_PURPLE
+        color = rainbow_color(self.color_offset, RAINBOW_TEXT_STEPS) if self.selected else DARK_PURPLE
         
         # Sombra
-        shadow = self.font.render(self.text, True, PURPLE)
-        surface.blit(shadow, (x + 2, y + 2))
+        shadow = self.resources.render_text(self.size, self.text, PURPLE)
+        shadow_rect = surface.blit(shadow, (x + 2, y + 2))
         
         # Texto principal
-        text = self.font.render(self.text, True, color)
-        surface.blit(text, (x - self.hover_offset, y))
+        text = self.resources.render_text(self.size, self.text, color)
+        self.rect = surface.blit(text, (x - self.hover_offset, y)).union(shadow_rect)
         
         return y + text.get_height() + 10
 
@@ -42,23 +52,32 @@ class Menu:
         self.items = []
         self.selected = 0
         self.background = None
+        self.title_time = 0.0  # Relógio do rainbow do título (parado sem entrada)
         self.setup_menu()
         
     def setup_menu(self):
-        font = self.game.resource_manager.fonts[40]  # Fonte maior para melhor legibilidade
+        resources = self.game.resource_manager
+        size = 40  # Fonte maior para melhor legibilidade
         self.items = [
-            MenuItem("Jogar", font, lambda: self.game.start_game()),
-            MenuItem("Modos de Jogo", font, lambda: self.game.show_modes()),
-            MenuItem("Objetivos Diários", font, lambda: self.game.show_objectives()),
-            MenuItem("Personagens", font, lambda: self.game.show_characters()),
-            MenuItem("Instruções", font, lambda: self.game.show_instructions()),
-            MenuItem("High Scores", font, lambda: self.game.show_highscores()),
-            MenuItem("Sair", font, lambda: self.game.quit_game())
+            MenuItem("Jogar", resources, size, self.play_normal),
+            MenuItem("Modos de Jogo", resources, size, lambda: self.game.show_modes()),
+            MenuItem("Objetivos Diários", resources, size, lambda: self.game.show_objectives()),
+            MenuItem("Personagens", resources, size, lambda: self.game.show_characters()),
+            MenuItem("Instruções", resources, size, lambda: self.game.show_instructions()),
+            MenuItem("High Scores", resources, size, lambda: self.game.show_highscores()),
+            MenuItem("Sair", resources, size, lambda: self.game.quit_game())
         ]
         
-    def update(self):
+    def play_normal(self):
+        # "Jogar" é sempre o modo normal (mesmo depois de uma partida de outro modo)
+        self.game.game_mode_manager.start_mode('normal')
+        self.game.start_game()
+        
+    def update(self, dt, cycle=True):
+        if cycle:
+            self.title_time += dt
         for item in self.items:
-            item.update()
+            item.update(dt, cycle)
             
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -75,6 +94,10 @@ class Menu:
             item.selected = (i == self.selected)
             
     def draw(self, surface):
+        self.draw_static(surface)
+        self.draw_dynamic(surface)
+        
+    def draw_static(self, surface):
         # Desenha background com efeito de fade
         if self.game.resource_manager.images.get('background'):
             surface.blit(self.game.resource_manager.images['background'], (0, 0))
@@ -85,18 +108,18 @@ class Menu:
         overlay.set_alpha(MENU_BG_ALPHA)
         surface.blit(overlay, (0, 0))
         
+    def draw_dynamic(self, surface):
+        """Título e itens (animados); retorna as áreas desenhadas"""
         # Título com efeito rainbow
         title = "✨ Kuromi Catch ✨"
-        title_color = rainbow_color(pygame.time.get_ticks() * 0.001)
-        title_surf = self.game.resource_manager.fonts[64].render(title, True, title_color)
-        shadow_surf = self.game.resource_manager.fonts[64].render(title, True, DARK_PURPLE)
+        title_color = rainbow_color(self.title_time, RAINBOW_TEXT_STEPS)
+        title_surf = self.game.resource_manager.render_text(64, title, title_color, shadow=DARK_PURPLE)
         
-        title_x = (WIDTH - title_surf.get_width()) // 2
+        title_x = (WIDTH - self.game.resource_manager.fonts[64].size(title)[0]) // 2
         title_y = 100
         
-        # Desenha sombra do título
-        surface.blit(shadow_surf, (title_x + 2, title_y + 2))
-        surface.blit(title_surf, (title_x, title_y))
+        # Título já vem com a sombra
+        rects = [surface.blit(title_surf, (title_x, title_y))]
         
         # Calcula altura total do menu
         total_height = sum([self.game.resource_manager.fonts[32].size(item.text)[1] + 20 for item in self.items])
@@ -106,3 +129,5 @@ class Menu:
         for item in self.items:
             x = (WIDTH - self.game.resource_manager.fonts[32].size(item.text)[0]) // 2
             y = item.draw(surface, x, y)
+            rects.append(item.rect)
+        return rects
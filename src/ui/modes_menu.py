@@ -2,10 +2,9 @@
 Menu de seleção de modos especiais de jogo
 """
 import pygame
-import random
 import math
 from ..constants import (
-    WIDTH, HEIGHT, MENU_BG_ALPHA, GAME_MODES,
+    WIDTH, HEIGHT, MENU_BG_ALPHA, GAME_MODES, BASE_FPS,
     WHITE, GOLD, PURPLE, DARK_PURPLE
 )
 
@@ -66,9 +65,9 @@ class ModesMenu:
                 for _ in range(5):
                     self.particles.append({
                         'pos': (WIDTH * 0.7, HEIGHT * 0.5),
-                        'vel': (random.uniform(-3, -1), random.uniform(-1, 1)),
-                        'lifetime': random.randint(20, 40),
-                        'size': random.randint(2, 4)
+                        'vel': (self.game.rng.effects.uniform(-3, -1), self.game.rng.effects.uniform(-1, 1)),
+                        'lifetime': self.game.rng.effects.randint(20, 40),
+                        'size': self.game.rng.effects.randint(2, 4)
                     })
             elif event.key == pygame.K_RIGHT:
                 self.selected_mode = (self.selected_mode + 1) % len(self.modes_list)
@@ -76,51 +75,54 @@ class ModesMenu:
                 for _ in range(5):
                     self.particles.append({
                         'pos': (WIDTH * 0.3, HEIGHT * 0.5),
-                        'vel': (random.uniform(1, 3), random.uniform(-1, 1)),
-                        'lifetime': random.randint(20, 40),
-                        'size': random.randint(2, 4)
+                        'vel': (self.game.rng.effects.uniform(1, 3), self.game.rng.effects.uniform(-1, 1)),
+                        'lifetime': self.game.rng.effects.randint(20, 40),
+                        'size': self.game.rng.effects.randint(2, 4)
                     })
             elif event.key == pygame.K_RETURN:
                 mode_name = self.modes_list[self.selected_mode]
                 # Efeito de partículas ao selecionar
                 for _ in range(20):
-                    angle = random.uniform(0, math.pi * 2)
-                    speed = random.uniform(2, 5)
+                    angle = self.game.rng.effects.uniform(0, math.pi * 2)
+                    speed = self.game.rng.effects.uniform(2, 5)
                     self.particles.append({
                         'pos': (WIDTH * 0.5, HEIGHT * 0.5),
                         'vel': (math.cos(angle) * speed, math.sin(angle) * speed),
-                        'lifetime': random.randint(30, 60),
-                        'size': random.randint(2, 4)
+                        'lifetime': self.game.rng.effects.randint(30, 60),
+                        'size': self.game.rng.effects.randint(2, 4)
                     })
                 self.game.game_mode_manager.start_mode(mode_name)
                 self.game.start_game()
                 
-    def update(self):
+    def update(self, dt):
+        step = dt * BASE_FPS
+        
         # Atualiza animação
-        self.animation_time += 0.03
+        self.animation_time += 0.03 * step
         
         # Atualiza partículas
+        damping = 0.95 ** step
         for particle in self.particles[:]:
-            particle['lifetime'] -= 1
+            particle['lifetime'] -= step
             if particle['lifetime'] <= 0:
                 self.particles.remove(particle)
             else:
                 particle['pos'] = (
-                    particle['pos'][0] + particle['vel'][0],
-                    particle['pos'][1] + particle['vel'][1]
+                    particle['pos'][0] + particle['vel'][0] * step,
+                    particle['pos'][1] + particle['vel'][1] * step
                 )
                 particle['vel'] = (
-                    particle['vel'][0] * 0.95,
-                    particle['vel'][1] * 0.95
+                    particle['vel'][0] * damping,
+                    particle['vel'][1] * damping
                 )
                 
         # Adiciona novas partículas
-        if random.random() < 0.1:
+        if self.game.rng.effects.random() < 0.1 * step:
             self.particles.append({
-                'pos': (random.randint(0, WIDTH), random.randint(0, HEIGHT)),
-                'vel': (random.uniform(-1, 1), random.uniform(-1, 1)),
-                'lifetime': random.randint(50, 100),
-                'size': random.randint(1, 3)
+                'pos': (self.game.rng.effects.randint(0, WIDTH), self.game.rng.effects.randint(0, HEIGHT)),
+                'vel': (self.game.rng.effects.uniform(-1, 1), self.game.rng.effects.uniform(-1, 1)),
+                'lifetime': self.game.rng.effects.randint(50, 100),
+                'size': self.game.rng.effects.randint(1, 3)
             })
         
     def draw(self, surface):
@@ -137,13 +139,13 @@ class ModesMenu:
             
         # Título principal
         title = "✨ Modos de Jogo ✨"
-        title_surf = self.game.resource_manager.fonts[48].render(title, True, GOLD)
+        title_surf = self.game.resource_manager.render_text(48, title, GOLD)
         title_rect = title_surf.get_rect(center=(WIDTH//2, 60))
         surface.blit(title_surf, title_rect)
         
         # Subtítulo
         subtitle = "Escolha um modo especial para um desafio diferente!"
-        sub_surf = self.game.resource_manager.fonts[24].render(subtitle, True, WHITE)
+        sub_surf = self.game.resource_manager.render_text(24, subtitle, WHITE)
         sub_rect = sub_surf.get_rect(center=(WIDTH//2, 110))
         surface.blit(sub_surf, sub_rect)
         
@@ -182,18 +184,18 @@ class ModesMenu:
             
             # Nome do modo
             name_color = GOLD if is_selected else WHITE
-            name_surf = self.game.resource_manager.fonts[32].render(mode['name'], True, name_color)
+            name_surf = self.game.resource_manager.render_text(32, mode['name'], name_color)
             name_rect = name_surf.get_rect(centerx=x + card_width//2, top=y + 20)
             surface.blit(name_surf, name_rect)
             
             # Descrição curta
-            desc_surf = self.game.resource_manager.fonts[24].render(mode['desc'], True, WHITE)
+            desc_surf = self.game.resource_manager.render_text(24, mode['desc'], WHITE)
             desc_rect = desc_surf.get_rect(centerx=x + card_width//2, top=y + 70)
             surface.blit(desc_surf, desc_rect)
             
             # Indicador de dificuldade
             diff = "⭐" * mode['difficulty']
-            diff_surf = self.game.resource_manager.fonts[24].render(diff, True, GOLD)
+            diff_surf = self.game.resource_manager.render_text(24, diff, GOLD)
             diff_rect = diff_surf.get_rect(centerx=x + card_width//2, top=y + 110)
             surface.blit(diff_surf, diff_rect)
             
@@ -201,7 +203,7 @@ class ModesMenu:
             long_desc = self.wrap_text(mode['long_desc'], 28)
             y_offset = 160
             for line in long_desc:
-                line_surf = self.game.resource_manager.fonts[20].render(line, True, WHITE)
+                line_surf = self.game.resource_manager.render_text(20, line, WHITE)
                 line_rect = line_surf.get_rect(centerx=x + card_width//2, top=y + y_offset)
                 surface.blit(line_surf, line_rect)
                 y_offset += 25
@@ -209,41 +211,39 @@ class ModesMenu:
             # Efeitos/características
             y_offset = 260
             for effect in mode['effects']:
-                effect_surf = self.game.resource_manager.fonts[20].render(f"• {effect}", True, GOLD)
+                effect_surf = self.game.resource_manager.render_text(20, f"• {effect}", GOLD)
                 effect_rect = effect_surf.get_rect(left=x + 20, top=y + y_offset)
                 surface.blit(effect_surf, effect_rect)
                 y_offset += 30
                 
             if is_selected:
                 # Tecla para selecionar
-                key_surf = self.game.resource_manager.fonts[24].render("ENTER para jogar", True, WHITE)
+                key_surf = self.game.resource_manager.render_text(24, "ENTER para jogar", WHITE)
                 key_rect = key_surf.get_rect(centerx=x + card_width//2, bottom=y + card_height - 20)
                 surface.blit(key_surf, key_rect)
                 
         # Dica na parte inferior
         tip_alpha = int(128 + 127 * math.sin(self.animation_time))
         tip = self.tips[int(self.animation_time / 3) % len(self.tips)]
-        tip_surf = self.game.resource_manager.fonts[20].render(tip, True, WHITE)
-        tip_surf.set_alpha(tip_alpha)
+        tip_surf = self.game.resource_manager.render_text(20, tip, WHITE, alpha=tip_alpha)
         tip_rect = tip_surf.get_rect(centerx=WIDTH//2, bottom=HEIGHT - 20)
         surface.blit(tip_surf, tip_rect)
         
         # Teclas de navegação
         nav_text = "← → Navegar entre os modos    ESC Voltar"
-        nav_surf = self.game.resource_manager.fonts[20].render(nav_text, True, WHITE)
+        nav_surf = self.game.resource_manager.render_text(20, nav_text, WHITE)
         nav_rect = nav_surf.get_rect(centerx=WIDTH//2, bottom=HEIGHT - 50)
         surface.blit(nav_surf, nav_rect)
         
         # Instruções com efeito de fade
         alpha = int(128 + 127 * math.sin(self.animation_time))
         instructions = "Use ← → para selecionar e ENTER para jogar"
-        inst_surf = self.game.resource_manager.fonts[24].render(instructions, True, WHITE)
-        inst_surf.set_alpha(alpha)
+        inst_surf = self.game.resource_manager.render_text(24, instructions, WHITE, alpha=alpha)
         inst_rect = inst_surf.get_rect(center=(WIDTH//2, HEIGHT - 50))
         surface.blit(inst_surf, inst_rect)
         
         # Opção para voltar
         back = "ESC para voltar"
-        back_surf = self.game.resource_manager.fonts[20].render(back, True, WHITE)
+        back_surf = self.game.resource_manager.render_text(20, back, WHITE)
         back_rect = back_surf.get_rect(topleft=(20, 20))
         surface.blit(back_surf, back_rect)
@@ -17,15 +17,15 @@ class PauseMenu:
         self.setup_menu()
         
     def setup_menu(self):
-        font = self.game.resource_manager.fonts[32]
+        resources = self.game.resource_manager
         self.normal_items = [
-            MenuItem("Continuar", font, lambda: self.game.unpause()),
-            MenuItem("Menu Principal", font, lambda: self.show_confirm()),
-            MenuItem("Sair", font, lambda: self.game.quit_game())
+            MenuItem("Continuar", resources, 32, lambda: self.game.unpause()),
+            MenuItem("Menu Principal", resources, 32, lambda: self.show_confirm()),
+            MenuItem("Sair", resources, 32, lambda: self.game.quit_game())
         ]
         self.confirm_items = [
-            MenuItem("Sim", font, lambda: self.game.return_to_menu()),
-            MenuItem("Não", font, lambda: self.hide_confirm())
+            MenuItem("Sim", resources, 32, lambda: self.game.return_to_menu()),
+            MenuItem("Não", resources, 32, lambda: self.hide_confirm())
         ]
         self.items = self.normal_items
         
@@ -39,9 +39,9 @@ class PauseMenu:
         self.items = self.normal_items
         self.selected = 1
         
-    def update(self):
+    def update(self, dt, cycle=True):
         for item in self.items:
-            item.update()
+            item.update(dt, cycle)
             
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -70,13 +70,11 @@ class PauseMenu:
         else:
             title = "PAUSE"
             
-        title_surf = self.game.resource_manager.fonts[48].render(title, True, WHITE)
-        shadow_surf = self.game.resource_manager.fonts[48].render(title, True, DARK_PURPLE)
+        title_surf = self.game.resource_manager.render_text(48, title, WHITE, shadow=DARK_PURPLE)
         
-        title_x = (WIDTH - title_surf.get_width()) // 2
+        title_x = (WIDTH - self.game.resource_manager.fonts[48].size(title)[0]) // 2
         title_y = HEIGHT // 4
         
-        surface.blit(shadow_surf, (title_x + 2, title_y + 2))
         surface.blit(title_surf, (title_x, title_y))
         
         # Itens do menu
@@ -5,52 +5,44 @@ import pygame
 import random
 import math
 from .constants import (
-    WIDTH, HEIGHT, WHITE, GOLD, COMBO_COLORS,
+    WIDTH, HEIGHT, WHITE, GOLD, COMBO_COLORS, BASE_FPS,
     SCORE_POPUP_DURATION, PERFECT_FLASH_DURATION,
     COMBO_METER_WIDTH, COMBO_METER_HEIGHT,
-    PERSONAL_BEST_OFFSET
+    PERSONAL_BEST_OFFSET, POPUP_SCALE_MAX
 )
+from .pools import Pool
 
 class ScorePopup:
+    __slots__ = ('x', 'y', 'points', 'color', 'alpha', 'scale', 'dy', 'lifetime')
+    
     def __init__(self, x, y, points, color=WHITE):
+        self.reset(x, y, points, color)
+        
+    def reset(self, x, y, points, color=WHITE):
         self.x = x
         self.y = y
         self.points = points
         self.color = color
         self.alpha = 255
-        self.scale = 1.2
+        self.scale = POPUP_SCALE_MAX
         self.dy = -2
         self.lifetime = SCORE_POPUP_DURATION
         
-    def update(self):
-        self.y += self.dy
+    def update(self, dt):
+        step = dt * BASE_FPS
+        self.y += self.dy * step
         self.alpha = int(255 * (self.lifetime / SCORE_POPUP_DURATION))
-        self.scale = max(1.0, self.scale - 0.01)
-        self.lifetime -= 16  # ~60fps
+        self.scale = max(1.0, self.scale - 0.01 * step)
+        self.lifetime -= dt * 1000
         return self.lifetime > 0
         
-    def draw(self, surface, font):
+    def draw(self, surface, resources):
         if self.alpha <= 0:
             return
             
-        text = f"+{self.points}"
-        text_surf = font.render(text, True, self.color)
-        
-        # Aplica escala
-        scaled_size = (
-            int(text_surf.get_width() * self.scale),
-            int(text_surf.get_height() * self.scale)
-        )
-        text_surf = pygame.transform.smoothscale(text_surf, scaled_size)
-        
-        # Aplica transparência
-        alpha_surf = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
-        alpha_surf.fill((255, 255, 255, self.alpha))
-        text_surf.blit(alpha_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        
-        # Desenha centralizado
-        rect = text_surf.get_rect(center=(self.x, self.y))
-        surface.blit(text_surf, rect)
+        # Texto e escalas vêm prontos; o fade é alpha por superfície
+        resources.popup_renderer.draw(surface, self.points, self.color, self.scale,
+                                      self.alpha, (self.x, self.y))
 
 class ComboMeter:
     def __init__(self, x, y):
@@ -60,9 +52,9 @@ class ComboMeter:
         self.target = 0
         self.color = WHITE
         
-    def update(self, combo):
+    def update(self, combo, dt):
         self.target = combo / 10  # Normaliza para 0-1
-        self.value += (self.target - self.value) * 0.1
+        self.value += (self.target - self.value) * (1 - 0.9 ** (dt * BASE_FPS))
         
         # Atualiza cor baseado no combo
         for threshold, color in sorted(COMBO_COLORS.items()):
@@ -91,6 +83,7 @@ class VisualEffectsManager:
     def __init__(self, game):
         self.game = game
         self.score_popups = []
+        self.popup_pool = Pool(ScorePopup)
         self.combo_meter = ComboMeter(
             (WIDTH - COMBO_METER_WIDTH) // 2,
             HEIGHT - COMBO_METER_HEIGHT - 10
@@ -99,22 +92,28 @@ class VisualEffectsManager:
         self.perfect_count = 0
         
     def add_score_popup(self, x, y, points, color=WHITE):
-        self.score_popups.append(ScorePopup(x, y, points, color))
+        self.score_popups.append(self.popup_pool.acquire(x, y, points, color))
         
     def show_perfect_flash(self):
         self.perfect_flash = PERFECT_FLASH_DURATION
         self.perfect_count += 1
         
-    def update(self):
-        # Atualiza popups de pontuação
-        self.score_popups = [p for p in self.score_popups if p.update()]
+    def update(self, dt):
+        # Atualiza popups de pontuação (os que acabaram voltam ao pool)
+        alive = []
+        for popup in self.score_popups:
+            if popup.update(dt):
+                alive.append(popup)
+            else:
+                self.popup_pool.release(popup)
+        self.score_popups = alive
         
         # Atualiza medidor de combo
-        self.combo_meter.update(self.game.score_manager.combo)
+        self.combo_meter.update(self.game.score_manager.combo, dt)
         
         # Atualiza flash de perfect
         if self.perfect_flash > 0:
-            self.perfect_flash -= 16
+            self.perfect_flash -= dt * 1000
             
     def draw(self, surface):
         # Desenha medidor de combo
@@ -122,14 +121,13 @@ class VisualEffectsManager:
         
         # Desenha popups de pontuação
         for popup in self.score_popups:
-            popup.draw(surface, self.game.resource_manager.fonts[24])
+            popup.draw(surface, self.game.resource_manager)
             
         # Desenha flash de perfect
         if self.perfect_flash > 0:
             alpha = int(255 * (self.perfect_flash / PERFECT_FLASH_DURATION))
             text = "PERFECT!"
-            text_surf = self.game.resource_manager.fonts[48].render(text, True, GOLD)
-            text_surf.set_alpha(alpha)
+            text_surf = self.game.resource_manager.render_text(48, text, GOLD, alpha=alpha)
             rect = text_surf.get_rect(center=(WIDTH//2, HEIGHT//2))
             surface.blit(text_surf, rect)
             
@@ -137,7 +135,7 @@ class VisualEffectsManager:
         if (self.game.score_manager.current_score > 0 and
             self.game.score_manager.current_score > self.game.score_manager.highest_score):
             text = "NEW BEST!"
-            text_surf = self.game.resource_manager.fonts[24].render(text, True, GOLD)
+            text_surf = self.game.resource_manager.render_text(24, text, GOLD)
             rect = text_surf.get_rect(
                 centerx=WIDTH//2,
                 top=PERSONAL_BEST_OFFSET
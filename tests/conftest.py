@@ -0,0 +1,16 @@
+"""
+Configuração comum dos testes: pygame sem janela nem áudio
+"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+@pytest.fixture
+def game():
+    from src.game import Game
+    return Game(headless=True, seed=42)
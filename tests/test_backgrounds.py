@@ -0,0 +1,41 @@
+"""
+Orçamento de memória dos backgrounds: os que saem de uso são liberados
+"""
+import pygame
+from src.backgrounds import BackgroundLibrary, BackgroundFader
+
+SIZE = (64, 64)
+
+class ImmediateLoader:
+    """Carrega na hora, como o AssetLoader sem workers"""
+    def submit(self, group, work, finish):
+        finish(work())
+
+def make_library(count, fit):
+    surface_bytes = pygame.Surface(SIZE, 0, 32).get_pitch() * SIZE[1]
+    return BackgroundLibrary(ImmediateLoader(), [f'bg{i}' for i in range(count)],
+                             decode=lambda name: name,
+                             prepare=lambda decoded: pygame.Surface(SIZE, 0, 32),
+                             budget_mb=fit * surface_bytes / (1024 * 1024))
+
+def test_unpinned_backgrounds_are_evicted_after_transition():
+    library = make_library(4, fit=2)
+    fader = BackgroundFader(library, duration=1.0)
+    # Atual, próximo e o pré-carregado ficam presos, passando do orçamento
+    fader.update(1, 0.5, upcoming=2)
+    assert library.stats()['loaded'] == [0, 1, 2]
+    fader.update(1, 1.0, upcoming=2)
+    assert fader.current == 1
+    # Sem nada pré-carregado, o que sobrou em memória volta ao orçamento
+    fader.update(1, 0.1)
+    assert library.memory() <= library.budget
+    assert library.ready(1)
+
+def test_memory_stays_within_budget_across_levels():
+    library = make_library(6, fit=2)
+    fader = BackgroundFader(library, duration=1.0)
+    for target in range(6):
+        fader.update(target, 2.0)
+        fader.update(target, 0.1)
+        assert fader.current == target
+        assert library.memory() <= library.budget
@@ -0,0 +1,45 @@
+"""
+BandedGroup.colliding deve achar os mesmos sprites que testar todos
+"""
+import random
+import pygame
+from src.collision import BandedGroup
+
+class Falling(pygame.sprite.Sprite):
+    def __init__(self, rect, speed):
+        super().__init__()
+        self.rect = pygame.Rect(rect)
+        self.speed = speed
+
+    def update(self):
+        self.rect.y += self.speed
+
+def brute_force(sprites, rect):
+    return [sprite for sprite in sprites if rect.colliderect(sprite.rect)]
+
+def random_rect(rng):
+    return pygame.Rect(rng.randint(-50, 800), rng.randint(-300, 700),
+                       rng.randint(1, 120), rng.randint(1, 120))
+
+def test_colliding_matches_brute_force():
+    rng = random.Random(1234)
+    sprites = [Falling(random_rect(rng), rng.randint(0, 12)) for _ in range(300)]
+    group = BandedGroup(*sprites, band_height=64)
+    for frame in range(30):
+        for _ in range(20):
+            rect = random_rect(rng)
+            assert group.colliding(rect) == brute_force(sprites, rect)
+        group.update()
+        # Tira e põe sprites para mexer na ordem de entrada e nas faixas
+        if frame % 5 == 4:
+            removed = sprites.pop(rng.randrange(len(sprites)))
+            group.remove(removed)
+            added = Falling(random_rect(rng), rng.randint(0, 12))
+            sprites.append(added)
+            group.add(added)
+
+def test_tall_sprite_above_band_is_found():
+    tall = Falling((0, 0, 10, 500), 0)
+    group = BandedGroup(tall, band_height=32)
+    assert group.colliding(pygame.Rect(0, 480, 10, 10)) == [tall]
+    assert group.colliding(pygame.Rect(0, 500, 10, 10)) == []
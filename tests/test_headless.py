@@ -0,0 +1,15 @@
+from src.headless import run_session, ChaserBot
+
+def session(game, mode='normal', seed=42):
+    result = run_session(game, ChaserBot(), 3000, mode=mode, seed=seed)
+    return result['score'], result['ticks']
+
+def test_same_seed_same_session(game):
+    assert session(game) == session(game)
+
+def test_mode_changes_the_session(game):
+    normal = session(game)
+    assert session(game, 'candy_rain') != normal
+    assert session(game, 'speed_rush') != normal
+    assert game.game_mode_manager.current_mode == 'speed_rush'
+    assert game.speed_multiplier > 1.0
@@ -0,0 +1,37 @@
+from src.pools import Pool
+from src.sprites import PowerUp
+
+class Thing:
+    def __init__(self, value):
+        self.reset(value)
+
+    def reset(self, value):
+        self.value = value
+
+def test_acquire_release_counts():
+    pool = Pool(Thing, max_free=2)
+    a, b, c = pool.acquire(1), pool.acquire(2), pool.acquire(3)
+    assert pool.stats()['in_use'] == 3 and pool.created == 3
+    for obj in (a, b, c):
+        pool.release(obj)
+    assert pool.stats()['in_use'] == 0
+    assert len(pool.free) == 2  # Acima de max_free, o objeto é descartado
+
+    again = pool.acquire(4)
+    assert again in (a, b, c) and again.value == 4
+    assert pool.reused == 1 and pool.stats()['in_use'] == 1
+
+def test_active_powerups_return_to_pool_after_game_over(game):
+    game.start_game()
+    for _ in range(3):
+        powerup = game.powerup_pool.acquire(game)
+        game.powerups.add(powerup)
+        game.handle_powerup_collision(powerup)
+    assert game.player.active_powerups
+    assert game.powerup_pool.stats()['in_use'] > 0
+
+    game.player.lives = 0
+    game.update_game()
+    assert game.state == 'gameover'
+    game.start_game()
+    assert game.powerup_pool.stats()['in_use'] == 0
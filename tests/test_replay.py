@@ -0,0 +1,92 @@
+"""
+Formato dos replays: varint, cabeçalho v2 e ida e volta pelos bytes
+"""
+import pytest
+from src.replay import (Replay, HEADER, REPLAY_MAGIC, REPLAY_VERSION, verify_replay,
+                        write_varint, read_varint)
+from src.rng import SEED_LIMIT
+
+@pytest.mark.parametrize('value', [0, 1, 127, 128, 300, 16383, 16384, 2**32, SEED_LIMIT - 1])
+def test_varint_round_trip(value):
+    out = bytearray(b'x')
+    write_varint(out, value)
+    assert read_varint(bytes(out), 1) == (value, len(out))
+
+def test_varint_sizes():
+    for value, size in ((0, 1), (127, 1), (128, 2), (16383, 2), (16384, 3)):
+        out = bytearray()
+        write_varint(out, value)
+        assert len(out) == size
+
+def make_replay(seed):
+    replay = Replay(seed, mode='candy_rain', character='player2', tick_rate=60,
+                    objectives={'catch_coins': 3, 'nível': 2}, score=123456)
+    for dx in [0] * 500 + [1] * 3 + [-1] * 200 + [0] + [1] * 70000:
+        replay.append(dx)
+    return replay
+
+@pytest.mark.parametrize('seed', [0, 42, 2**63, SEED_LIMIT - 1])
+def test_round_trip(seed):
+    replay = make_replay(seed)
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert loaded.seed == seed
+    assert (loaded.mode, loaded.character, loaded.tick_rate) == ('candy_rain', 'player2', 60)
+    assert loaded.objectives == {'catch_coins': 3, 'nível': 2}
+    assert loaded.score == 123456
+    assert loaded.runs == [[0, 500], [1, 3], [-1, 200], [0, 1], [1, 70000]]
+    assert loaded.ticks == replay.ticks
+    assert list(loaded.moves()) == list(replay.moves())
+
+def test_header_layout():
+    data = make_replay(7).to_bytes()
+    magic, version, tick_rate, seed, score, ticks = HEADER.unpack_from(data)
+    assert (magic, version) == (REPLAY_MAGIC, REPLAY_VERSION) == (b'KCRP', 2)
+    assert (tick_rate, seed, score, ticks) == (60, 7, 123456, 70704)
+
+def test_runs_are_compact():
+    # Cada sequência custa 1 byte de dx + o varint da quantidade
+    replay = Replay(1)
+    for _ in range(100000):
+        replay.append(0)
+    empty = Replay(1).to_bytes()
+    assert len(replay.to_bytes()) - len(empty) == 1 + 3
+
+def test_rejects_other_magic():
+    data = bytearray(make_replay(1).to_bytes())
+    data[:4] = b'XXXX'
+    with pytest.raises(ValueError):
+        Replay.from_bytes(bytes(data))
+
+def test_rejects_other_version():
+    data = bytearray(make_replay(1).to_bytes())
+    data[4] = REPLAY_VERSION - 1
+    with pytest.raises(ValueError, match='versão'):
+        Replay.from_bytes(bytes(data))
+
+def test_rejects_truncated_runs():
+    data = make_replay(1).to_bytes()
+    with pytest.raises(ValueError, match='truncado'):
+        Replay.from_bytes(data[:-3])
+
+def test_rejects_cut_file():
+    data = make_replay(1).to_bytes()
+    for size in (0, HEADER.size - 1, HEADER.size + 2, len(data) - 1):
+        with pytest.raises(ValueError, match='truncado'):
+            Replay.from_bytes(data[:size])
+
+def test_recorded_session_replays_to_same_score(game):
+    from src.game import Game
+    from src.headless import ChaserBot, run_session
+    bot = ChaserBot()
+    replay = Replay(42, 'candy_rain')
+
+    def record(game):
+        if not replay.runs:
+            replay.objectives = game.daily_objectives_manager.snapshot()
+        dx = bot(game)
+        replay.append(dx)
+        return dx
+    result = run_session(game, record, 20000, mode='candy_rain', seed=42)
+    replay.score = result['score']
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert verify_replay(Game(headless=True), loaded) == (True, result['score'])